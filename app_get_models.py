@@ -1,8 +1,10 @@
 from datetime import datetime
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import PlainTextResponse
 from market_research.scraper import Specscraper_s
 from market_research.scraper import Specscraper_l
 from market_research.scraper import Specscraper_se
+from market_research.scraper._telemetry import METRICS
 from tools.gcp.firestoremanager import FirestoreManager
 import logging
 import os 
@@ -14,7 +16,8 @@ logging.basicConfig(level=logging.INFO)
 
 
 @app.get("/run_mkretv")
-async def run_scraper():
+def run_scraper():
+    # def 라서 FastAPI 가 스레드풀에서 실행, 수집 중에도 /metrics 가 응답한다
     AUTH_PATH = "web-scraper.json"
     firestore_manager = FirestoreManager(credentials_file=AUTH_PATH)
     data_dict = {}
@@ -34,6 +37,12 @@ async def run_scraper():
             logging.error(f"Error occurred for {maker}: {str(e)}")
             continue
     return {"finished": finished}
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    # 진행 중이거나 마지막 실행의 단계별 시간/페이지/브라우저 실행/재시도/바이트/실패 (Prometheus text format)
+    return PlainTextResponse(METRICS.render(), media_type="text/plain; version=0.0.4")
         
 
 # if __name__ == "__main__":
@@ -2,7 +2,7 @@ import streamlit as st
 import pandas as pd
 import plotly.io as pio
 from io import BytesIO
-import requests
+from market_research._http import HTTP
 from market_research.scraper import DataVisualizer
 from market_research.scraper import Rvisualizer
 from market_research.scraper import ERPvisualizer
@@ -26,7 +26,7 @@ st.session_state["category"] = None
 def get_recent_data_from_git(file_name):
     file_urls = []
     url  = "https://raw.githubusercontent.com/xikest/research_market_tv/main/json/stream_data_list.json"
-    response = requests.get(url)
+    response = HTTP.get(url)
     data = response.json()
     file_list = list(data.values())
     for file_url in file_list:
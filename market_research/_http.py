@@ -0,0 +1,80 @@
+import os
+import threading
+from http.cookiejar import DefaultCookiePolicy
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry, make_headers
+
+
+class _TimeoutAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that applies a default timeout when the caller passes none.
+    """
+
+    def __init__(self, timeout, **kwargs):
+        self.timeout = timeout
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
+
+class HttpClient:
+    """
+    Keep-alive requests.Session shared by every http call in the package, one per thread (and process).
+    Each session keeps a connection pool per host, so repeated calls skip the TCP/TLS handshake.
+    Responses are decompressed transparently (gzip/deflate, br when brotli is installed).
+    Connection errors and 500/502/504 (idempotent methods) are retried with backoff; 429/503 are left to the caller
+    (the scraper's rate limiter slows the site down instead).
+    timeout: (connect, read) seconds, used when a call passes none. MKRETV_HTTP_TIMEOUT overrides the read timeout.
+    Cookies are not kept between calls, since unrelated callers share the session: pass cookies= per call
+    (cookies set during the redirects of one call still follow that call).
+    """
+
+    RETRY_STATUS = (500, 502, 504)
+
+    def __init__(self, timeout: tuple = (5, 30), retries: int = 3, backoff: float = 0.5,
+                 pool_connections: int = 16, pool_maxsize: int = 16):
+        read_timeout = os.environ.get("MKRETV_HTTP_TIMEOUT")
+        self.timeout = (timeout[0], float(read_timeout)) if read_timeout else timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self._local = threading.local()
+
+    def session(self) -> requests.Session:
+        # fork 된 워커는 부모의 소켓을 쓰지 않도록 새 세션을 만든다
+        if getattr(self._local, "pid", None) != os.getpid():
+            self._local.session = self._build()
+            self._local.pid = os.getpid()
+        return self._local.session
+
+    def get(self, url: str, params=None, **kwargs) -> requests.Response:
+        return self.session().get(url, params=params, **kwargs)
+
+    def post(self, url: str, data=None, json=None, **kwargs) -> requests.Response:
+        return self.session().post(url, data=data, json=json, **kwargs)
+
+    def head(self, url: str, **kwargs) -> requests.Response:
+        return self.session().head(url, **kwargs)
+
+    def _build(self) -> requests.Session:
+        # read=False: 응답 도중 끊긴 요청은 다시 보내지 않고 Timeout 그대로 올린다
+        retry = Retry(total=self.retries, read=False, backoff_factor=self.backoff,
+                      status_forcelist=self.RETRY_STATUS, raise_on_status=False)
+        adapter = _TimeoutAdapter(self.timeout, max_retries=retry,
+                                  pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize)
+        session = requests.Session()
+        # 세션 쿠키 저장소는 아무 쿠키도 받지 않는다 (호출마다 새로 만든 requests.get 과 같게)
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["Accept-Encoding"] = make_headers(accept_encoding=True)["accept-encoding"]
+        return session
+
+
+# 패키지 안의 모든 http 호출이 공유한다
+HTTP = HttpClient()
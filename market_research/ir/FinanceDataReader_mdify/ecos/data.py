@@ -1,7 +1,7 @@
 # KRX data reader for FinanceDataReader  
 # 2024 FinacneData.KR
 
-import requests
+from market_research._http import HTTP
 import pandas as pd
 import json
 from datetime import datetime
@@ -53,7 +53,7 @@ def _ecos_stat(stat_search_ds_list, start, end, freq='D'):
     }
     # print(payload)
 
-    res = requests.post('https://ecos.bok.or.kr/serviceEndpoint/httpService/request.json', json.dumps(payload))
+    res = HTTP.post('https://ecos.bok.or.kr/serviceEndpoint/httpService/request.json', json.dumps(payload))
     jo = res.json()
     if jo['message']['msgRepNum']: # 에러 메시지가 있는 경우
         print(jo['message']['detailMsgs'])
@@ -117,7 +117,7 @@ def _ecos_keystat(keys, start, end, freq=None):
             },
             "data":{"key100statId":key}
         }
-        res = requests.post('https://ecos.bok.or.kr/serviceEndpoint/httpService/request.json', json.dumps(payload))
+        res = HTTP.post('https://ecos.bok.or.kr/serviceEndpoint/httpService/request.json', json.dumps(payload))
         jo = res.json()
 
         stat_search_ds = {
@@ -2,7 +2,7 @@
 # 2024 FinacneData.KR
 
 import io
-import requests
+from market_research._http import HTTP
 import pandas as pd
 import json
 
@@ -185,7 +185,7 @@ def _ecos_snap_reader(ticker):
     code, sub_code = full_code.split('-') if '-' in ticker else (full_code, None)
 
     url = f'https://snapshot.bok.or.kr/api/chart/exportChart?chart_id={code}'
-    r = requests.get(url)
+    r = HTTP.get(url)
     df = pd.read_excel(io.BytesIO(r.content), index_col=0, skiprows=3)
     df = df.drop(['단위', '주기', '기간'])
     df.columns = [col.replace('(좌축)', '').replace('(우축)', '').replace('좌축, ', '').replace('우축, ','') for col in df.columns]
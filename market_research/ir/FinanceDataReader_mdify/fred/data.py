@@ -3,7 +3,7 @@
 
 import pandas as pd
 import numpy as np
-import requests
+from market_research._http import HTTP
 from datetime import datetime
 import re
 from io import BytesIO
@@ -28,7 +28,7 @@ class FredReader:
             end_str = self.end.strftime("%Y-%m-%d")
 
         url = f'https://fred.stlouisfed.org/graph/fredgraph.csv?id={self.symbol}&cosd={start_str}&coed={end_str}'
-        r = requests.get(url)
+        r = HTTP.get(url)
         if 'content-disposition' not in r.headers:
             print(f'"symbol {self.symbol}" not found')
             return None
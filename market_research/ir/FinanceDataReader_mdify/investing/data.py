@@ -3,6 +3,7 @@ from datetime import datetime, timedelta
 import time
 import json
 import requests
+from market_research._http import HTTP
 import pandas as pd
 from .._utils import (_convert_letter_to_num, _validate_dates)
 
@@ -17,7 +18,7 @@ class InvestingDailyReader:
 
     def _get_currid_investing(self, symbol, exchange=None):
         url = f'https://api.investing.com/api/search/v2/search?q={symbol}'
-        r = requests.get(url, headers={'user-agent':'Mozilla/5.0', 'domain-id': 'en', 'dnt': '1'})
+        r = HTTP.get(url, headers={'user-agent':'Mozilla/5.0', 'domain-id': 'en', 'dnt': '1'})
         # print(r.text)
         jo = r.json()
         # print(json.dumps(jo['quotes'], indent=4))
@@ -61,7 +62,7 @@ class InvestingDailyReader:
                     f'pair_ID={curr_id}&date_from={start.strftime("%d%m%Y")}&date_to={end.strftime("%d%m%Y")}'
             for n in range(5): # retry
                 try:
-                    r = requests.get(url, headers={ 'X-Meta-Ver': '14', 'User-Agent': 'Mozilla/5.0' }, timeout=3)
+                    r = HTTP.get(url, headers={ 'X-Meta-Ver': '14', 'User-Agent': 'Mozilla/5.0' }, timeout=3)
                 except requests.exceptions.Timeout:
                     # print(f'timeout (retries: {n+1})')
                     time.sleep(2)
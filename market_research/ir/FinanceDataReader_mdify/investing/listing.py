@@ -1,5 +1,5 @@
 import pandas as pd
-import requests
+from market_research._http import HTTP
 from bs4 import BeautifulSoup
 
 from .._utils import (_convert_letter_to_num, _validate_dates)
@@ -20,7 +20,7 @@ class InvestingEtfListing:
 
         headers = { 'User-Agent':'Mozilla/5.0 (Macintosh) AppleWebKit/537.36 Chrome/98.0.4758.109', }
         url = 'https://kr.investing.com/etfs/' + country_map[self.country] + '-etfs'
-        r = requests.get(url, headers=headers)
+        r = HTTP.get(url, headers=headers)
 
         soup = BeautifulSoup(r.text, 'lxml')
         table = soup.find('table', id='etfs')
@@ -1,7 +1,7 @@
 # KRX data reader for FinanceDataReader  
 # 2023 FinacneData.KR
 
-import requests
+from market_research._http import HTTP
 import json
 import pandas as pd
 from datetime import datetime, timedelta
@@ -21,7 +21,7 @@ def _krx_fullcode(code):
             'bld': 'dbms/comm/finder/finder_stkisu',
         }
         url = 'http://data.krx.co.kr/comm/bldAttendant/getJsonData.cmd'
-        r = requests.post(url, data, headers=headers)
+        r = HTTP.post(url, data, headers=headers)
         __KRX_CODES = pd.DataFrame(r.json()['block1'])
         __KRX_CODES = __KRX_CODES.set_index('short_code')
 
@@ -44,7 +44,7 @@ def _krx_index_price_2years(idx1, idx2, from_date, to_date):
     }
 
     url = 'http://data.krx.co.kr/comm/bldAttendant/getJsonData.cmd'
-    r = requests.post(url, data, headers=headers)
+    r = HTTP.post(url, data, headers=headers)
     try:
         jo = r.json()
     except:
@@ -108,7 +108,7 @@ def _krx_stock_price_2years(full_code, from_date, to_date):
                'Referer': 'http://data.krx.co.kr/', }
 
     url = 'http://data.krx.co.kr/comm/bldAttendant/getJsonData.cmd'
-    r = requests.post(url, data, headers=headers)
+    r = HTTP.post(url, data, headers=headers)
     if r.status_code != 200:
         raise ValueError(f'{r.status_code} - {r.reason}' + '(Period is up to 2 years)')
 
@@ -167,7 +167,7 @@ def _krx_delisting_price_2years(full_code, from_date, to_date):
     }
 
     url = 'http://data.krx.co.kr/comm/bldAttendant/getJsonData.cmd'
-    r = requests.post(url, data, headers=headers)
+    r = HTTP.post(url, data, headers=headers)
     if r.status_code != 200:
         raise ValueError(f'{r.status_code} - {r.reason}')
 
@@ -200,7 +200,7 @@ def _krx_delisting_price(code, from_date, to_date):
     }
 
     url = 'http://data.krx.co.kr/comm/bldAttendant/getJsonData.cmd'
-    r = requests.post(url, data, headers=headers)
+    r = HTTP.post(url, data, headers=headers)
     j = json.loads(r.text)
     df = pd.json_normalize(j['block1'])
     df = df.set_index('short_code')
@@ -1,12 +1,12 @@
 import re
-import requests
+from market_research._http import HTTP
 import pandas as pd
 from io import StringIO
 from .._utils import (_convert_letter_to_num, _validate_dates)
 
 def _naver_data_reader(symbol, start, end):
     url = 'https://fchart.stock.naver.com/sise.nhn?timeframe=day&count=6000&requestType=0&symbol='
-    r = requests.get(url + symbol)
+    r = HTTP.get(url + symbol)
 
     data_list = re.findall(r'<item data=\"(.*?)\" />', r.text, re.DOTALL)
     if len(data_list) == 0:
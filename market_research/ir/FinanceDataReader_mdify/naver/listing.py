@@ -1,4 +1,4 @@
-import requests
+from market_research._http import HTTP
 import json
 from json.decoder import JSONDecodeError
 import pandas as pd
@@ -42,7 +42,7 @@ class NaverStockListing:
         url = f'http://api.stock.naver.com/stock/exchange/{exchange}/marketValue?page=1&pageSize=60'
         headers={'user-agent': 'Mozilla/5.0'}
         try:
-            r = requests.get(url, headers=headers)
+            r = HTTP.get(url, headers=headers)
             jo = json.loads(r.text)
         except JSONDecodeError as e:
             print(r.text)
@@ -55,7 +55,7 @@ class NaverStockListing:
         for page in range(100): 
             url = f'http://api.stock.naver.com/stock/exchange/{exchange}/marketValue?page={page+1}&pageSize=60'
             try:
-                r = requests.get(url, headers=headers)
+                r = HTTP.get(url, headers=headers)
                 jo = json.loads(r.text)
             except JSONDecodeError as e:
                 print(r.text)
@@ -102,7 +102,7 @@ class NaverEtfListing:
 
     def read_kr(self):
         url = 'https://finance.naver.com/api/sise/etfItemList.nhn'
-        r = requests.get(url)
+        r = HTTP.get(url)
         df = pd.DataFrame(r.json()['result']['etfItemList'])
         rename_cols = {
             'amonut':'Amount', 'changeRate':'ChangeRate', 'changeVal':'Change', 
@@ -129,7 +129,7 @@ class NaverEtfListing:
         url = f'https://api.stock.naver.com/etf/priceTop?page=1&pageSize=60'
         headers={'user-agent': 'Mozilla/5.0'}
         try:
-            r = requests.get(url, headers=headers)
+            r = HTTP.get(url, headers=headers)
             jo = json.loads(r.text)
         except JSONDecodeError as e:
             print(r.text)
@@ -142,7 +142,7 @@ class NaverEtfListing:
         for page in range(100): 
             url = f'https://api.stock.naver.com/etf/priceTop?page={page+1}&pageSize=60'
             try:
-                r = requests.get(url, headers=headers)
+                r = HTTP.get(url, headers=headers)
                 jo = json.loads(r.text)
             except JSONDecodeError as e:
                 print(r.text)
@@ -5,7 +5,7 @@ import re
 import io
 import json
 import pandas as pd
-import requests
+from market_research._http import HTTP
 from bs4 import BeautifulSoup
 from io import StringIO
 from datetime import datetime
@@ -36,7 +36,7 @@ def _marcap_market_page(sosok, page):
     for field in field_list:
         f, cols = field
         cookies = {'field_list': f}
-        html = requests.get(url, cookies=cookies).text
+        html = HTTP.get(url, cookies=cookies).text
         df = pd.read_html(html)[1]
         if len(df) == 0:
             break
@@ -137,7 +137,7 @@ def factors(code):
 
     ## 회사개요
     url = 'https://finance.naver.com/item/main.nhn?code=' + code
-    r = requests.get(url)
+    r = HTTP.get(url)
     soup = BeautifulSoup(r.text, features="lxml")
 
     summary_info = soup.find(id='summary_info')
@@ -224,7 +224,7 @@ def stock_price_day(code, start=None, end=None):
     end = datetime.today() if end is None else end
 
     url = 'https://fchart.stock.naver.com/sise.nhn?timeframe=day&count=6000&requestType=0&symbol='
-    r = requests.get(url + code)
+    r = HTTP.get(url + code)
 
     data_list = re.findall(r'<item data=\"(.*?)\" />', r.text, re.DOTALL)
     if len(data_list) == 0:
@@ -255,7 +255,7 @@ def stock_price_minute(code, date=None):
     # 1~40 page 크롤링
     for page in range(1,50):
         url = f'https://finance.naver.com/item/sise_time.nhn?code={code}&thistime={dt_str}180000&page={page}'
-        r = requests.get(url, headers={'user-agent': 'Mozilla/5.0'})
+        r = HTTP.get(url, headers={'user-agent': 'Mozilla/5.0'})
         df = pd.read_html(r.text, header=0)[0]
         if page > 1 and prev_html==r.text:
             break
@@ -283,13 +283,13 @@ def finstate_detail(code, rpt='0', freq='0', gubun='MAIN'):
 
     # encparam 가져오기
     url = 'https://navercomp.wisereport.co.kr/v2/company/c1010001.aspx?cmp_cd=005930'
-    html_text = requests.get(url).text
+    html_text = HTTP.get(url).text
     encparam = re.findall (r"encparam: '(.*?)'", html_text)[0]
 
     url = f'https://navercomp.wisereport.co.kr/v2/company/cF3002.aspx?cmp_cd={code}&frq={freq}&rpt={rpt}&finGubun={gubun}&frqTyp={freq}&cn=&encparam={encparam}'
     # 페이지 가져오기
     headers={'Referer': url}
-    r = requests.get(url, headers=headers)
+    r = HTTP.get(url, headers=headers)
     jo = json.loads(r.text)
 
     # DataFrame 생성
@@ -326,7 +326,7 @@ def finstate_summary(code, fin_type='0', freq='Y'):
     '''
     # encparam 읽어오기
     url = 'https://navercomp.wisereport.co.kr/v2/company/c1010001.aspx?cmp_cd=005930'
-    html_text = requests.get(url).text
+    html_text = HTTP.get(url).text
 
     if not re.search(r"encparam: '(.*?)'", html_text):
         print('encparam not found') # encparam이 없는 경우
@@ -334,7 +334,7 @@ def finstate_summary(code, fin_type='0', freq='Y'):
     encparam = re.findall (r"encparam: '(.*?)'", html_text)[0]
 
     url = f'https://navercomp.wisereport.co.kr/v2/company/ajax/cF1001.aspx?cmp_cd={code}&fin_typ={fin_type}&freq_typ={freq}&encparam={encparam}'
-    r = requests.get(url, headers={'Referer': url})
+    r = HTTP.get(url, headers={'Referer': url})
     df_list = pd.read_html(io.StringIO(r.text), encoding='euc-kr')
     df = df_list[1]
     df.columns = [col[1] for col in df.columns]
@@ -356,7 +356,7 @@ def invest_index(code, rpt='5', frq='1', finGubun='IFRSL'):
     '''
     # encparam 읽어오기
     url = 'http://companyinfo.stock.naver.com/v1/company/c1040001.aspx?cmp_cd=005930'
-    html_text = requests.get(url).text
+    html_text = HTTP.get(url).text
 
     if not re.search(r"encparam: '(.*?)'", html_text):
         print('encparam not found') # encparam이 없는 경우
@@ -369,7 +369,7 @@ def invest_index(code, rpt='5', frq='1', finGubun='IFRSL'):
 
     # DataFrame 생성
     headers={'Referer': 'http://companyinfo.stock.naver.com'}
-    jo = json.loads(requests.get(url, headers=headers).text)
+    jo = json.loads(HTTP.get(url, headers=headers).text)
     df = pd.json_normalize(jo, 'DATA')
 
     # DATA1~DATA6 컬럼 이름 바꾸기
@@ -399,7 +399,7 @@ def investors(code):
     * code: 종목코드
     '''
     url = f'https://finance.naver.com/item/frgn.nhn?code={code}'
-    r = requests.get(url, headers={'User-Agent':'Mozilla/5.0 AppleWebKit/537.36 Edg/122.0.0.0'})
+    r = HTTP.get(url, headers={'User-Agent':'Mozilla/5.0 AppleWebKit/537.36 Edg/122.0.0.0'})
     print()
     try:
         df_list = pd.read_html(io.StringIO(r.text), encoding='euc-kr')
@@ -423,7 +423,7 @@ def sector_stock_list(verbose=False):
     반환값(DataFrame): 컬럼=[종목코드,종목명,시장,업종명,업종코드]
     '''
     url = 'https://finance.naver.com/sise/sise_group.nhn?type=upjong'
-    r = requests.get(url)
+    r = HTTP.get(url)
     soup = BeautifulSoup(r.text, 'lxml')
     a_list = soup.select('a[href*=sise_group_detail]')
 
@@ -433,7 +433,7 @@ def sector_stock_list(verbose=False):
         sector_no = a['href'].replace('/sise/sise_group_detail.nhn?type=upjong&no=', '')
         sector_url = 'https://finance.naver.com' + a['href']
         url = f'https://finance.naver.com/sise/sise_group_detail.nhn?type=upjong&no={sector_no}'
-        r = requests.get(url)
+        r = HTTP.get(url)
         soup = BeautifulSoup(r.text, 'lxml')
         divs = soup.select('div[class="name_area"]')
         if verbose:
@@ -472,7 +472,7 @@ def __up(sosok=0):
     for field in field_list:
         f, cols = field
         cookies = {'field_list': f}
-        html = requests.get(url, cookies=cookies).text
+        html = HTTP.get(url, cookies=cookies).text
         df = pd.read_html(html)[1]
         if len(df) == 0:
             break
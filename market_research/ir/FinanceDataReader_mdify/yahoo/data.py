@@ -1,7 +1,7 @@
 # FinanceDataReader
 # 2018-2024 [FinanceData.KR](https://financedata.github.io/) Open Source Financial data reader
 
-import requests
+from market_research._http import HTTP
 import pandas as pd
 import time
 from datetime import timedelta
@@ -34,7 +34,7 @@ def _yahoo_data_reader(symbol, exchange, start, end):
         f'https://query2.finance.yahoo.com/v8/finance/chart/{_map_symbol(symbol, exchange)}?'
         f'period1={start_ts}&period2={end_ts}&interval=1d&includeAdjustedClose=true'
     )
-    r = requests.get(url, headers={'user-agent': 'Mozilla/5.0 AppleWebKit/537.36'})
+    r = HTTP.get(url, headers={'user-agent': 'Mozilla/5.0 AppleWebKit/537.36'})
     r.raise_for_status()
     jo = r.json()
 
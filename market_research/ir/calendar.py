@@ -1,6 +1,6 @@
 import pandas as pd
 import plotly.graph_objects as go
-import requests
+from market_research._http import HTTP
 import datetime
 import pandas as pd
 import re 
@@ -31,7 +31,7 @@ class Calendar:
         }
         events = []  
         while True:
-            response = requests.get(url, params=params)
+            response = HTTP.get(url, params=params)
             if response.status_code == 200:
                 data = response.json()
                 items = data.get('items', [])
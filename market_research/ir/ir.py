@@ -7,6 +7,7 @@ import plotly.graph_objects as go
 import plotly.subplots as sp
 from datetime import datetime
 import requests
+from market_research._http import HTTP
 
 class SONY_IR():
     def __init__(self):
@@ -15,7 +16,7 @@ class SONY_IR():
     def get_ir_script(self) -> dict:
         def check_url_exists(url: str) -> bool:
             try:
-                response = requests.head(url)
+                response = HTTP.head(url)
                 # 200 OK
                 return response.status_code == 200
             except requests.RequestException:
@@ -0,0 +1,105 @@
+import asyncio
+import os
+import time
+import logging
+from fnmatch import fnmatch
+try:
+    from playwright.async_api import async_playwright
+except ImportError:  # pip install playwright && playwright install chromium
+    async_playwright = None
+
+
+class AsyncBrowser:
+    """
+    One chromium process driven by asyncio. Every page visit gets its own browser context
+    (isolated cookies/storage, a few MB) instead of a chrome process of its own.
+    max_contexts: page visits open at the same time
+    PLAYWRIGHT_WS_ENDPOINT connects to a remote browser server instead of launching chromium.
+    """
+
+    def __init__(self, headless: bool = True, max_contexts: int = 24, navigation_hook=None, resource_policy=None,
+                 rate_limiter=None, timeout: float = 30):
+        self.headless = headless
+        self.max_contexts = max_contexts
+        self.navigation_hook = navigation_hook
+        self.resource_policy = resource_policy
+        self.rate_limiter = rate_limiter
+        self.timeout = timeout
+        self._playwright = None
+        self._browser = None
+        self._slots = None
+
+    @staticmethod
+    def available() -> bool:
+        return async_playwright is not None
+
+    async def start(self) -> None:
+        self._playwright = await async_playwright().start()
+        endpoint = os.getenv("PLAYWRIGHT_WS_ENDPOINT")
+        if endpoint:
+            self._browser = await self._playwright.chromium.connect(endpoint)
+        else:
+            self._browser = await self._playwright.chromium.launch(headless=self.headless)
+        self._slots = asyncio.Semaphore(self.max_contexts)
+        logging.info(f"async browser started ({self.max_contexts} contexts)")
+
+    async def close(self) -> None:
+        if self._browser is not None:
+            await self._browser.close()
+        if self._playwright is not None:
+            await self._playwright.stop()
+        self._browser = self._playwright = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def visit(self, url: str, handler):
+        """
+        Open url in a fresh context and return await handler(page, url).
+        """
+        async with self._slots:
+            context = await self._browser.new_context(viewport={"width": 1920, "height": 1080})
+            try:
+                await self._prepare(context)
+                page = await context.new_page()
+                await self._goto(page, url)
+                return await handler(page, url)
+            finally:
+                await context.close()
+
+    async def _prepare(self, context) -> None:
+        if self.navigation_hook is not None:
+            if self.navigation_hook.cookies:
+                await context.add_cookies([dict({"path": "/"}, **cookie) for cookie in self.navigation_hook.cookies])
+            await context.add_init_script(self.navigation_hook.script)
+        if self.resource_policy is not None:
+            patterns = self.resource_policy.blocked_urls()
+
+            async def route(route):
+                if any(fnmatch(route.request.url, pattern) for pattern in patterns):
+                    await route.abort()
+                else:
+                    await route.continue_()
+            await context.route("**/*", route)
+
+    async def _goto(self, page, url: str) -> None:
+        if self.rate_limiter is not None:
+            await asyncio.get_running_loop().run_in_executor(None, self.rate_limiter.acquire, url)
+        start = time.time()
+        try:
+            response = await page.goto(url, wait_until="load", timeout=self.timeout * 1000)
+        except Exception:
+            if self.rate_limiter is not None:
+                self.rate_limiter.feedback(url, time.time() - start, ok=False)
+            raise
+        if self.rate_limiter is not None:
+            status = response.status if response is not None else None
+            self.rate_limiter.feedback(url, time.time() - start, ok=status is None or status < 500, status=status)
+        try:
+            await page.wait_for_load_state("networkidle", timeout=self.timeout * 1000 / 6)
+        except Exception:
+            pass  # 분석 스크립트 등으로 networkidle 이 오지 않는 페이지
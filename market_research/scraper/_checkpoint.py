@@ -0,0 +1,107 @@
+import json
+import os
+import threading
+import logging
+from contextlib import contextmanager
+from pathlib import Path
+from market_research.scraper._page_cache import canonical_url
+
+
+class Checkpoint:
+    """
+    Extracted rows appended to a JSONL file as each model completes: {"url", "ok", "row"} per line.
+    A crash keeps every row written so far; resume skips the urls already extracted (ok).
+    A url written more than once counts with its last line.
+    path=None keeps the lines in memory (nothing survives the process).
+    """
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path is not None else None
+        self._memory = []
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._memory = []
+            if self.path is not None:
+                self.path.write_text("", encoding="utf-8")
+
+    def append(self, url: str, row: dict, ok: bool = True) -> None:
+        line = json.dumps({"url": url, "ok": ok, "row": row}, ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            if self.path is None:
+                self._memory.append(line)
+                return None
+            with open(self.path, "a+b") as file:
+                if file.tell() > 0:
+                    file.seek(-1, os.SEEK_END)
+                    if file.read(1) != b"\n":
+                        line = "\n" + line  # 중단된 마지막 줄 뒤에 이어 쓰지 않는다
+                file.write(line.encode("utf-8"))
+                file.flush()
+                os.fsync(file.fileno())
+
+    def done(self) -> set:
+        """
+        Canonical urls whose last line is a complete row.
+        """
+        return {key for key, entry in self._last_entries().items() if entry[1]}
+
+    def rows(self, order=None):
+        """
+        Rows in the order they completed, streamed from the file a line at a time.
+        order: urls, e.g. url_dict.values(); the rows then come in that order, urls without a row are skipped.
+        Only the position of each url's last line is kept in memory, the rows are read back one by one.
+        """
+        last = {key: entry[0] for key, entry in self._last_entries().items()}
+        if order is not None:
+            with self._reader() as read:
+                for key in dict.fromkeys(canonical_url(url) for url in order):
+                    if key in last:
+                        yield read(last[key])["row"]
+            return None
+        for position, record in self._records():
+            if last.get(canonical_url(record["url"])) == position:
+                yield record["row"]
+
+    def _last_entries(self) -> dict:
+        entries = {}
+        for position, record in self._records():
+            entries[canonical_url(record["url"])] = (position, record["ok"])
+        return entries
+
+    def _records(self):
+        """
+        (position, record) of every complete line; position is the byte offset in the file (the index in memory).
+        """
+        if self.path is None:
+            yield from self._parse(enumerate(list(self._memory)))
+        elif self.path.exists():
+            with open(self.path, "rb") as file:
+                yield from self._parse(self._offsets(file))
+
+    @contextmanager
+    def _reader(self):
+        if self.path is None:
+            memory = list(self._memory)
+            yield lambda position: json.loads(memory[position])
+            return None
+        with open(self.path, "rb") as file:
+            def read(position):
+                file.seek(position)
+                return json.loads(file.readline())
+            yield read
+
+    @staticmethod
+    def _offsets(file):
+        position = 0
+        for line in file:
+            yield position, line
+            position += len(line)
+
+    def _parse(self, lines):
+        for position, line in lines:
+            try:
+                yield position, json.loads(line)
+            except ValueError:
+                logging.warning(f"skip broken checkpoint line at {position} of {self.path}")  # 중단된 마지막 줄
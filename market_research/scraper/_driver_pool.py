@@ -0,0 +1,173 @@
+import atexit
+import threading
+import logging
+from tools.web import WebDriver
+
+
+def execute_cdp(driver, cmd: str, params: dict) -> dict:
+    """
+    driver.execute_cdp_cmd that also works on a Remote session (e.g. a node behind the selenium_hub):
+    chromedriver's goog/cdp/execute endpoint is registered on the command executor when it is missing.
+    Raises when the session has no CDP at all (not chromium, endpoint refused by the server).
+    """
+    executor = getattr(driver, "command_executor", None)
+    if hasattr(executor, "add_command") and executor.get_command("executeCdpCommand") is None:
+        executor.add_command("executeCdpCommand", "POST", "/session/$sessionId/goog/cdp/execute")
+    return driver.execute_cdp_cmd(cmd, params)
+
+
+class LocalWebDriver(WebDriver):
+    """
+    WebDriver whose current session (self.driver) is kept per thread,
+    so helpers like move_element_to_center act on the calling worker's browser.
+    """
+
+    def __init__(self, headless=False):
+        self._local = threading.local()
+        super().__init__(headless=headless)
+
+    @property
+    def driver(self):
+        return getattr(self._local, "driver", None)
+
+    @driver.setter
+    def driver(self, driver):
+        self._local.driver = driver
+
+
+class DriverPool:
+    """
+    Keeps Chrome sessions alive between page visits.
+    lease() hands out an idle session (or starts a new one),
+    release() wipes cookies/storage and puts it back for the next lease.
+    A session is quit and replaced after max_uses leases.
+    watchdog (DriverWatchdog) is started with the first lease and may evict sessions at any time.
+    """
+
+    def __init__(self, web_driver, max_idle: int = 2, max_uses: int = 30, on_launch=None):
+        self.web_driver = web_driver
+        self.on_launch = on_launch
+        self.max_idle = max_idle
+        self.max_uses = max_uses
+        self.watchdog = None
+        self.launches = 0
+        self._idle = []
+        self._leased = set()
+        self._uses = {}
+        self._owners = {}
+        self._recycled = set()
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+    def lease(self):
+        if self.watchdog is not None:
+            self.watchdog.start()
+        with self._lock:
+            driver = self._idle.pop() if self._idle else None
+        if driver is None:
+            driver = self._launch()
+        with self._lock:
+            self._leased.add(driver)
+            self._uses[driver] = self._uses.get(driver, 0) + 1
+            self._owners[driver] = threading.get_ident()
+        self.web_driver.driver = driver  # move_element_to_center 등 헬퍼가 현재 세션을 사용
+        return driver
+
+    def release(self, driver) -> None:
+        with self._lock:
+            if driver not in self._leased:
+                return None  # 이미 반환되었거나 풀 밖의 세션
+            self._leased.discard(driver)
+            self._owners.pop(driver, None)
+            expired = self._uses.get(driver, 0) >= self.max_uses
+            full = len(self._idle) >= self.max_idle
+
+        if expired or full or not self._reset(driver):
+            self._discard(driver)
+            return None
+        with self._lock:
+            self._idle.append(driver)
+        return None
+
+    def discard(self, driver) -> None:
+        """
+        Quit a session that must not be reused (crashed, hung, ...).
+        """
+        with self._lock:
+            self._leased.discard(driver)
+            self._owners.pop(driver, None)
+        self._discard(driver)
+
+    def sessions(self) -> list:
+        with self._lock:
+            return list(self._leased) + list(self._idle)
+
+    def leased(self, driver) -> bool:
+        with self._lock:
+            return driver in self._leased
+
+    def evict(self, driver) -> None:
+        """
+        Drop a session from the pool without quitting it; the thread leasing it is marked as recycled.
+        """
+        with self._lock:
+            if driver in self._idle:
+                self._idle.remove(driver)
+            self._leased.discard(driver)
+            owner = self._owners.pop(driver, None)
+            if owner is not None:
+                self._recycled.add(owner)
+
+    def take_recycled(self) -> bool:
+        """
+        True once if the calling thread's session was evicted by the watchdog, so its page should be requeued.
+        """
+        ident = threading.get_ident()
+        with self._lock:
+            if ident in self._recycled:
+                self._recycled.discard(ident)
+                return True
+        return False
+
+    def close(self) -> None:
+        if self.watchdog is not None:
+            self.watchdog.stop()
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self._discard(driver)
+
+    def _launch(self):
+        driver = self.web_driver.get_chrome()
+        with self._lock:
+            self.launches += 1
+        logging.info(f"chrome session launched ({self.launches})")
+        if self.on_launch is not None:
+            self.on_launch(driver)
+        return driver
+
+    def _reset(self, driver) -> bool:
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            driver.execute_script("try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}")
+            try:
+                execute_cdp(driver, "Network.clearBrowserCookies", {})
+            except Exception:
+                driver.delete_all_cookies()
+            driver.get("about:blank")
+            return True
+        except Exception as e:
+            logging.warning(f"fail to reset chrome session: {e}")
+            return False
+
+    def _discard(self, driver) -> None:
+        with self._lock:
+            self._uses.pop(driver, None)
+        try:
+            driver.quit()
+        except Exception as e:
+            logging.debug(f"fail to quit chrome session: {e}")
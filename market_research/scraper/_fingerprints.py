@@ -0,0 +1,64 @@
+import hashlib
+import json
+import re
+import threading
+import logging
+from pathlib import Path
+from market_research.scraper._page_cache import canonical_url
+
+
+class FingerprintStore:
+    """
+    Fingerprint of each model page (hash of its price and spec blocks) with the row extracted from it.
+    When a page still has the same fingerprint, the stored row is reused instead of clicking through the spec tabs again.
+    max_reuse: runs a row may be reused before it is extracted again anyway,
+    for changes outside the fingerprinted blocks.
+    """
+
+    def __init__(self, path=None, max_reuse: int = 4):
+        self.path = Path(path) if path is not None else None
+        self.max_reuse = max_reuse
+        self.entries = {}
+        self.reused = 0
+        self.changed = 0
+        self._lock = threading.Lock()
+        if self.path is not None and self.path.exists():
+            try:
+                self.entries = json.loads(self.path.read_text(encoding="utf-8"))
+            except ValueError:
+                logging.warning(f"ignore broken fingerprints {self.path}")
+
+    @staticmethod
+    def digest(blocks: list) -> str:
+        text = "\n".join(re.sub(r"\s+", " ", block).strip() for block in blocks)
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+    def previous(self, url: str, fingerprint: str):
+        """
+        Copy of the row stored for url when fingerprint is unchanged, otherwise None.
+        """
+        if fingerprint is None:
+            return None
+        with self._lock:
+            entry = self.entries.get(canonical_url(url))
+            if entry is None or entry["fingerprint"] != fingerprint or entry["reused"] >= self.max_reuse:
+                self.changed += 1
+                return None
+            entry["reused"] += 1
+            self.reused += 1
+            return dict(entry["row"])
+
+    def update(self, url: str, fingerprint: str, row: dict) -> None:
+        if fingerprint is None:
+            return None
+        with self._lock:
+            self.entries[canonical_url(url)] = {"fingerprint": fingerprint, "reused": 0, "row": row}
+
+    def report(self) -> dict:
+        return {"reused": self.reused, "changed": self.changed}
+
+    def save(self) -> None:
+        if self.path is None:
+            return None
+        with self._lock:
+            self.path.write_text(json.dumps(self.entries, ensure_ascii=False, default=str), encoding="utf-8")
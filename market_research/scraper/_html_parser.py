@@ -0,0 +1,186 @@
+import re
+import sys
+import time
+import soupsieve
+from bs4 import BeautifulSoup
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:  # pip install selectolax
+    HTMLParser = None
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:
+    lxml = None
+try:
+    from cssselect import HTMLTranslator
+except ImportError:  # 간단한 css 는 아래 _css_to_xpath 로 변환
+    HTMLTranslator = None
+
+
+def default_backend() -> str:
+    if HTMLParser is not None:
+        return "selectolax"
+    if lxml is not None:
+        return "lxml"
+    return "bs4"
+
+
+class Selector:
+    """
+    CSS selector compiled once for every parser backend and reused for every snapshot.
+    Without cssselect, lxml understands the simple subset used by the scrapers:
+    tag, #id, .class, [attr], [attr="value"], descendant and child (>) combinators, comma groups.
+    """
+
+    def __init__(self, css: str):
+        self.css = css
+        self._soupsieve = None
+        self._xpath = None
+
+    def soupsieve(self):
+        if self._soupsieve is None:
+            self._soupsieve = soupsieve.compile(self.css)
+        return self._soupsieve
+
+    def xpath(self):
+        if self._xpath is None:
+            self._xpath = (etree.XPath(_css_to_xpath(self.css, "descendant-or-self::")),
+                           etree.XPath(_css_to_xpath(self.css, "descendant::")))
+        return self._xpath
+
+
+class HtmlSnapshot:
+    """
+    One parsed copy of a page (driver.page_source after everything is expanded), queried with precompiled selectors.
+    backend: "selectolax", "lxml" or "bs4" (html.parser); default is the fastest one installed.
+    text() is the textContent of a node, like BeautifulSoup get_text().
+    """
+
+    def __init__(self, html: str, backend: str = None):
+        self.backend = backend or default_backend()
+        if self.backend == "selectolax":
+            self.root = HTMLParser(html)
+        elif self.backend == "lxml":
+            self.root = lxml.html.document_fromstring(html or "<html></html>")
+        else:
+            self.root = BeautifulSoup(html, "html.parser")
+
+    def select(self, selector, node=None) -> list:
+        if isinstance(selector, str):
+            selector = Selector(selector)
+        if self.backend == "selectolax":
+            return (node if node is not None else self.root).css(selector.css)
+        if self.backend == "lxml":
+            document, scoped = selector.xpath()
+            return scoped(node) if node is not None else document(self.root)
+        return selector.soupsieve().select(node if node is not None else self.root)
+
+    def select_one(self, selector, node=None):
+        nodes = self.select(selector, node)
+        return nodes[0] if nodes else None
+
+    def text(self, node) -> str:
+        if self.backend == "selectolax":
+            return node.text(deep=True)
+        if self.backend == "lxml":
+            return node.text_content()
+        return node.get_text()
+
+    def attr(self, node, name: str):
+        if self.backend == "selectolax":
+            return node.attributes.get(name)
+        return node.get(name)
+
+
+def _css_to_xpath(css: str, prefix: str) -> str:
+    if HTMLTranslator is not None:
+        return HTMLTranslator().css_to_xpath(css, prefix=prefix)
+    return " | ".join(_compile_group(group.strip(), prefix) for group in css.split(","))
+
+
+_TOKEN = re.compile(r'\s*(>)\s*|\s+|([\w*-]+)|#([\w-]+)|\.([\w-]+)|\[([\w-]+)(?:([~^$*]?=)["\']?([^"\'\]]*)["\']?)?\]')
+
+
+def _compile_group(css: str, prefix: str) -> str:
+    steps = []
+    axis = prefix
+    tag, predicates = None, []
+    position = 0
+    while position < len(css):
+        match = _TOKEN.match(css, position)
+        if match is None or match.end() == position:
+            raise ValueError(f"unsupported css selector: {css}")
+        position = match.end()
+        combinator, name, id_, class_, attr, op, value = match.groups()
+        if combinator is not None or (name is None and id_ is None and class_ is None and attr is None):
+            if tag is not None or predicates:
+                steps.append(axis + (tag or "*") + "".join(f"[{p}]" for p in predicates))
+                tag, predicates = None, []
+            axis = "/child::" if combinator else "/descendant::"
+            continue
+        if name is not None:
+            tag = name
+        elif id_ is not None:
+            predicates.append(f"@id='{id_}'")
+        elif class_ is not None:
+            predicates.append(f"contains(concat(' ', normalize-space(@class), ' '), ' {class_} ')")
+        elif op is None:
+            predicates.append(f"@{attr}")
+        elif op == "=":
+            predicates.append(f"@{attr}='{value}'")
+        elif op == "~=":
+            predicates.append(f"contains(concat(' ', normalize-space(@{attr}), ' '), ' {value} ')")
+        elif op == "^=":
+            predicates.append(f"starts-with(@{attr}, '{value}')")
+        elif op == "$=":
+            predicates.append(f"substring(@{attr}, string-length(@{attr}) - {len(value) - 1}) = '{value}'")
+        else:
+            predicates.append(f"contains(@{attr}, '{value}')")
+    if tag is not None or predicates:
+        steps.append(axis + (tag or "*") + "".join(f"[{p}]" for p in predicates))
+    return "".join(steps)
+
+
+def benchmark(html: str, selector: str, passes: int = 15, repeat: int = 5) -> dict:
+    """
+    Seconds to read selector from html: "per_pass" re-parses the page with html.parser on every scroll pass
+    (the old extract loop), the others parse one snapshot with each installed backend.
+    """
+    compiled = Selector(selector)
+
+    def per_pass():
+        for _ in range(passes):
+            soup = BeautifulSoup(html, "html.parser")
+            [element.get_text() for element in soup.select(selector)]
+
+    def snapshot(backend):
+        page = HtmlSnapshot(html, backend=backend)
+        [page.text(node) for node in page.select(compiled)]
+
+    runs = {"per_pass": per_pass}
+    for backend in ("bs4", "lxml", "selectolax"):
+        if backend == "bs4" or (backend == "lxml" and lxml is not None) or (backend == "selectolax" and HTMLParser is not None):
+            runs[f"snapshot_{backend}"] = lambda backend=backend: snapshot(backend)
+    result = {}
+    for name, run in runs.items():
+        start = time.perf_counter()
+        for _ in range(repeat):
+            run()
+        result[name] = round((time.perf_counter() - start) / repeat, 4)
+    return result
+
+
+if __name__ == "__main__":
+    # python -m market_research.scraper._html_parser page.html ".full-specifications__specifications-single-card__sub-list"
+    if len(sys.argv) > 2:
+        with open(sys.argv[1], encoding="utf-8") as file:
+            html = file.read()
+        selector = sys.argv[2]
+    else:
+        card = ('<div class="full-specifications__specifications-single-card__sub-list">'
+                '<h4>Label {0}</h4><p>Value {0}</p></div>')
+        html = "<html><body>" + "".join(card.format(i) for i in range(400)) + "<div>" * 2000 + "</div>" * 2000 + "</body></html>"
+        selector = ".full-specifications__specifications-single-card__sub-list"
+    for name, seconds in benchmark(html, selector).items():
+        print(f"{name:>20}: {seconds:.4f}s")
@@ -0,0 +1,103 @@
+import json
+import threading
+import logging
+from market_research.scraper._driver_pool import execute_cdp
+
+
+class NavigationHook:
+    """
+    Prepares a chrome session before it navigates, so consent banners and promotion modals never render.
+    cookies: consent cookies seeded through CDP, e.g. {"name": ..., "value": ..., "domain": ...}
+    local_storage: flags written to localStorage before any page script runs
+    hide_selectors: css selectors hidden by a stylesheet injected before any page script runs
+    css: extra rules for the same stylesheet
+    init_script: extra javascript evaluated on every new document
+    """
+
+    def __init__(self, cookies: list = None, local_storage: dict = None, hide_selectors: list = None, css: str = "", init_script: str = ""):
+        self.cookies = cookies or []
+        self.local_storage = local_storage or {}
+        self.hide_selectors = hide_selectors or []
+        self.css = css
+        self.init_script = init_script
+        self._sessions = set()
+        self._warned = False
+        self._lock = threading.Lock()
+
+    def apply(self, driver) -> bool:
+        """
+        Returns False when the session has no CDP access (not even through the remote endpoint);
+        call inject after the page loaded, popups that rendered before that must be closed by hand.
+        """
+        try:
+            with self._lock:
+                registered = driver.session_id in self._sessions
+            if not registered:
+                execute_cdp(driver, "Page.addScriptToEvaluateOnNewDocument", {"source": self._compile_script()})
+            for cookie in self.cookies:
+                # 세션을 반납할 때마다 쿠키가 지워지므로 매번 다시 심는다
+                execute_cdp(driver, "Network.setCookie", dict({"path": "/"}, **cookie))
+            with self._lock:
+                self._sessions.add(driver.session_id)
+            return True
+        except Exception as e:
+            with self._lock:
+                self._sessions.discard(getattr(driver, "session_id", None))
+            self._warn_once(f"navigation hook needs CDP, falling back to a script run after page load: {e}")
+            return False
+
+    def inject(self, driver) -> None:
+        """
+        Fallback of apply for a loaded page: run the script now and set the cookies for the next page of the site.
+        """
+        try:
+            driver.execute_script(self._compile_script())
+        except Exception as e:
+            logging.debug(f"fail to inject navigation hook: {e}")
+        for cookie in self.cookies:
+            try:
+                driver.add_cookie(dict({"path": "/"}, **cookie))
+            except Exception as e:
+                logging.debug(f"fail to add cookie {cookie['name']}: {e}")  # 다른 도메인의 페이지
+
+    @property
+    def script(self) -> str:
+        return self._compile_script()
+
+    def applied(self, driver) -> bool:
+        with self._lock:
+            return getattr(driver, "session_id", None) in self._sessions
+
+    def _warn_once(self, message: str) -> None:
+        with self._lock:
+            warned, self._warned = self._warned, True
+        if not warned:
+            logging.warning(message)
+
+    def _compile_script(self) -> str:
+        lines = ["(function () {"]
+        for key, value in self.local_storage.items():
+            lines.append(f"  try {{ window.localStorage.setItem({json.dumps(key)}, {json.dumps(value)}); }} catch (e) {{}}")
+        css = self.css
+        if self.hide_selectors:
+            css = ", ".join(self.hide_selectors) + " { display: none !important; } " + css
+        if css:
+            lines.append(f"""  var css = {json.dumps(css)};
+  var inject = function () {{
+    var style = document.createElement('style');
+    style.textContent = css;
+    (document.head || document.documentElement).appendChild(style);
+  }};
+  if (document.documentElement) {{ inject(); }} else {{ document.addEventListener('DOMContentLoaded', inject); }}""")
+        if self.init_script:
+            lines.append(self.init_script)
+        lines.append("})();")
+        return "\n".join(lines)
+
+
+# OneTrust 동의 배너 (대부분의 제조사 사이트가 사용)
+ONETRUST_SELECTORS = ["#onetrust-consent-sdk", "#onetrust-banner-sdk", ".onetrust-pc-dark-filter"]
+
+
+def onetrust_cookie(domain: str) -> dict:
+    return {"name": "OptanonAlertBoxClosed", "value": "2024-01-01T00:00:00.000Z", "domain": domain}
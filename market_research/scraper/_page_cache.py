@@ -0,0 +1,149 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import logging
+from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+import requests
+from requests.structures import CaseInsensitiveDict
+
+TRACKING_PARAMS = re.compile(r"^(utm_.*|gclid|fbclid|msclkid|mc_cid|mc_eid|_ga|icid|cid|ref|srsltid)$", re.I)
+
+
+def canonical_url(url: str) -> str:
+    """
+    HTTPS://www.LG.com/us/tvs/?utm_source=x&b=2&a=1#specs -> https://www.lg.com/us/tvs?a=1&b=2
+    Scheme and host are lower-cased, fragments and tracking parameters dropped, the query sorted
+    and a trailing slash removed. The path keeps its case (some sites are case sensitive).
+    """
+    parts = urlsplit(url.strip())
+    query = sorted((key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+                   if not TRACKING_PARAMS.match(key))
+    path = parts.path.rstrip("/") or "/"
+    netloc = parts.netloc.lower()
+    if netloc.endswith(":443") and parts.scheme.lower() == "https":
+        netloc = netloc[:-4]
+    return urlunsplit((parts.scheme.lower(), netloc, path, urlencode(query), ""))
+
+
+class CacheMiss(Exception):
+    """
+    Raised in offline mode when a page was never cached.
+    """
+
+
+class PageCache:
+    """
+    Pages kept on disk, keyed by canonical url.
+    http: raw responses of requests calls, revalidated with ETag/Last-Modified (304 serves the stored body)
+    rendered: page_source of selenium visits, one snapshot per url and stage (set_driver/open_page stage)
+    offline=True never touches the network: everything is served from disk or raises CacheMiss.
+    """
+
+    def __init__(self, root="cache", offline: bool = False):
+        self.root = Path(root)
+        self.offline = offline
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls):
+        """
+        MKRETV_CACHE=<folder> enables the cache, MKRETV_CACHE_MODE=offline replays it without network.
+        """
+        root = os.getenv("MKRETV_CACHE")
+        if not root:
+            return None
+        return cls(root, offline=os.getenv("MKRETV_CACHE_MODE", "").lower() == "offline")
+
+    def conditional_headers(self, url: str) -> dict:
+        entry = self._read("http", url)
+        headers = {}
+        if entry is not None:
+            if entry["headers"].get("etag"):
+                headers["If-None-Match"] = entry["headers"]["etag"]
+            if entry["headers"].get("last-modified"):
+                headers["If-Modified-Since"] = entry["headers"]["last-modified"]
+        return headers
+
+    def response(self, url: str, fresh: requests.Response = None) -> requests.Response:
+        """
+        Stored response of url. With fresh (the live answer) it is stored first, or revalidated on 304.
+        Raises CacheMiss when nothing is stored, also for a 304 (it has no body to serve).
+        """
+        if fresh is not None and fresh.status_code != 304:
+            self._count("misses")
+            if fresh.ok:
+                self._write("http", url, {"url": url, "status": fresh.status_code, "fetched_at": time.time(),
+                                          "headers": {key.lower(): value for key, value in fresh.headers.items()},
+                                          "encoding": fresh.encoding, "body": fresh.text})
+            return fresh
+        entry = self._read("http", url)
+        if entry is None:
+            self._count("misses")
+            if fresh is not None:
+                raise CacheMiss(f"304 without a cached copy: {url}")  # 본문 없는 304 를 돌려주지 않는다
+            raise CacheMiss(f"not cached: {url}")
+        self._count("revalidated" if fresh is not None else "hits")
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response.encoding = entry.get("encoding") or "utf-8"
+        response._content = entry["body"].encode(response.encoding)
+        response.url = url
+        return response
+
+    def store_snapshot(self, url: str, stage: str, html: str) -> None:
+        self._write("rendered", url, {"url": url, "stage": stage, "fetched_at": time.time(), "body": html}, stage)
+
+    def snapshot(self, url: str, stage: str) -> str:
+        entry = self._read("rendered", url, stage)
+        if entry is None:
+            self._count("misses")
+            raise CacheMiss(f"not cached: {url} ({stage})")
+        self._count("hits")
+        return entry["body"]
+
+    @staticmethod
+    def replay(driver, html: str) -> None:
+        """
+        Load a snapshot into the browser without network (works on remote drivers too); scripts are dropped.
+        """
+        html = re.sub(r"<script\b.*?</script>", "", html, flags=re.S | re.I)
+        driver.get("about:blank")
+        driver.execute_script("document.open(); document.write(arguments[0]); document.close();", html)
+
+    def report(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "revalidated": self.revalidated, "offline": self.offline}
+
+    def _path(self, kind: str, url: str, stage: str = "") -> Path:
+        digest = hashlib.sha1(f"{canonical_url(url)}#{stage}".encode()).hexdigest()
+        return self.root / kind / digest[:2] / f"{digest}.json"
+
+    def _read(self, kind: str, url: str, stage: str = ""):
+        path = self._path(kind, url, stage)
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, kind: str, url: str, entry: dict, stage: str = "") -> None:
+        path = self._path(kind, url, stage)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp, path)
+        except OSError as e:
+            logging.warning(f"fail to cache {entry.get('url')}: {e}")
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
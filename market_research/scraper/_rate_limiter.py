@@ -0,0 +1,143 @@
+import sqlite3
+import threading
+import time
+import logging
+from contextlib import closing, contextmanager
+from urllib.parse import urlparse
+
+
+class DomainRateLimiter:
+    """
+    Token bucket per site, shared by every worker and scraper in the process.
+    The rate (requests/sec) adapts AIMD style: +increase after a fast success,
+    x decrease after an error, a 429/503 or a response slower than target_latency.
+    rates: starting rate per site, e.g. {"eprel.ec.europa.eu": 0.5}
+    """
+
+    THROTTLED_STATUS = (429, 503)
+
+    def __init__(self, rate: float = 2.0, burst: int = 4, min_rate: float = 0.2, max_rate: float = 20,
+                 increase: float = 0.2, decrease: float = 0.5, target_latency: float = 10.0, rates: dict = None):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.target_latency = target_latency
+        self.rates = dict(rates or {})
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, url: str) -> float:
+        """
+        Block until the site of url has a token. Returns the seconds waited.
+        """
+        domain = self.domain(url)
+        waited = 0.0
+        while True:
+            with self._bucket_of(domain) as bucket:
+                now = time.time()
+                bucket["tokens"] = min(self.burst, bucket["tokens"] + (now - bucket["stamp"]) * bucket["rate"])
+                bucket["stamp"] = now
+                if bucket["tokens"] >= 1:
+                    bucket["tokens"] -= 1
+                    return waited
+                delay = (1 - bucket["tokens"]) / bucket["rate"]
+            time.sleep(delay)
+            waited += delay
+
+    def feedback(self, url: str, latency: float, ok: bool = True, status: int = None) -> None:
+        domain = self.domain(url)
+        throttled = status in self.THROTTLED_STATUS
+        with self._bucket_of(domain) as bucket:
+            if throttled or not ok or latency > self.target_latency:
+                # 동시에 실패한 요청들이 한꺼번에 속도를 0으로 만들지 않도록 감소는 1초에 한 번만
+                if time.time() - bucket["decreased"] >= 1:
+                    bucket["rate"] = max(self.min_rate, bucket["rate"] * self.decrease)
+                    bucket["decreased"] = time.time()
+                    logging.info(f"rate limit {domain}: {bucket['rate']:.2f}/s (latency {latency:.1f}s, status {status}, ok {ok})")
+            else:
+                bucket["rate"] = min(self.max_rate, bucket["rate"] + self.increase)
+
+    def report(self) -> dict:
+        with self._lock:
+            return {domain: round(bucket["rate"], 2) for domain, bucket in self._buckets.items()}
+
+    @staticmethod
+    def domain(url: str) -> str:
+        """
+        electronics.sony.com -> sony.com, www.lg.com -> lg.com, www.samsung.co.kr -> samsung.co.kr
+        """
+        host = urlparse(url).netloc.split(":")[0].lower()
+        labels = host.split(".")
+        keep = 3 if len(labels) >= 3 and len(labels[-1]) == 2 and labels[-2] in ("co", "com", "or", "ne", "go", "ac") else 2
+        return ".".join(labels[-keep:])
+
+    @contextmanager
+    def _bucket_of(self, domain: str):
+        with self._lock:
+            yield self._bucket(domain)
+
+    def _bucket(self, domain: str) -> dict:
+        if domain not in self._buckets:
+            self._buckets[domain] = self._new_bucket(domain)
+        return self._buckets[domain]
+
+    def _new_bucket(self, domain: str) -> dict:
+        return {"rate": self.rates.get(domain, self.rate), "tokens": self.burst, "stamp": time.time(), "decreased": 0.0}
+
+
+class SharedRateLimiter(DomainRateLimiter):
+    """
+    DomainRateLimiter whose buckets live in a SQLite file (the work queue database),
+    so the worker processes of a queue draw from one budget per site instead of each taking the full rate.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS rate_buckets (
+            domain TEXT PRIMARY KEY,
+            rate REAL NOT NULL,
+            tokens REAL NOT NULL,
+            stamp REAL NOT NULL,
+            decreased REAL NOT NULL
+        )
+    """
+
+    def __init__(self, path: str, **kwargs):
+        super().__init__(**kwargs)
+        self.path = str(path)
+        with closing(self._connect()) as connection, connection:
+            connection.execute(self._SCHEMA)
+
+    @classmethod
+    def like(cls, limiter: DomainRateLimiter, path: str) -> "SharedRateLimiter":
+        """
+        A shared limiter with the settings of limiter, e.g. RATE_LIMITER.
+        """
+        return cls(path, rate=limiter.rate, burst=limiter.burst, min_rate=limiter.min_rate, max_rate=limiter.max_rate,
+                   increase=limiter.increase, decrease=limiter.decrease, target_latency=limiter.target_latency,
+                   rates=limiter.rates)
+
+    def report(self) -> dict:
+        with closing(self._connect()) as connection:
+            return {domain: round(rate, 2) for domain, rate in connection.execute("SELECT domain, rate FROM rate_buckets")}
+
+    @contextmanager
+    def _bucket_of(self, domain: str):
+        with self._lock, closing(self._connect()) as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            stored = connection.execute("SELECT rate, tokens, stamp, decreased FROM rate_buckets WHERE domain = ?",
+                                        (domain,)).fetchone()
+            bucket = dict(zip(("rate", "tokens", "stamp", "decreased"), stored)) if stored else self._new_bucket(domain)
+            yield bucket
+            connection.execute("INSERT OR REPLACE INTO rate_buckets (domain, rate, tokens, stamp, decreased) VALUES (?, ?, ?, ?, ?)",
+                               (domain, bucket["rate"], bucket["tokens"], bucket["stamp"], bucket["decreased"]))
+            connection.commit()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+
+# 프로세스 안의 모든 스크레이퍼가 사이트별 속도를 공유한다
+RATE_LIMITER = DomainRateLimiter(rates={"europa.eu": 0.5, "rtings.com": 1.0})
@@ -0,0 +1,87 @@
+import logging
+import threading
+from fnmatch import fnmatch
+from market_research.scraper._driver_pool import execute_cdp
+
+
+class ResourcePolicy:
+    """
+    Resources a scraping browser does not need to read the DOM text.
+    block_types: keys of TYPE_PATTERNS ("image", "media", "font", "analytics")
+    block_patterns: extra url patterns, e.g. "*youtube.com/embed*"
+    allow_patterns: assets needed to render. Chrome cannot express exceptions to a blocked pattern,
+    so any block pattern that would also match an allowed asset is not installed.
+    """
+
+    TYPE_PATTERNS = {
+        "image": ["*.jpg*", "*.jpeg*", "*.png*", "*.gif*", "*.webp*", "*.avif*", "*.svg*", "*.ico*"],
+        "media": ["*.mp4*", "*.webm*", "*.m3u8*", "*.mp3*", "*youtube.com/embed*", "*player.vimeo.com*"],
+        "font": ["*.woff*", "*.woff2*", "*.ttf*", "*.otf*", "*.eot*"],
+        "analytics": ["*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+                      "*facebook.net*", "*hotjar.com*", "*demdex.net*", "*omtrdc.net*",
+                      "*quantummetric.com*", "*criteo.com*", "*bat.bing.com*", "*analytics.tiktok.com*"],
+    }
+
+    _METRICS_JS = """
+        var nav = performance.getEntriesByType('navigation')[0];
+        var bytes = nav ? nav.transferSize : 0;
+        performance.getEntriesByType('resource').forEach(function (entry) { bytes += entry.transferSize; });
+        return {bytes: bytes, load_ms: nav ? nav.loadEventEnd : 0, requests: performance.getEntriesByType('resource').length};
+    """
+
+    def __init__(self, block_types: list = None, block_patterns: list = None, allow_patterns: list = None):
+        self.block_types = block_types if block_types is not None else ["image", "media", "font", "analytics"]
+        self.block_patterns = block_patterns or []
+        self.allow_patterns = allow_patterns or []
+        self._warned = False
+        self._lock = threading.Lock()
+
+    def blocked_urls(self) -> list:
+        patterns = []
+        for block_type in self.block_types:
+            patterns.extend(self.TYPE_PATTERNS.get(block_type, []))
+        patterns.extend(self.block_patterns)
+        return [pattern for pattern in dict.fromkeys(patterns)
+                if not any(fnmatch(allowed, pattern) for allowed in self.allow_patterns)]
+
+    def apply(self, driver) -> bool:
+        """
+        Install the block list on a new session, through the remote CDP endpoint on a Remote session.
+        Returns False when the session has no CDP at all; pages then load every resource.
+        """
+        try:
+            execute_cdp(driver, "Network.enable", {})
+            execute_cdp(driver, "Network.setBlockedURLs", {"urls": self.blocked_urls()})
+            return True
+        except Exception as e:
+            with self._lock:
+                warned, self._warned = self._warned, True
+            if not warned:
+                logging.warning(f"resource policy needs CDP, loading every resource: {e}")
+            return False
+
+    def measure(self, driver, url: str) -> dict:
+        """
+        Load url once without and once with the policy (browser cache disabled) and compare.
+        Cross-origin resources without Timing-Allow-Origin report 0 bytes, so bytes are a lower bound.
+        """
+        def load(blocked_urls):
+            execute_cdp(driver, "Network.setBlockedURLs", {"urls": blocked_urls})
+            driver.get(url)
+            return driver.execute_script(self._METRICS_JS)
+
+        execute_cdp(driver, "Network.enable", {})
+        execute_cdp(driver, "Network.setCacheDisabled", {"cacheDisabled": True})
+        try:
+            full = load([])
+            blocked = load(self.blocked_urls())
+        finally:
+            execute_cdp(driver, "Network.setCacheDisabled", {"cacheDisabled": False})
+        return {"url": url,
+                "bytes_full": full["bytes"],
+                "bytes_blocked": blocked["bytes"],
+                "bytes_saved": full["bytes"] - blocked["bytes"],
+                "requests_saved": full["requests"] - blocked["requests"],
+                "load_ms_full": round(full["load_ms"]),
+                "load_ms_blocked": round(blocked["load_ms"]),
+                "load_ms_saved": round(full["load_ms"] - blocked["load_ms"])}
@@ -0,0 +1,154 @@
+import asyncio
+import random
+import threading
+import time
+import logging
+from collections import deque
+from urllib.parse import urlparse
+from selenium.common.exceptions import InvalidArgumentException
+
+
+class RetryExhausted(Exception):
+    """
+    Raised when a call failed on every attempt (or the retry budget ran out); the last error is chained.
+    """
+
+
+class CircuitOpen(RetryExhausted):
+    """
+    Raised without calling when the domain failed too often in a row; callers skip the page.
+    """
+
+
+class RetryPolicy:
+    """
+    Retries a call with exponential backoff and full jitter.
+    retryable: exceptions worth another attempt; fatal: exceptions raised at once (checked first)
+    budget: retries allowed over the whole run, shared by every call of this policy
+    breaker_threshold: failed attempts in a row that open a domain's circuit for breaker_cooldown seconds
+    """
+
+    def __init__(self, attempts: int = 3, base_delay: float = 1, max_delay: float = 30,
+                 retryable: tuple = (Exception,), fatal: tuple = (InvalidArgumentException,),
+                 budget: int = 200, breaker_threshold: int = 8, breaker_cooldown: float = 300):
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retryable = retryable
+        self.fatal = tuple(fatal) + (CircuitOpen,)
+        self.budget = budget
+        self.breaker_threshold = breaker_threshold
+        self.breaker_cooldown = breaker_cooldown
+        self.history = deque(maxlen=5000)  # 시도별 기록: func, domain, attempt, sec, error
+        self._failures = {}
+        self._opened = {}
+        self._lock = threading.Lock()
+
+    def call(self, func, *args, attempts: int = None, domain: str = None, **kwargs):
+        attempts = attempts or self.attempts
+        domain = domain or self._domain(args, kwargs)
+        name = getattr(func, "__qualname__", str(func))
+        self._check_circuit(domain)
+        for attempt in range(1, attempts + 1):
+            start = time.time()
+            try:
+                result = func(*args, **kwargs)
+            except self.fatal:
+                self._record(name, domain, attempt, start, "fatal")
+                raise
+            except self.retryable as e:
+                time.sleep(self._backoff(name, domain, attempt, attempts, start, e))
+                continue
+            self._record(name, domain, attempt, start, None)
+            return result
+
+    async def call_async(self, func, *args, attempts: int = None, domain: str = None, **kwargs):
+        """
+        call for a coroutine function, waiting out the backoff with asyncio.sleep.
+        """
+        attempts = attempts or self.attempts
+        domain = domain or self._domain(args, kwargs)
+        name = getattr(func, "__qualname__", str(func))
+        self._check_circuit(domain)
+        for attempt in range(1, attempts + 1):
+            start = time.time()
+            try:
+                result = await func(*args, **kwargs)
+            except self.fatal:
+                self._record(name, domain, attempt, start, "fatal")
+                raise
+            except self.retryable as e:
+                await asyncio.sleep(self._backoff(name, domain, attempt, attempts, start, e))
+                continue
+            self._record(name, domain, attempt, start, None)
+            return result
+
+    def _backoff(self, name: str, domain: str, attempt: int, attempts: int, start: float, e: Exception) -> float:
+        """
+        Seconds to wait before the next attempt; raises when there is none.
+        """
+        self._record(name, domain, attempt, start, f"{type(e).__name__}: {e}")
+        if self._failed(domain):
+            raise CircuitOpen(f"circuit opened for {domain} after {name}") from e
+        if attempt == attempts:
+            raise RetryExhausted(f"{name} failed after {attempts} attempts: {e}") from e
+        if not self._spend():
+            raise RetryExhausted(f"retry budget exhausted at {name}: {e}") from e
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+        logging.info(f"retry {name} ({attempt}/{attempts}) in {delay:.1f}s: {e}")
+        return delay
+
+    def report(self) -> dict:
+        with self._lock:
+            history = list(self.history)
+            opened = [domain for domain, until in self._opened.items() if until > time.time()]
+        failed = [entry for entry in history if entry["error"]]
+        return {"attempts": len(history),
+                "failed_attempts": len(failed),
+                "failed_sec": round(sum(entry["sec"] for entry in failed), 1),
+                "budget_left": self.budget,
+                "open_circuits": opened}
+
+    def _check_circuit(self, domain: str) -> None:
+        with self._lock:
+            until = self._opened.get(domain)
+            if until is None:
+                return None
+            if until > time.time():
+                raise CircuitOpen(f"circuit open for {domain} ({until - time.time():.0f}s left)")
+            # half-open: 한 번의 실패로 다시 열리도록 한 칸만 남겨둔다
+            self._opened.pop(domain)
+            self._failures[domain] = self.breaker_threshold - 1
+
+    def _failed(self, domain: str) -> bool:
+        with self._lock:
+            self._failures[domain] = self._failures.get(domain, 0) + 1
+            if self._failures[domain] < self.breaker_threshold:
+                return False
+            self._opened[domain] = time.time() + self.breaker_cooldown
+            self._failures[domain] = 0
+        logging.warning(f"circuit opened for {domain} for {self.breaker_cooldown}s")
+        return True
+
+    def _spend(self) -> bool:
+        with self._lock:
+            if self.budget <= 0:
+                return False
+            self.budget -= 1
+            return True
+
+    def _record(self, name: str, domain: str, attempt: int, start: float, error) -> None:
+        elapsed = time.time() - start
+        with self._lock:
+            self.history.append({"func": name, "domain": domain, "attempt": attempt,
+                                 "sec": round(elapsed, 2), "error": error})
+            if error is None:
+                self._failures[domain] = 0
+        logging.debug(f"{name} attempt {attempt} on {domain}: {elapsed:.2f}s {error or 'ok'}")
+
+    @staticmethod
+    def _domain(args, kwargs) -> str:
+        for value in list(kwargs.values()) + list(args):
+            if isinstance(value, str) and "://" in value:
+                return urlparse(value).netloc
+        return ""
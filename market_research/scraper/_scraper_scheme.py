@@ -1,11 +1,48 @@
 from abc import ABC, abstractmethod
 import pandas as pd
 from pathlib import Path
-from datetime import date
-from tools.web import WebDriver
+from datetime import date, datetime
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from tqdm import tqdm
+from bs4 import BeautifulSoup
+from market_research.scraper._driver_pool import DriverPool, LocalWebDriver
+from market_research.scraper._waiter import Waiter
+from market_research.scraper._watchdog import DriverWatchdog
+from market_research.scraper._retry_policy import RetryPolicy
+from market_research.scraper._rate_limiter import RATE_LIMITER, SharedRateLimiter
+from market_research.scraper._async_backend import AsyncBrowser
+from market_research.scraper._work_queue import WorkQueue
+from market_research.scraper._page_cache import PageCache, CacheMiss, canonical_url
+from market_research.scraper._tiered_fetcher import StaticPage, TierMemory
+from market_research.scraper._url_frontier import UrlFrontier
+from market_research.scraper._checkpoint import Checkpoint
+from market_research.scraper._fingerprints import FingerprintStore
+from market_research.scraper._telemetry import Telemetry, METRICS, save_report
+from selenium.common.exceptions import InvalidArgumentException
+import requests
+from market_research._http import HTTP
+import asyncio
+import os
+import functools
+import threading
+import time
 import logging
 
 class Scraper(ABC):
+    navigation_hook = None  # NavigationHook, 사이트별 팝업/동의 배너 억제
+    resource_policy = None  # ResourcePolicy, 사이트별 이미지/영상/폰트/분석 스크립트 차단
+    rate_limiter = RATE_LIMITER  # 모든 워커가 공유하는 사이트별 요청 속도
+    blocked_titles = ("Access Denied", "Too Many Requests", "Request Rejected")
+    http_headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36",
+                    "Accept-Language": "en-US,en;q=0.9"}
+    sitemap = None  # SitemapSource, 시리즈 페이지를 스크롤하지 않고 사이트맵에서 모델 url 을 찾는다
+    sitemap_coverage = 0.9  # 지난 실행에서 방문한 url 중 사이트맵에 있어야 하는 비율
+    fingerprint_locators = ()  # 가격/스펙 블록, 바뀌지 않은 모델은 이전 행을 그대로 쓴다
+    fingerprint_prefetch = False  # True: 브라우저로 여는 제조사도 지문용 HTTP 요청을 따로 보낸다 (대부분 그대로일 때만 이득)
+    snapshot_mode = True  # 스크롤 단계마다 page_source 스냅샷을 파싱, False: 단계마다 execute_script 로 읽는다
+    async_backend = False  # True: extract_rows 가 _extract_row_async(page, url) 로 AsyncBrowser 에서 수집
+    max_contexts = 24
 
     def __init__(self, enable_headless=True, export_prefix:str="scraper", intput_folder_path :str= "input", output_folder_path:str="results"):
         """
@@ -15,12 +52,444 @@ class Scraper(ABC):
         output_folder_path="results"
         """
         self.intput_folder:Path
-        self.output_folder:Path
+        self.output_folder:Path = None
         self.output_xlsx_name = None
+        self.export_prefix = export_prefix
         self._initialize_data_paths(export_prefix=export_prefix, intput_folder_path=intput_folder_path, output_folder_path=output_folder_path)
-        self.web_driver = WebDriver(headless=enable_headless)
+        self.web_driver = LocalWebDriver(headless=enable_headless)
+        self.driver_pool = DriverPool(self.web_driver, on_launch=self._prepare_session)
+        self.driver_pool.watchdog = DriverWatchdog(self.driver_pool)
+        self.waiter = Waiter()
+        self.retry_policy = RetryPolicy(fatal=(InvalidArgumentException, CustomException, CacheMiss))
+        self.page_cache = PageCache.from_env()  # MKRETV_CACHE / MKRETV_CACHE_MODE=offline
+        self._visits = {}
+        self.tier_memory = TierMemory(self.output_folder / "fetch_tiers.json" if output_folder_path is not None else None)
+        self.frontier = UrlFrontier(self.output_folder / f"{export_prefix}_frontier.json" if output_folder_path is not None else None)
+        self.checkpoint = Checkpoint(self.output_folder / f"{export_prefix}_checkpoint.jsonl" if output_folder_path is not None else None)
+        self.fingerprints = FingerprintStore(self.output_folder / f"{export_prefix}_fingerprints.json" if output_folder_path is not None else None)
+        self.telemetry = Telemetry(type(self).__name__)
+        METRICS.track(self.telemetry)  # /metrics 는 실행 중에도 이 값을 읽는다
         logging.info("initialized web driver")
         self.wait_time = 1
+        self.max_per_domain = 4
+        self.max_requeue = 2
+        # MKRETV_QUEUE 가 있으면 extract_rows 가 url 을 큐에 올리고 워커 프로세스들과 나눠 처리
+        self.work_queue = WorkQueue(os.environ["MKRETV_QUEUE"]) if os.getenv("MKRETV_QUEUE") else None
+        if self.work_queue is not None:
+            self.rate_limiter = SharedRateLimiter.like(self.rate_limiter, self.work_queue.path)
+        self.discovery = os.getenv("MKRETV_DISCOVERY", "sitemap")  # "crawl": 항상 시리즈 페이지를 스크롤
+        self.failed_urls = {}
+        self._domain_slots = {}
+        self._domain_lock = threading.Lock()
+
+    def set_driver(self, url, stage: str = "page"):
+        """
+        Browser session of the pool, navigated to url.
+        stage names the visit ("details", "specs", ...): page_cache keeps one snapshot per url and stage,
+        because the same url is opened at several stages of a model.
+        """
+        driver = self.driver_pool.lease()
+        if self.page_cache is not None and self.page_cache.offline:
+            try:
+                self.page_cache.replay(driver, self.page_cache.snapshot(url, stage))
+            except Exception:
+                self.release_driver(driver)
+                raise
+            return driver
+        hooked = self.navigation_hook is None or self.navigation_hook.apply(driver)
+        self.navigate(driver, url)
+        if not hooked:
+            self.navigation_hook.inject(driver)
+        self.wait(driver, until="network")
+        if self.page_cache is not None:
+            with self._domain_lock:
+                self._visits[driver] = (url, stage)
+        return driver
+
+    def discover_from_sitemap(self) -> bool:
+        """
+        Add the model urls of the maker's sitemap to the frontier, instead of crawling the series pages.
+        Returns False (nothing added) when the series pages must be crawled: no sitemap, discovery="crawl",
+        fewer than sitemap.min_urls, or less than sitemap_coverage of the urls the previous run visited.
+        """
+        if self.sitemap is None or self.discovery != "sitemap":
+            return False
+        with self.telemetry.stage("sitemap"):
+            model_urls = self.sitemap.discover(self.http_get)
+        previous = self.frontier.last_run()
+        covered = len(previous & {canonical_url(url) for url in model_urls}) / len(previous) if previous else 1.0
+        print(f"sitemap: {len(model_urls)} models, {covered:.0%} of the previous run")
+        logging.info(f"sitemap: {len(model_urls)} models, {covered:.0%} of the previous run")
+        if len(model_urls) < self.sitemap.min_urls or covered < self.sitemap_coverage:
+            print("sitemap misses models, crawling series pages")
+            logging.warning("sitemap misses models, crawling series pages")
+            return False
+        self.frontier.add_all(model_urls)
+        return True
+
+    def open_page(self, url: str, required: list = (), stage: str = "page"):
+        """
+        Cheapest page that has the required locators, e.g. [(By.CLASS_NAME, "product-info")]:
+        a StaticPage fetched over HTTP when it validates, otherwise a browser session from set_driver.
+        Both answer find_element(s)/page_source; release either with release_driver.
+        The tier that worked is remembered per url pattern (tier_memory); stage is passed on to set_driver.
+        """
+        if self.tier_memory.tier(url) == "http":
+            try:
+                response = self.http_get(url)
+                page = StaticPage(response.text, url)
+                if response.ok and page.has(required):
+                    self.tier_memory.record(url, http_ok=True)
+                    return page
+            except CacheMiss:
+                return self.set_driver(url, stage=stage)  # 오프라인: 브라우저 스냅샷으로 재생
+            except Exception as e:
+                logging.debug(f"http tier failed for {url}: {e}")
+            self.tier_memory.record(url, http_ok=False)
+            logging.info(f"escalate to browser: {TierMemory.pattern(url)}")
+        return self.set_driver(url, stage=stage)
+
+    def page_fingerprint(self, url: str, response=None):
+        """
+        Hash of the fingerprint_locators blocks of url, fetched over HTTP without a browser (or read from response).
+        None (always extract) when the maker has no locators or the static page lacks one of them.
+        """
+        if not self.fingerprint_locators:
+            return None
+        try:
+            response = response if response is not None else self.http_get(url)
+            page = StaticPage(response.text, url)
+            if not (response.ok and page.has(self.fingerprint_locators)):
+                return None
+            return FingerprintStore.digest([element.get_attribute("outerHTML")
+                                            for by, value in self.fingerprint_locators
+                                            for element in page.find_elements(by, value)])
+        except Exception as e:
+            logging.debug(f"no fingerprint for {url}: {e}")
+            return None
+
+    def scroll_distance_total(self, driver) -> int:
+        """
+        Page height for scrolling loops; a StaticPage is already complete, so its loop runs once.
+        """
+        if isinstance(driver, StaticPage):
+            return 1
+        return self.web_driver.get_scroll_distance_total()
+
+    def navigate(self, driver, url: str) -> None:
+        """
+        driver.get throttled by rate_limiter; load time and block pages are fed back to it.
+        """
+        self.rate_limiter.acquire(url)
+        start = time.time()
+        try:
+            driver.get(url)
+        except Exception:
+            self.rate_limiter.feedback(url, time.time() - start, ok=False)
+            raise
+        try:
+            blocked = any(title in driver.title for title in self.blocked_titles)
+        except Exception:
+            blocked = False
+        self.rate_limiter.feedback(url, time.time() - start, status=429 if blocked else None)
+        self.telemetry.count("pages_browser")
+        try:
+            self.telemetry.count("bytes", driver.execute_script(
+                "const nav = performance.getEntriesByType('navigation')[0]; return nav ? nav.transferSize : 0;") or 0)
+        except Exception:
+            pass
+
+    def http_get(self, url: str, **kwargs) -> requests.Response:
+        """
+        requests.get throttled by rate_limiter. With page_cache the stored copy is revalidated
+        (If-None-Match/If-Modified-Since) and served on 304, or served without network when offline.
+        A 304 without a stored copy is a miss: the page is fetched again without the conditional headers.
+        """
+        if self.page_cache is not None and self.page_cache.offline:
+            return self.page_cache.response(url)
+        kwargs.setdefault("timeout", 30)
+        kwargs.setdefault("headers", self.http_headers)
+        if self.page_cache is None:
+            return self._fetch(url, **kwargs)
+        response = self._fetch(url, **dict(kwargs, headers=dict(self.page_cache.conditional_headers(url), **kwargs["headers"])))
+        try:
+            return self.page_cache.response(url, fresh=response)
+        except CacheMiss:
+            # 저장본이 사라졌거나(다른 작업자, 쓰기 실패) 조건부 헤더를 호출한 쪽이 넣은 경우
+            headers = {key: value for key, value in kwargs["headers"].items()
+                       if key.lower() not in ("if-none-match", "if-modified-since")}
+            return self.page_cache.response(url, fresh=self._fetch(url, **dict(kwargs, headers=headers)))
+
+    def _fetch(self, url: str, **kwargs) -> requests.Response:
+        self.rate_limiter.acquire(url)
+        start = time.time()
+        try:
+            response = HTTP.get(url, **kwargs)
+        except Exception:
+            self.rate_limiter.feedback(url, time.time() - start, ok=False)
+            raise
+        self.rate_limiter.feedback(url, time.time() - start, ok=response.status_code < 500, status=response.status_code)
+        self.telemetry.count("pages_http")
+        self.telemetry.count("bytes", int(response.headers.get("Content-Length", 0)) if kwargs.get("stream") else len(response.content))
+        return response
+
+    def wait(self, driver, until: str = "dom", locator: tuple = None, timeout: float = None) -> bool:
+        """
+        Wait for a page condition instead of sleeping for wait_time.
+        until: "dom" (no DOM mutation for a moment), "network" (no new resource requests),
+        "element" (locator is present).
+        timeout is the ceiling, by default the fixed sleep the wait replaces.
+        """
+        if isinstance(driver, StaticPage):
+            return True
+        timeout = self.wait_time if timeout is None else timeout
+        if until == "element":
+            return self.waiter.for_element(driver, locator, timeout)
+        if until == "network":
+            return self.waiter.for_network_idle(driver, timeout)
+        return self.waiter.for_dom_quiet(driver, timeout)
+
+    def report_waits(self) -> dict:
+        report = self.waiter.report()
+        print(f"waits: {report}")
+        logging.info(f"waits: {report}")
+        return report
+
+    def report_rates(self) -> dict:
+        report = self.rate_limiter.report()
+        print(f"rates: {report}")
+        logging.info(f"rates: {report}")
+        return report
+
+    def report_cache(self) -> dict:
+        report = self.page_cache.report() if self.page_cache is not None else {}
+        print(f"cache: {report}")
+        logging.info(f"cache: {report}")
+        return report
+
+    def report_tiers(self) -> dict:
+        report = self.tier_memory.report()
+        print(f"tiers: {report}")
+        logging.info(f"tiers: {report}")
+        return report
+
+    def report_fingerprints(self) -> dict:
+        report = self.fingerprints.report()
+        print(f"fingerprints: {report}")
+        logging.info(f"fingerprints: {report}")
+        return report
+
+    def report_run(self) -> dict:
+        """
+        Stage timers and counters of this run, written to results/<export_prefix>_run_<date_time>.json
+        (only published without output_folder) and published for the /metrics endpoint.
+        """
+        retries = self.retry_policy.report()
+        self.telemetry.counters.update({"browser_launches": self.driver_pool.launches,
+                                        "retries": retries["failed_attempts"],
+                                        "failures": len(self.failed_urls)})
+        report = self.telemetry.report(retries=retries, failed_urls=self.failed_urls)
+        METRICS.publish(report)
+        if self.output_folder is None:
+            return report
+        path = self.output_folder / f"{self.export_prefix}_run_{datetime.now().strftime('%Y-%m-%d_%H%M')}.json"
+        save_report(report, path)
+        print(f"run report: {path}")
+        logging.info(f"run report: {path}")
+        return report
+
+    def report_retries(self) -> dict:
+        report = self.retry_policy.report()
+        print(f"retries: {report}")
+        logging.info(f"retries: {report}")
+        return report
+
+    def _prepare_session(self, driver) -> None:
+        if self.resource_policy is not None:
+            self.resource_policy.apply(driver)
+
+    def measure_resource_policy(self, urls: list) -> pd.DataFrame:
+        """
+        Compare bytes and load time of each url with and without resource_policy.
+        """
+        if self.resource_policy is None:
+            raise CustomException(f"{type(self).__name__} has no resource policy")
+        results = []
+        driver = self.driver_pool.lease()
+        try:
+            for url in tqdm(urls):
+                try:
+                    results.append(self.resource_policy.measure(driver, url))
+                except Exception as e:
+                    logging.error(f"fail to measure {url}: {e}")
+        finally:
+            self.driver_pool.discard(driver)  # 측정 중 바뀐 차단 설정을 다음 리스에 넘기지 않는다
+        df_results = pd.DataFrame(results)
+        if not df_results.empty:
+            summary = df_results[["bytes_saved", "requests_saved", "load_ms_saved"]].sum()
+            print(f"{type(self).__name__}: {summary['bytes_saved'] / 1e6:.1f} MB, "
+                  f"{summary['requests_saved']} requests, {summary['load_ms_saved'] / 1000:.1f} s saved over {len(df_results)} pages")
+        return df_results
+
+    def release_driver(self, driver) -> None:
+        """
+        Return the session to the pool instead of quitting chrome.
+        With page_cache the final page (after clicks/scrolls) is kept for offline replay.
+        """
+        with self._domain_lock:
+            visit = self._visits.pop(driver, None)
+        if visit is not None:
+            try:
+                self.page_cache.store_snapshot(*visit, driver.page_source)
+            except Exception as e:
+                logging.debug(f"fail to store snapshot of {visit[0]}: {e}")
+        self.driver_pool.release(driver)
+
+    def close_drivers(self) -> None:
+        self.driver_pool.close()
+        self.tier_memory.save()
+        self.frontier.save()
+        self.fingerprints.save()
+
+    def extract_rows(self, url_dict: dict, extract_row, workers: int = 1, resume: bool = False) -> dict:
+        """
+        Fill one row per url with extract_row(url, row) and return the rows keyed like url_dict.
+        workers > 1 visits the urls concurrently, at most max_per_domain at a time per site.
+        A url that raises keeps what was already written to its row and is reported in failed_urls.
+        A url whose session was recycled by the watchdog is requeued up to max_requeue times.
+        With async_backend (and playwright installed) the rows are filled by _extract_row_async instead.
+        With work_queue the urls are published and shared with worker processes (see _work_queue.py).
+        Collected urls are marked visited in the frontier.
+        Each finished row is appended to checkpoint; resume=True skips the urls it already holds
+        (the returned rows then cover only the urls visited now, read checkpoint.rows(url_dict.values()) for all).
+        """
+        self.failed_urls = {}
+        if resume:
+            done = self.checkpoint.done()
+            url_dict = {key: url for key, url in url_dict.items() if canonical_url(url) not in done}
+            print(f"resume: {len(done)} models in {self.checkpoint.path}, {len(url_dict)} to go")
+            logging.info(f"resume: {len(done)} models in {self.checkpoint.path}, {len(url_dict)} to go")
+        else:
+            self.checkpoint.reset()
+        dict_rows = {key: {} for key in url_dict}
+
+        def run(key, url):
+            self.driver_pool.take_recycled()
+            for cnt_requeue in range(self.max_requeue + 1):
+                try:
+                    with self._domain_slot(url):
+                        extract_row(url, dict_rows[key])
+                    self.checkpoint.append(url, dict_rows[key])
+                    return None
+                except Exception as e:
+                    if self.driver_pool.take_recycled() and cnt_requeue < self.max_requeue:
+                        logging.info(f"requeue {url}: chrome session was recycled")
+                        dict_rows[key].clear()
+                        continue
+                    self.failed_urls[url] = f"{type(e).__name__}: {e}"
+                    logging.error(f"fail to collect: {url} ({e})")
+                    self.checkpoint.append(url, dict_rows[key], ok=False)
+                    return None
+
+        if self.work_queue is not None:
+            return self._mark_visited(url_dict, self._extract_rows_distributed(url_dict))
+
+        if self.async_backend and AsyncBrowser.available():
+            try:
+                return self._mark_visited(url_dict, self._run_async(self._extract_rows_async(url_dict, workers)))
+            except Exception as e:
+                print(f"async backend unavailable, using selenium: {e}")
+                logging.warning(f"async backend unavailable, using selenium: {e}")
+                self.failed_urls = {}
+
+        if workers <= 1:
+            for key, url in tqdm(url_dict.items()):
+                run(key, url)
+        else:
+            self.driver_pool.max_idle = max(self.driver_pool.max_idle, workers)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(run, key, url) for key, url in url_dict.items()]
+                for _ in tqdm(as_completed(futures), total=len(futures)):
+                    pass
+        self._report_failures()
+        return self._mark_visited(url_dict, dict_rows)
+
+    def _mark_visited(self, url_dict: dict, dict_rows: dict) -> dict:
+        self.frontier.mark_visited(url for url in url_dict.values() if url not in self.failed_urls)
+        return dict_rows
+
+    async def _extract_rows_async(self, url_dict: dict, workers: int = 1) -> dict:
+        """
+        extract_rows on AsyncBrowser: one chromium, at most workers (and max_per_domain, max_contexts) pages at once,
+        each row filled by _extract_row_on, i.e. _extract_row with the page read by the coroutine _extract_row_async(page, url).
+        """
+        dict_rows = {key: {} for key in url_dict}
+        max_contexts = max(1, min(self.max_contexts, workers, self.max_per_domain))
+        browser = AsyncBrowser(headless=self.web_driver.headless, max_contexts=max_contexts,
+                               navigation_hook=self.navigation_hook, resource_policy=self.resource_policy,
+                               rate_limiter=self.rate_limiter)
+        async with browser:
+            async def run(key, url):
+                try:
+                    await self._extract_row_on(browser, url, dict_rows[key])
+                    self.checkpoint.append(url, dict_rows[key])
+                except Exception as e:
+                    self.failed_urls[url] = f"{type(e).__name__}: {e}"
+                    logging.error(f"fail to collect: {url} ({e})")
+                    self.checkpoint.append(url, dict_rows[key], ok=False)
+
+            tasks = [run(key, url) for key, url in url_dict.items()]
+            for task in tqdm(asyncio.as_completed(tasks), total=len(tasks)):
+                await task
+        self._report_failures()
+        return dict_rows
+
+    def _extract_rows_distributed(self, url_dict: dict) -> dict:
+        """
+        Coordinator side of the work queue: publish, take part in the extraction, and wait for the other workers.
+        """
+        maker = type(self).__name__
+        # 실행마다 새 job: 같은 날 다시 돌려도 이전 실행의 done/failed 를 이어받지 않는다 (resume 은 checkpoint 가 맡는다)
+        job = f"{maker}:{self.export_prefix}:{datetime.fromtimestamp(self.telemetry.started):%Y%m%d_%H%M%S}"
+        self.work_queue.publish(job, maker, url_dict)
+        with tqdm(total=len(url_dict)) as bar:
+            while True:
+                self.work_queue.consume(self, job=job)  # 남은 url 과 만료된 리스를 코디네이터도 처리
+                progress = self.work_queue.progress(job)
+                bar.n = progress["done"] + progress["failed"]
+                bar.refresh()
+                if progress["pending"] + progress["leased"] == 0:
+                    break
+                time.sleep(self.work_queue.poll)
+        rows, failed_urls = self.work_queue.results(job)
+        self.failed_urls = {url: error for url, error in failed_urls.items() if url in url_dict.values()}
+        self._report_failures()
+        for url in url_dict.values():
+            self.checkpoint.append(url, rows.get(url, {}), ok=url not in self.failed_urls)
+        return {key: rows.get(url, {}) for key, url in url_dict.items()}
+
+    @staticmethod
+    def _run_async(coroutine):
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+        # FastAPI 처럼 이미 이벤트 루프 안에서 호출되면 별도 스레드에서 실행
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coroutine).result()
+
+    def _report_failures(self) -> None:
+        if self.failed_urls:
+            print(f"failed URL: {len(self.failed_urls)}")
+            for url, error in self.failed_urls.items():
+                print(f"  {url}: {error}")
+
+    def _domain_slot(self, url: str) -> threading.BoundedSemaphore:
+        domain = urlparse(url).netloc
+        with self._domain_lock:
+            if domain not in self._domain_slots:
+                self._domain_slots[domain] = threading.BoundedSemaphore(self.max_per_domain)
+            return self._domain_slots[domain]
 
     def _initialize_data_paths(self,export_prefix:str=None, intput_folder_path:str=None, output_folder_path:str=None):
         if intput_folder_path is not None:
@@ -40,26 +509,180 @@ class Scraper(ABC):
             
               
     @staticmethod
-    def try_loop(try_total):
+    def retry(attempts: int = None):
+        """
+        Run the method through self.retry_policy: backoff with jitter, shared retry budget, per-domain circuit breaker.
+        Raises RetryExhausted instead of returning None when every attempt failed.
+        """
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(self, *args, **kwargs):
+                return self.retry_policy.call(func, self, *args, attempts=attempts, **kwargs)
+            return wrapper
+        return decorator
+
+    @staticmethod
+    def stage(name: str):
+        """
+        Time the method as a pipeline stage in self.telemetry (put it above Scraper.retry to time the retries too).
+        """
         def decorator(func):
-            def wrapper(*args, **kwargs):
-                for cnt_try in range(try_total):
-                    try:
-                        return func(*args, **kwargs)  # 인스턴스 메서드 여부와 관계없이 호출
-                    except Exception as e:
-                        if cnt_try + 1 == try_total:
-                            print(f"Error after {try_total} attempts: {e}")
-                        continue  # 다음 시도로 넘어감
+            @functools.wraps(func)
+            def wrapper(self, *args, **kwargs):
+                with self.telemetry.stage(name):
+                    return func(self, *args, **kwargs)
             return wrapper
         return decorator
 
+    @staticmethod
+    def try_loop(try_total):
+        """
+        Deprecated, use Scraper.retry.
+        """
+        return Scraper.retry(try_total)
+
 
 class Modeler(ABC):
+    """
+    Row of one model page, mixed into a Scraper.
+    static_product: True when _extract_product(url, response) reads the HTTP response fetched for the fingerprint
+    detail_keys: columns filled by _extract_model_details; a remembered row also needs a column outside them (specs)
+    snapshot_name: file fetch_model_data writes to output_folder, e.g. "s_scrape_model_data.json"
+    price_locators: price blocks; on a static page they let fetch_prices skip the browser
+    price_source: "driver" (page or driver) or "soup" (BeautifulSoup) handed to _extract_prices
+    """
+
+    static_product = False
+    detail_keys = ("model", "description", "price", "price_original", "price_gap", "year", "series", "size",
+                   "grade", "display type", "url")
+    snapshot_name = None
+    price_locators = ()
+    price_source = "driver"
+
+    def _extract_row(self, url: str, row: dict) -> None:
+        """
+        Fill row with the details and global specs of one model page,
+        or with the previous row when the page fingerprint is unchanged.
+        The fingerprint is read from the response static_product makers extract from anyway;
+        browser makers only fingerprint with fingerprint_prefetch, which costs one more GET per model.
+        """
+        if self.static_product:
+            response = self._static_response(url)
+            fingerprint = self.page_fingerprint(url, response=response) if response is not None else None
+        else:
+            # 응답을 다시 쓰지 못하는 제조사는 지문 때문에 페이지를 한 번 더 받지 않는다
+            response = None
+            fingerprint = self.page_fingerprint(url) if self.fingerprint_prefetch else None
+        previous = self.fingerprints.previous(url, fingerprint)
+        if previous is not None:
+            row.update(previous)
+            return None
+        row.update(self._extract_product(url, response=response) if self.static_product else self._extract_product(url))
+        self._remember(url, fingerprint, row)
+
+    def _static_response(self, url: str):
+        try:
+            return self.http_get(url)
+        except Exception as e:
+            logging.debug(f"no static response for {url}: {e}")
+            return None
+
+    async def _extract_row_on(self, browser, url: str, row: dict) -> None:
+        """
+        _extract_row on the async backend: the same fingerprint reuse and retry policy,
+        with the page read by the subclass coroutine _extract_row_async(page, url) in a context of browser.
+        """
+        fingerprint = None
+        if self.fingerprint_prefetch:
+            fingerprint = await asyncio.get_running_loop().run_in_executor(None, self.page_fingerprint, url)
+        previous = self.fingerprints.previous(url, fingerprint)
+        if previous is not None:
+            row.update(previous)
+            return None
+        with self.telemetry.stage("product"):
+            row.update(await self.retry_policy.call_async(browser.visit, url, self._extract_row_async))
+        self._remember(url, fingerprint, row)
+
+    def _remember(self, url: str, fingerprint: str, row: dict) -> None:
+        """
+        Keep row for fingerprint reuse only when it is complete: a price and specs beyond the model details.
+        A partial row (price or spec tab failed to load) is extracted again next run instead of being reused.
+        """
+        price = row.get("price")
+        if price is None or pd.isna(price) or all(key in self.detail_keys for key in row):
+            logging.info(f"not reusable, incomplete row: {url}")
+            return None
+        self.fingerprints.update(url, fingerprint, dict(row))
+
+    def _extract_product(self, url: str) -> dict:
+        """
+        Details and global specs of one model page, each from its own visit.
+        Makers that can read both from a single browser session override this.
+        """
+        dict_info = self._extract_model_details(url)
+        dict_spec = self._extract_global_specs(url=url)
+        dict_spec['url'] = url
+        dict_info.update(dict_spec)
+        return dict_info
+
+    def fetch_prices(self, previous_snapshot=None, workers: int = 16) -> pd.DataFrame:
+        """
+        Refresh only price, price_original and price_gap of the models of a previous snapshot
+        (path of a *_scrape_model_data.json or its DataFrame, by default output_folder / snapshot_name).
+        Model pages are read over HTTP when they carry price_locators, in a browser otherwise.
+        The models whose price moved are written to <snapshot>_prices_<date_time>.json.
+        """
+        if previous_snapshot is None:
+            previous_snapshot = self.output_folder / self.snapshot_name
+        if isinstance(previous_snapshot, pd.DataFrame):
+            df_previous = previous_snapshot
+        else:
+            df_previous = pd.read_json(previous_snapshot, orient='records', lines=True, dtype=False)  # size 등은 문자열 그대로
+        previous_rows = df_previous.dropna(subset=['url']).drop_duplicates(subset=['url']).to_dict('records')
+        self.failed_urls = {}
+
+        def run(row: dict) -> dict:
+            url = row['url']
+            try:
+                page = self.open_page(url, required=self.price_locators, stage="price")
+                try:
+                    source = page
+                    if self.price_source == "soup":
+                        source = page.soup if isinstance(page, StaticPage) else BeautifulSoup(page.page_source, 'html.parser')
+                    prices = self._extract_prices(source, row)
+                finally:
+                    self.release_driver(page)
+            except Exception as e:
+                self.failed_urls[url] = f"{type(e).__name__}: {e}"
+                logging.error(f"fail to collect prices: {url} ({e})")
+                prices = {}
+            return dict({'model': row.get('model'), 'url': url}, **prices, previous_price=row.get('price'))
+
+        print(f"refresh prices of {len(previous_rows)} models")
+        logging.info(f"refresh prices of {len(previous_rows)} models")
+        self.driver_pool.max_idle = max(self.driver_pool.max_idle, workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            rows = list(tqdm(executor.map(run, previous_rows), total=len(previous_rows)))
+        self.close_drivers()
+        self._report_failures()
+        self.report_rates()
+        self.report_tiers()
+
+        df_prices = pd.DataFrame(rows, columns=['model', 'url', 'price', 'price_original', 'price_gap', 'previous_price'])
+        df_prices['price_change'] = df_prices['price'] - df_prices['previous_price']
+        moved = (df_prices['price'] != df_prices['previous_price']) & ~(df_prices['price'].isna() & df_prices['previous_price'].isna())
+        delta_file = self.output_folder / f"{Path(self.snapshot_name).stem}_prices_{datetime.now().strftime('%Y-%m-%d_%H%M')}.json"
+        df_prices[moved].to_json(delta_file, orient='records', lines=True)
+        print(f"price changes: {int(moved.sum())} of {len(df_prices)} models -> {delta_file}")
+        logging.info(f"price changes: {int(moved.sum())} of {len(df_prices)} models -> {delta_file}")
+        return df_prices
 
     @abstractmethod
-    def fetch_model_data(self, demo_mode: bool = False) -> pd.DataFrame:
+    def fetch_model_data(self, workers: int = 1, resume: bool = False) -> pd.DataFrame:
         """
         Collect model information from URLs and return the data in the desired format.
+        workers > 1 extracts several model pages at once.
+        resume=True continues an interrupted run from its checkpoint.
         """
         pass
 
@@ -0,0 +1,108 @@
+import logging
+from urllib.parse import urljoin
+from market_research.scraper._html_parser import HtmlSnapshot, Selector
+from market_research.scraper._tiered_fetcher import StaticPage
+
+
+class ScrollHarvester:
+    """
+    Attribute values (hrefs by default) of the nodes matching a css selector, collected in the browser while the page scrolls.
+    A MutationObserver keeps every match that lazy-loads in, even if the page later removes it again;
+    the page is scrolled in strides and the harvest stops once `idle` strides in a row add nothing,
+    then the values come back in one call, in the order they were first seen.
+    text: keep only nodes whose trimmed, lower-cased text equals it, e.g. "learn more"
+    absolute: resolve the values against the page url, like WebElement.get_attribute("href")
+    A StaticPage cannot scroll, so its page_source is parsed once instead.
+    """
+
+    def __init__(self, css: str, attribute: str = "href", text: str = None, absolute: bool = False,
+                 stride: int = 1500, idle: int = 3, max_strides: int = 80):
+        self.selector = Selector(css)
+        self.attribute = attribute
+        self.text = text
+        self.absolute = absolute
+        self.stride = stride
+        self.idle = idle
+        self.max_strides = max_strides
+
+    def harvest(self, driver, wait=None) -> list:
+        """
+        wait(driver) is called after every stride, e.g. Scraper.wait for the lazy content to settle.
+        """
+        if isinstance(driver, StaticPage):
+            return self.parse(driver.page_source, driver.current_url)
+        args = (self.selector.css, self.attribute, self.text, self.absolute)
+        count = driver.execute_script(_INSTALL, *args)
+        idle = 0
+        strides = 0
+        for strides in range(1, self.max_strides + 1):
+            state = driver.execute_script(_STRIDE, *args, self.stride)
+            if wait is not None:
+                wait(driver)
+                state = driver.execute_script(_STRIDE, *args, 0)
+            idle = 0 if state["count"] > count else idle + 1
+            count = state["count"]
+            if idle >= self.idle and (count or state["bottom"]):
+                break
+        values = driver.execute_script(_COLLECT, *args) or []
+        logging.info(f"harvested {len(values)} of {self.selector.css} in {strides} strides")
+        return values
+
+    def parse(self, html: str, url: str = None) -> list:
+        page = HtmlSnapshot(html)
+        values = []
+        for node in page.select(self.selector):
+            value = page.attr(node, self.attribute)
+            if value is None or (self.text is not None and page.text(node).strip().lower() != self.text):
+                continue
+            if self.absolute and url:
+                value = urljoin(url, value)
+            if value not in values:
+                values.append(value)
+        return values
+
+
+# window.__mkretvHarvest[selector]: 관찰자와 지금까지 모은 값
+_STATE = """
+const [selector, attribute, text, absolute] = arguments;
+const harvests = window.__mkretvHarvest = window.__mkretvHarvest || {};
+const take = (state, node) => {
+  const value = node.getAttribute(attribute);
+  if (value === null || (text !== null && node.textContent.trim().toLowerCase() !== text)) return;
+  state.values.add(absolute ? new URL(value, document.baseURI).href : value);
+};
+const scan = (state, root) => {
+  if (root.nodeType !== 1) return;
+  if (root.matches(selector)) take(state, root);
+  root.querySelectorAll(selector).forEach((node) => take(state, node));
+};
+"""
+
+_INSTALL = _STATE + """
+if (!harvests[selector]) {
+  const state = harvests[selector] = {values: new Set()};
+  state.observer = new MutationObserver((mutations) => {
+    for (const mutation of mutations) mutation.addedNodes.forEach((node) => scan(state, node));
+  });
+  state.observer.observe(document.documentElement, {childList: true, subtree: true});
+}
+scan(harvests[selector], document.documentElement);
+return harvests[selector].values.size;
+"""
+
+_STRIDE = _STATE + """
+const state = harvests[selector];
+window.scrollBy(0, arguments[4]);
+scan(state, document.documentElement);
+const bottom = window.innerHeight + window.scrollY >= document.documentElement.scrollHeight - 2;
+return {count: state.values.size, bottom: bottom};
+"""
+
+_COLLECT = _STATE + """
+const state = harvests[selector];
+if (!state) return [];
+scan(state, document.documentElement);
+state.observer.disconnect();
+delete harvests[selector];
+return Array.from(state.values);
+"""
@@ -0,0 +1,137 @@
+import json
+from market_research.scraper._html_parser import HtmlSnapshot, Selector
+
+
+class SiteProfile:
+    """
+    Declarative description of a spec page, compiled into one javascript function,
+    so every field comes back from a single execute_script call instead of a WebDriver round trip per element.
+    rows: css selectors of the spec rows, tried in order (the first that matches any row wins)
+    pairs: (label, value) css selectors inside a row, tried in order; value None means the label stands alone ("")
+    unmatched: (label, value) recorded for a row none of the pairs match, e.g. ("Parser error", "Parser error");
+    None skips such rows
+    texts: css selector of text blocks returned in document order, inside every texts_scope node, e.g. "h2, p"
+    text: "visible" reads innerText of rendered nodes only (like WebElement.text),
+    "content" reads textContent (like BeautifulSoup get_text)
+    The same profile also reads a page snapshot (parse), where text is always textContent.
+    json_pairs: (label, value) keys of spec objects in the page's embedded JSON (__NEXT_DATA__, application/json scripts),
+    read by parse when the html has no spec rows, e.g. a tab that is only rendered on click
+    """
+
+    json_scripts = Selector('script#__NEXT_DATA__, script[type="application/json"]')
+
+    def __init__(self, rows: list = (), pairs: list = (), texts: str = None, texts_scope: str = None, text: str = "visible",
+                 json_pairs: list = (), unmatched: tuple = None):
+        self.rows = list(rows)
+        self.pairs = [list(pair) for pair in pairs]
+        self.texts = texts
+        self.texts_scope = texts_scope
+        self.text = text
+        self.json_pairs = [tuple(pair) for pair in json_pairs]
+        self.unmatched = tuple(unmatched) if unmatched is not None else None
+        self._script = None
+        self._rows = [Selector(css) for css in self.rows]
+        self._pairs = [(Selector(label), Selector(value) if value else None) for label, value in self.pairs]
+        self._texts = Selector(texts) if texts else None
+        self._texts_scope = Selector(texts_scope) if texts_scope else None
+
+    @property
+    def script(self) -> str:
+        if self._script is None:
+            self._script = self._compile()
+        return self._script
+
+    def extract(self, driver) -> dict:
+        """
+        {"pairs": [(label, value), ...], "texts": [text, ...]} of the current page.
+        """
+        result = driver.execute_script(self.script) or {}
+        return {"pairs": [(label, value) for label, value in result.get("pairs", [])],
+                "texts": result.get("texts", [])}
+
+    def parse(self, html: str, backend: str = None) -> dict:
+        """
+        Same result as extract, from one parsed snapshot of the page (driver.page_source).
+        """
+        page = HtmlSnapshot(html, backend=backend)
+        result = {"pairs": [], "texts": []}
+        for rows in self._rows:
+            nodes = page.select(rows)
+            if not nodes:
+                continue
+            for row in nodes:
+                for label, value in self._pairs:
+                    label_node = page.select_one(label, row)
+                    value_node = page.select_one(value, row) if value else None
+                    if label_node is not None and (value_node is not None or not value):
+                        result["pairs"].append((page.text(label_node), page.text(value_node) if value_node is not None else ""))
+                        break
+                else:
+                    if self.unmatched is not None:
+                        result["pairs"].append(self.unmatched)
+            break
+        if not result["pairs"] and self.json_pairs:
+            result["pairs"] = self._json_pairs(page)
+        if self._texts is not None:
+            scopes = page.select(self._texts_scope) if self._texts_scope is not None else [None]
+            for scope in scopes:
+                result["texts"].extend(page.text(node) for node in page.select(self._texts, scope))
+        return result
+
+    def _json_pairs(self, page) -> list:
+        pairs = []
+        for node in page.select(self.json_scripts):
+            try:
+                stack = [json.loads(page.text(node))]
+            except ValueError:
+                continue
+            while stack:
+                value = stack.pop()
+                if isinstance(value, list):
+                    stack.extend(reversed(value))  # 문서 순서대로
+                elif isinstance(value, dict):
+                    for label, content in self.json_pairs:
+                        if isinstance(value.get(label), str) and isinstance(value.get(content), (str, int, float)):
+                            pairs.append((value[label], str(value[content])))
+                            break
+                    else:
+                        stack.extend(reversed(list(value.values())))
+        return pairs
+
+    def _compile(self) -> str:
+        profile = {"rows": self.rows, "pairs": self.pairs, "texts": self.texts, "scope": self.texts_scope,
+                   "unmatched": self.unmatched}
+        if self.text == "visible":
+            read = "n.checkVisibility && !n.checkVisibility() ? '' : n.innerText"
+        else:
+            read = "n.textContent"
+        return """
+const profile = %s;
+const read = (n) => (%s || '');
+const result = {pairs: [], texts: []};
+for (const selector of profile.rows) {
+  const rows = document.querySelectorAll(selector);
+  if (!rows.length) continue;
+  for (const row of rows) {
+    let matched = false;
+    for (const [label, value] of profile.pairs) {
+      const labelNode = row.querySelector(label);
+      const valueNode = value ? row.querySelector(value) : null;
+      if (labelNode && (valueNode || !value)) {
+        result.pairs.push([read(labelNode), valueNode ? read(valueNode) : '']);
+        matched = true;
+        break;
+      }
+    }
+    if (!matched && profile.unmatched) result.pairs.push(profile.unmatched);
+  }
+  break;
+}
+if (profile.texts) {
+  const scopes = profile.scope ? document.querySelectorAll(profile.scope) : [document];
+  for (const scope of scopes) {
+    for (const n of scope.querySelectorAll(profile.texts)) result.texts.push(read(n));
+  }
+}
+return result;
+""" % (json.dumps(profile), read)
@@ -0,0 +1,65 @@
+import gzip
+import io
+import re
+import logging
+from xml.etree.ElementTree import iterparse
+
+
+class SitemapSource:
+    """
+    Model urls read from a maker's sitemap instead of scrolling its series pages.
+    sitemaps: sitemap or sitemap index urls
+    include: regex a model url must match, e.g. r"/tv-video/televisions/.*/p/"
+    follow: regex a child sitemap of an index must match to be read (None reads every child)
+    min_urls: fewer urls than this means the sitemap misses items
+    Documents are parsed as a stream (iterparse), so a sitemap of tens of thousands of urls is never held in memory.
+    """
+
+    def __init__(self, sitemaps: list, include: str, follow: str = None, min_urls: int = 1, max_depth: int = 2):
+        self.sitemaps = sitemaps
+        self.include = re.compile(include)
+        self.follow = re.compile(follow) if follow else None
+        self.min_urls = min_urls
+        self.max_depth = max_depth
+
+    def discover(self, fetch) -> set:
+        """
+        fetch(url) -> requests.Response, e.g. Scraper.http_get
+        """
+        model_urls = set()
+        queue = [(url, 0) for url in self.sitemaps]
+        while queue:
+            url, depth = queue.pop(0)
+            try:
+                response = fetch(url, stream=True)
+                response.raise_for_status()
+                for kind, loc in self._locs(response, gzipped=url.endswith(".gz")):
+                    if kind == "sitemap":
+                        if depth < self.max_depth and (self.follow is None or self.follow.search(loc)):
+                            queue.append((loc, depth + 1))
+                    elif self.include.search(loc):
+                        model_urls.add(loc)
+            except Exception as e:
+                print(f"fail to read sitemap {url}: {e}")
+                logging.error(f"fail to read sitemap {url}: {e}")
+        return model_urls
+
+    @staticmethod
+    def _locs(response, gzipped: bool = False):
+        """
+        ("sitemap" | "url", loc) for each entry of a sitemap index or urlset.
+        """
+        if response.raw is not None and not response._content_consumed:
+            response.raw.decode_content = True  # Content-Encoding 은 풀고 .gz 파일은 그대로 받는다
+            source = response.raw
+        else:
+            source = io.BytesIO(response.content)  # 캐시에서 온 응답
+        if gzipped:
+            source = gzip.GzipFile(fileobj=source)
+        for _, element in iterparse(source, events=("end",)):
+            tag = element.tag.rsplit("}", 1)[-1]
+            if tag in ("sitemap", "url"):
+                loc = next((child.text for child in element if child.tag.rsplit("}", 1)[-1] == "loc"), None)
+                if loc:
+                    yield tag, loc.strip()
+                element.clear()
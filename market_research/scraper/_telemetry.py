@@ -0,0 +1,107 @@
+import json
+import threading
+import time
+import logging
+from contextlib import contextmanager
+from datetime import datetime
+
+
+class Telemetry:
+    """
+    Stage timers and counters of one scraper run.
+    stages: seconds, calls and failures per pipeline stage (series, models, details, specs, transform, export)
+    counters: pages_browser, pages_http, bytes, failures, ... (browser launches and retries are read from the pool and retry policy)
+    """
+
+    def __init__(self, maker: str):
+        self.maker = maker
+        self.started = time.time()
+        self.stages = {}
+        self.counters = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.time()
+        failed = False
+        try:
+            yield
+        except Exception:
+            failed = True
+            raise
+        finally:
+            with self._lock:
+                stage = self.stages.setdefault(name, {"calls": 0, "seconds": 0.0, "failures": 0})
+                stage["calls"] += 1
+                stage["seconds"] += time.time() - start
+                stage["failures"] += failed
+
+    def count(self, name: str, value: float = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def report(self, **extra) -> dict:
+        with self._lock:
+            return dict({"maker": self.maker,
+                         "started": datetime.fromtimestamp(self.started).isoformat(timespec="seconds"),
+                         "seconds": round(time.time() - self.started, 1),
+                         "stages": {name: dict(stage, seconds=round(stage["seconds"], 2)) for name, stage in self.stages.items()},
+                         "counters": dict(self.counters)}, **extra)
+
+
+class MetricsRegistry:
+    """
+    Latest run report of every maker in the process, rendered in the Prometheus text format for /metrics.
+    A tracked Telemetry is read live (running=1) until its run publishes the final report.
+    """
+
+    def __init__(self, prefix: str = "mkretv"):
+        self.prefix = prefix
+        self.reports = {}
+        self.live = {}
+        self._lock = threading.Lock()
+
+    def track(self, telemetry: Telemetry) -> None:
+        with self._lock:
+            self.live[telemetry.maker] = telemetry
+
+    def publish(self, report: dict) -> None:
+        with self._lock:
+            self.reports[report["maker"]] = report
+            self.live.pop(report["maker"], None)
+
+    def render(self) -> str:
+        with self._lock:
+            reports = dict(self.reports)
+            live = list(self.live.values())
+        reports.update({telemetry.maker: telemetry.report(running=True) for telemetry in live})
+        samples = {}
+        for report in reports.values():
+            maker = report["maker"]
+            samples.setdefault(("running", "gauge", "1 while the run is in progress"), []).append((f'maker="{maker}"', int(report.get("running", False))))
+            samples.setdefault(("run_seconds", "gauge", "Duration of the last run"), []).append((f'maker="{maker}"', report["seconds"]))
+            for name, stage in report["stages"].items():
+                labels = f'maker="{maker}",stage="{name}"'
+                samples.setdefault(("stage_seconds", "gauge", "Seconds spent per stage in the last run"), []).append((labels, stage["seconds"]))
+                samples.setdefault(("stage_calls", "gauge", "Calls per stage in the last run"), []).append((labels, stage["calls"]))
+                samples.setdefault(("stage_failures", "gauge", "Failed calls per stage in the last run"), []).append((labels, stage["failures"]))
+            for name, value in report["counters"].items():
+                samples.setdefault((name, "gauge", f"{name} in the last run"), []).append((f'maker="{maker}"', value))
+        lines = []
+        for (name, kind, description), values in samples.items():
+            lines.append(f"# HELP {self.prefix}_{name} {description}")
+            lines.append(f"# TYPE {self.prefix}_{name} {kind}")
+            lines.extend(f"{self.prefix}_{name}{{{labels}}} {value}" for labels, value in values)
+        return "\n".join(lines) + "\n"
+
+
+def save_report(report: dict, path) -> None:
+    try:
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=1, default=str)
+    except OSError as e:
+        logging.error(f"fail to write run report {path}: {e}")
+
+
+# 프로세스 안의 모든 스크레이퍼 실행 결과, app_get_models 의 /metrics 가 읽는다
+METRICS = MetricsRegistry()
@@ -0,0 +1,167 @@
+import json
+import re
+import threading
+import logging
+from pathlib import Path
+from urllib.parse import urljoin, urlsplit
+from bs4 import BeautifulSoup
+from selenium.common.exceptions import NoSuchElementException
+try:
+    import lxml.html
+except ImportError:  # xpath 로케이터는 브라우저 단계에서만 처리
+    lxml = None
+
+
+class StaticElement:
+    """
+    Read-only stand-in for a selenium WebElement, backed by BeautifulSoup (css) or lxml (xpath).
+    """
+
+    def __init__(self, node, page):
+        self._node = node
+        self._page = page
+
+    @property
+    def text(self) -> str:
+        if hasattr(self._node, "get_text"):
+            text = self._node.get_text(" ")
+        else:
+            text = self._node.text_content()
+        return re.sub(r"\s+", " ", text).strip()
+
+    def get_attribute(self, name: str):
+        value = self._node.get(name)
+        if name in ("href", "src") and value:
+            return urljoin(self._page.current_url, value)  # selenium 처럼 절대 경로로
+        if name in ("innerHTML", "outerHTML"):
+            return self._html(outer=name == "outerHTML")
+        return value
+
+    def find_element(self, by: str, value: str):
+        return self._page._first(self._page._select(by, value, self), by, value)
+
+    def find_elements(self, by: str, value: str) -> list:
+        return self._page._select(by, value, self)
+
+    def _html(self, outer: bool) -> str:
+        if hasattr(self._node, "decode_contents"):
+            return str(self._node) if outer else self._node.decode_contents()
+        html = lxml.html.tostring(self._node, encoding="unicode")
+        return html if outer else re.sub(r"^<[^>]*>|</[^>]*>$", "", html.strip())
+
+
+class StaticPage:
+    """
+    A page fetched over HTTP that answers the read-only part of the selenium WebDriver API
+    (find_element(s), page_source, title, current_url), so extraction code runs unchanged on either tier.
+    It cannot click or scroll: execute_script returns None and scrolling loops run once.
+    """
+
+    def __init__(self, html: str, url: str):
+        self.page_source = html
+        self.current_url = url
+        self.soup = BeautifulSoup(html, "html.parser")
+        self._tree = None
+
+    @property
+    def title(self) -> str:
+        return self.soup.title.get_text(strip=True) if self.soup.title else ""
+
+    def find_element(self, by: str, value: str):
+        return self._first(self._select(by, value, None), by, value)
+
+    def find_elements(self, by: str, value: str) -> list:
+        return self._select(by, value, None)
+
+    def execute_script(self, *args):
+        return None
+
+    def has(self, locators: list) -> bool:
+        try:
+            return all(self.find_elements(by, value) for by, value in locators)
+        except Exception as e:
+            logging.debug(f"fail to validate {self.current_url}: {e}")
+            return False
+
+    def _select(self, by: str, value: str, parent) -> list:
+        if by == "xpath":
+            if lxml is None:
+                raise NoSuchElementException("xpath needs lxml")
+            node = parent._node if parent is not None else self._lxml()
+            if hasattr(node, "get_text"):  # BeautifulSoup 노드에서는 xpath 를 쓸 수 없다
+                node = lxml.html.fromstring(str(node))
+            return [StaticElement(element, self) for element in node.xpath(value) if not isinstance(element, str)]
+        css = {"class name": lambda v: "." + v.replace(" ", "."),
+               "css selector": lambda v: v,
+               "tag name": lambda v: v,
+               "id": lambda v: f'[id="{v}"]',
+               "name": lambda v: f'[name="{v}"]'}.get(by)
+        if css is None:
+            raise NoSuchElementException(f"unsupported locator on a static page: {by}")
+        node = parent._node if parent is not None else self.soup
+        if not hasattr(node, "select"):
+            node = BeautifulSoup(lxml.html.tostring(node, encoding="unicode"), "html.parser")
+        return [StaticElement(element, self) for element in node.select(css(value))]
+
+    def _lxml(self):
+        if self._tree is None:
+            self._tree = lxml.html.fromstring(self.page_source)
+        return self._tree
+
+    @staticmethod
+    def _first(elements: list, by: str, value: str):
+        if not elements:
+            raise NoSuchElementException(f"{by}={value}")
+        return elements[0]
+
+
+class TierMemory:
+    """
+    Which tier ("http" or "browser") worked last time, per url pattern.
+    A pattern that failed over HTTP is sent straight to the browser, and re-probed every reprobe visits.
+    """
+
+    def __init__(self, path=None, reprobe: int = 50):
+        self.path = Path(path) if path is not None else None
+        self.reprobe = reprobe
+        self.patterns = {}
+        self._lock = threading.Lock()
+        if self.path is not None and self.path.exists():
+            try:
+                self.patterns = json.loads(self.path.read_text(encoding="utf-8"))
+            except ValueError:
+                logging.warning(f"ignore broken tier memory {self.path}")
+
+    @staticmethod
+    def pattern(url: str) -> str:
+        """
+        https://electronics.sony.com/tv-video/televisions/all-tvs/p/k65xr80 -> electronics.sony.com/tv-video/televisions/all-tvs/p/*
+        """
+        parts = urlsplit(url)
+        segments = [segment for segment in parts.path.split("/") if segment]
+        segments = ["*" if re.search(r"\d", segment) else segment for segment in segments[:-1]] + ["*"]
+        return parts.netloc.lower() + "/" + "/".join(segments)
+
+    def tier(self, url: str) -> str:
+        with self._lock:
+            record = self.patterns.setdefault(self.pattern(url), {"tier": "http", "http_ok": 0, "http_fail": 0, "visits": 0})
+            record["visits"] += 1
+            if record["tier"] == "browser" and record["visits"] % self.reprobe != 0:
+                return "browser"
+            return "http"
+
+    def record(self, url: str, http_ok: bool) -> None:
+        with self._lock:
+            record = self.patterns[self.pattern(url)]
+            record["http_ok" if http_ok else "http_fail"] += 1
+            record["tier"] = "http" if http_ok else "browser"
+
+    def report(self) -> dict:
+        with self._lock:
+            return {pattern: record["tier"] for pattern, record in self.patterns.items()}
+
+    def save(self) -> None:
+        if self.path is None:
+            return None
+        with self._lock:
+            self.path.write_text(json.dumps(self.patterns, indent=1), encoding="utf-8")
@@ -0,0 +1,96 @@
+import json
+import threading
+import logging
+from datetime import datetime
+from pathlib import Path
+from market_research.scraper._page_cache import canonical_url
+
+
+class UrlFrontier:
+    """
+    Model urls to visit, deduplicated by canonical_url (no fragment, no tracking parameters, lower-case host).
+    The first spelling seen (without its fragment) is the one visited. Urls never visited in earlier runs come first,
+    then the ones visited longest ago. State is kept in path (json) across runs.
+    """
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path is not None else None
+        self.seen = {}  # canonical url -> {"url", "first_seen", "last_visited"}
+        self._run = {}  # 이번 실행에서 찾은 url (canonical -> 방문할 url)
+        self._lock = threading.Lock()
+        if self.path is not None and self.path.exists():
+            try:
+                self.seen = json.loads(self.path.read_text(encoding="utf-8"))
+            except ValueError:
+                logging.warning(f"ignore broken frontier {self.path}")
+
+    def begin_run(self) -> None:
+        with self._lock:
+            self._run = {}
+
+    def add(self, url: str) -> bool:
+        """
+        Returns False when url (or another spelling of it) is already in this run.
+        """
+        if not url:
+            return False
+        key = canonical_url(url)
+        url = url.strip().split("#")[0]
+        with self._lock:
+            if key in self._run:
+                return False
+            self._run[key] = url
+            self.seen.setdefault(key, {"url": url, "first_seen": datetime.now().isoformat(timespec="seconds"),
+                                       "last_visited": None})
+            return True
+
+    def add_all(self, urls) -> int:
+        return sum(self.add(url) for url in urls)
+
+    @staticmethod
+    def dedupe(urls) -> list:
+        """
+        urls without repeated spellings of the same page, e.g. overlapping series pages.
+        """
+        unique = {}
+        for url in urls:
+            unique.setdefault(canonical_url(url), url)
+        return list(unique.values())
+
+    def url_dict(self) -> dict:
+        """
+        {idx: url} of this run, new urls first.
+        """
+        with self._lock:
+            keys = sorted(self._run, key=lambda key: (self.seen[key]["last_visited"] is not None,
+                                                      self.seen[key]["last_visited"] or "", key))
+            new = sum(self.seen[key]["last_visited"] is None for key in keys)
+            urls = [self._run[key] for key in keys]
+        print(f"frontier: {len(urls)} urls, {new} new")
+        logging.info(f"frontier: {len(urls)} urls, {new} new")
+        return {idx: url for idx, url in enumerate(urls)}
+
+    def mark_visited(self, urls) -> None:
+        stamp = datetime.now().isoformat(timespec="seconds")
+        with self._lock:
+            for url in urls:
+                entry = self.seen.get(canonical_url(url))
+                if entry is not None:
+                    entry["last_visited"] = stamp
+
+    def last_run(self) -> set:
+        """
+        Canonical urls visited on the day of the latest visit, i.e. what the previous run collected.
+        """
+        with self._lock:
+            days = [entry["last_visited"][:10] for entry in self.seen.values() if entry["last_visited"]]
+            if not days:
+                return set()
+            latest = max(days)
+            return {key for key, entry in self.seen.items() if (entry["last_visited"] or "")[:10] == latest}
+
+    def save(self) -> None:
+        if self.path is None:
+            return None
+        with self._lock:
+            self.path.write_text(json.dumps(self.seen, indent=1), encoding="utf-8")
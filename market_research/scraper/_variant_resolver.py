@@ -0,0 +1,68 @@
+import json
+import re
+import logging
+from urllib.parse import urljoin, urlsplit
+from market_research.scraper._html_parser import HtmlSnapshot, Selector
+
+
+class VariantResolver:
+    """
+    Urls of every size variant of a product page, read from the state JSON embedded in its html
+    (__NEXT_DATA__, other application/json scripts, schema.org ProductGroup hasVariant in ld+json),
+    so the size tiles never have to be clicked.
+    include: regex of model page urls, e.g. the sitemap include of the maker.
+    The variant list is the JSON array whose items link to model pages and that contains the page itself;
+    related or recommended products live in other arrays and are ignored.
+    """
+
+    scripts = Selector('script#__NEXT_DATA__, script[type="application/json"], script[type="application/ld+json"]')
+
+    def __init__(self, include: str):
+        self.include = re.compile(include)
+
+    def resolve(self, html: str, url: str) -> list:
+        """
+        Absolute variant urls, [] when the page carries no variant list (fall back to the size tiles then).
+        """
+        page = HtmlSnapshot(html)
+        current = self._path(url)
+        for node in page.select(self.scripts):
+            try:
+                data = json.loads(page.text(node))
+            except ValueError:
+                continue
+            for items in self._arrays(data):
+                urls = [self._item_url(item, url) for item in items]
+                urls = [item_url for item_url in urls if item_url]
+                if current in {self._path(item_url) for item_url in urls}:
+                    logging.info(f"resolved {len(urls)} variants of {url}")
+                    return list(dict.fromkeys(urls))
+        return []
+
+    def _arrays(self, data):
+        stack = [data]
+        while stack:
+            value = stack.pop()
+            if isinstance(value, dict):
+                stack.extend(value.values())
+            elif isinstance(value, list):
+                if any(isinstance(item, dict) for item in value):
+                    yield value
+                stack.extend(value)
+
+    def _item_url(self, item, base: str):
+        # 변형 항목의 url 은 보통 바로 아래 또는 한 단계 아래 (예: {"link": {"href": ...}}) 에 있다
+        if not isinstance(item, dict):
+            return None
+        values = list(item.values())
+        values += [nested for value in item.values() if isinstance(value, dict) for nested in value.values()]
+        for value in values:
+            if isinstance(value, str) and value.startswith(("/", "http")):
+                absolute = urljoin(base, value.strip())
+                if self.include.search(absolute.split("#")[0].split("?")[0]):
+                    return absolute
+        return None
+
+    @staticmethod
+    def _path(url: str) -> str:
+        return urlsplit(url).path.rstrip("/").lower()
@@ -0,0 +1,108 @@
+import threading
+import time
+import logging
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+
+class Waiter:
+    """
+    Condition based waits used in place of time.sleep(wait_time).
+    Every wait has a ceiling, and is compared with the fixed sleep it replaces
+    so the wall-clock time saved can be reported at the end of a run.
+    """
+
+    # 마지막 DOM 변경 이후 경과 시간(ms)을 돌려준다. arm=true 이면 기준 시점을 지금으로 되돌린다.
+    _DOM_QUIET_JS = """
+        var arm = arguments[0];
+        if (!window.__mkrtMutation) {
+            window.__mkrtMutation = {last: performance.now()};
+            new MutationObserver(function () { window.__mkrtMutation.last = performance.now(); })
+                .observe(document, {childList: true, subtree: true, characterData: true});
+        }
+        if (arm) { window.__mkrtMutation.last = performance.now(); }
+        return performance.now() - window.__mkrtMutation.last;
+    """
+
+    _NETWORK_JS = """
+        if (!window.__mkrtBuffer) {
+            performance.setResourceTimingBufferSize(10000);
+            window.__mkrtBuffer = true;
+        }
+        return [document.readyState, performance.getEntriesByType('resource').length];
+    """
+
+    def __init__(self, poll: float = 0.1, quiet: float = 0.3):
+        self.poll = poll
+        self.quiet = quiet
+        self.waits = 0
+        self.timeouts = 0
+        self.waited = 0.0
+        self.fixed = 0.0
+        self._lock = threading.Lock()
+
+    def for_element(self, driver, locator: tuple, timeout: float, fixed: float = None) -> bool:
+        start = time.time()
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=self.poll).until(EC.presence_of_element_located(locator))
+            met = True
+        except Exception:
+            met = False
+        return self._record(start, timeout if fixed is None else fixed, met)
+
+    def for_network_idle(self, driver, timeout: float, fixed: float = None) -> bool:
+        start = time.time()
+        met = False
+        last_count, last_change = -1, start
+        while time.time() - start < timeout:
+            try:
+                ready_state, count = driver.execute_script(self._NETWORK_JS)
+            except Exception:
+                break
+            now = time.time()
+            if count != last_count:
+                last_count, last_change = count, now
+            elif ready_state == "complete" and now - last_change >= self.quiet:
+                met = True
+                break
+            time.sleep(self.poll)
+        return self._record(start, timeout if fixed is None else fixed, met)
+
+    def for_dom_quiet(self, driver, timeout: float, fixed: float = None) -> bool:
+        start = time.time()
+        met = False
+        try:
+            driver.execute_script(self._DOM_QUIET_JS, True)
+            while time.time() - start < timeout:
+                time.sleep(self.poll)
+                if driver.execute_script(self._DOM_QUIET_JS, False) >= self.quiet * 1000:
+                    met = True
+                    break
+        except Exception:
+            pass
+        return self._record(start, timeout if fixed is None else fixed, met)
+
+    @property
+    def saved(self) -> float:
+        return self.fixed - self.waited
+
+    def report(self) -> dict:
+        with self._lock:
+            report = {"waits": self.waits,
+                      "timeouts": self.timeouts,
+                      "fixed_sleep_sec": round(self.fixed, 1),
+                      "waited_sec": round(self.waited, 1),
+                      "saved_sec": round(self.saved, 1)}
+        return report
+
+    def _record(self, start: float, fixed: float, met: bool) -> bool:
+        elapsed = time.time() - start
+        with self._lock:
+            self.waits += 1
+            self.waited += elapsed
+            self.fixed += fixed
+            if not met:
+                self.timeouts += 1
+        if not met:
+            logging.debug(f"wait reached its ceiling after {elapsed:.1f}s")
+        return met
@@ -0,0 +1,151 @@
+import os
+import signal
+import threading
+import time
+import logging
+
+
+class DriverWatchdog:
+    """
+    Background check of every pooled chrome session.
+    A session whose memory exceeds max_rss_mb, or an idle one that does not answer a ping within max_latency seconds,
+    is killed and dropped from the pool; the thread that had it leased is told to requeue its page.
+    Leased sessions are not pinged: a slow page load is left to the driver's page load timeout.
+    Memory is the RSS of chromedriver and its chrome processes for local sessions,
+    and the JS heap of the page for remote sessions (no process access).
+    """
+
+    _JS_HEAP_JS = "return performance.memory ? performance.memory.usedJSHeapSize : 0;"
+
+    def __init__(self, driver_pool, max_rss_mb: float = 1500, max_latency: float = 20, interval: float = 15):
+        self.driver_pool = driver_pool
+        self.max_rss_mb = max_rss_mb
+        self.max_latency = max_latency
+        self.interval = interval
+        self.kills = 0
+        self.samples = {}  # session_id -> {"rss_mb", "latency"}
+        self._stop = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return None
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="driver-watchdog", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def check(self, driver, busy: bool = False) -> str:
+        """
+        Returns the reason the session is unhealthy, or "" when it is fine.
+        busy: the session is leased, its worker may be in the middle of a command (a page load can take longer
+        than max_latency, and a ping would only queue behind it), so only the process memory is checked.
+        """
+        key = getattr(driver, "session_id", id(driver))
+        if busy:
+            pids = self._session_pids(driver)
+            if not pids:
+                return ""  # 원격 세션의 JS 힙도 명령 뒤에 줄을 서므로 반납될 때까지 기다린다
+            rss_mb = self._process_rss_mb(pids)
+            self.samples[key] = {"rss_mb": round(rss_mb), "latency": None}
+        else:
+            latency = self._ping(driver)
+            if latency is None:
+                if self.driver_pool.leased(driver):
+                    return ""  # 핑을 보내는 사이에 대여되어 작업자의 명령 뒤에 밀렸다
+                return f"no response within {self.max_latency}s"
+            rss_mb = self._rss_mb(driver)
+            self.samples[key] = {"rss_mb": round(rss_mb), "latency": round(latency, 2)}
+        if rss_mb > self.max_rss_mb:
+            return f"{rss_mb:.0f} MB exceeds {self.max_rss_mb} MB"
+        return ""
+
+    def report(self) -> dict:
+        return {"kills": self.kills, "sessions": dict(self.samples)}
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            for driver in self.driver_pool.sessions():
+                reason = self.check(driver, busy=self.driver_pool.leased(driver))
+                if reason:
+                    self._kill(driver, reason)
+
+    def _ping(self, driver):
+        # 멈춘 세션에서는 execute_script 자체가 돌아오지 않으므로 별도 스레드에서 재고 기다린다
+        result = {}
+
+        def ping():
+            start = time.time()
+            try:
+                driver.execute_script("return 1;")
+                result["latency"] = time.time() - start
+            except Exception:
+                result["latency"] = None
+
+        thread = threading.Thread(target=ping, daemon=True)
+        thread.start()
+        thread.join(self.max_latency)
+        return result.get("latency")
+
+    def _rss_mb(self, driver) -> float:
+        pids = self._session_pids(driver)
+        if not pids:
+            try:
+                return (driver.execute_script(self._JS_HEAP_JS) or 0) / 1e6
+            except Exception:
+                return 0.0
+        return self._process_rss_mb(pids)
+
+    @staticmethod
+    def _process_rss_mb(pids: list) -> float:
+        rss = 0
+        for pid in pids:
+            try:
+                with open(f"/proc/{pid}/statm") as f:
+                    rss += int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+            except (OSError, ValueError):
+                continue
+        return rss / 1e6
+
+    @staticmethod
+    def _session_pids(driver) -> list:
+        """
+        chromedriver pid and all of its descendants, read from /proc.
+        """
+        try:
+            root = driver.service.process.pid
+        except AttributeError:
+            return []  # remote session
+        children = {}
+        for entry in os.listdir("/proc"):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry}/stat") as f:
+                    ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+            except (OSError, ValueError, IndexError):
+                continue
+            children.setdefault(ppid, []).append(int(entry))
+        pids, stack = [], [root]
+        while stack:
+            pid = stack.pop()
+            pids.append(pid)
+            stack.extend(children.get(pid, []))
+        return pids
+
+    def _kill(self, driver, reason: str) -> None:
+        logging.warning(f"watchdog recycles chrome session {getattr(driver, 'session_id', '')}: {reason}")
+        self.kills += 1
+        self.driver_pool.evict(driver)
+        pids = self._session_pids(driver)
+        for pid in reversed(pids):
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except OSError:
+                continue
+        # 원격 세션은 프로세스를 죽일 수 없으니 quit을 기다리지 않고 던져둔다
+        threading.Thread(target=self.driver_pool.discard, args=(driver,), daemon=True).start()
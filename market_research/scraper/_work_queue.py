@@ -0,0 +1,191 @@
+import argparse
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import logging
+from contextlib import closing
+
+
+class WorkQueue:
+    """
+    Durable queue of model urls in a SQLite file shared by worker processes.
+    The coordinator publishes url_dict, workers lease one url at a time and keep the lease alive with heartbeats;
+    a lease that is not renewed for lease_seconds (crashed worker) is handed to the next worker.
+    A url is given up after max_attempts leases.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS tasks (
+            id INTEGER PRIMARY KEY,
+            job TEXT NOT NULL,
+            maker TEXT NOT NULL,
+            key TEXT NOT NULL,
+            url TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            worker TEXT,
+            lease_until REAL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            row TEXT,
+            error TEXT,
+            UNIQUE (job, url)
+        );
+        CREATE INDEX IF NOT EXISTS tasks_status ON tasks (maker, status);
+        CREATE INDEX IF NOT EXISTS tasks_job ON tasks (job, status);
+    """
+
+    def __init__(self, path: str, lease_seconds: float = 300, max_attempts: int = 3, poll: float = 2):
+        self.path = str(path)
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.poll = poll
+        with closing(self._connect()) as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(self._SCHEMA)
+
+    def publish(self, job: str, maker: str, url_dict: dict) -> int:
+        """
+        Queue the urls of url_dict under job. Publishing a job again queues its done and failed urls anew;
+        urls still pending or leased are left as they are. Returns the number of urls (re)queued.
+        """
+        with closing(self._connect()) as connection, connection:
+            cursor = connection.executemany(
+                "INSERT INTO tasks (job, maker, key, url) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (job, url) DO UPDATE SET status = 'pending', worker = NULL, lease_until = NULL, "
+                "attempts = 0, row = NULL, error = NULL WHERE status IN ('done', 'failed')",
+                [(job, maker, str(key), url) for key, url in url_dict.items()])
+        logging.info(f"published {cursor.rowcount} urls to {job}")
+        return cursor.rowcount
+
+    def lease(self, maker: str, worker: str, job: str = None):
+        """
+        Returns (task_id, url) of the next pending or expired task of maker, or None.
+        job: only tasks of that job; None takes any job of maker, oldest first.
+        """
+        now = time.time()
+        scope, params = ("maker = ? AND job = ?", (maker, job)) if job is not None else ("maker = ?", (maker,))
+        with closing(self._connect()) as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute(
+                "UPDATE tasks SET status = 'failed', error = 'lease expired' "
+                f"WHERE {scope} AND status = 'leased' AND lease_until < ? AND attempts >= ?",
+                (*params, now, self.max_attempts))
+            task = connection.execute(
+                f"SELECT id, url FROM tasks WHERE {scope} AND attempts < ? "
+                "AND (status = 'pending' OR (status = 'leased' AND lease_until < ?)) ORDER BY id LIMIT 1",
+                (*params, self.max_attempts, now)).fetchone()
+            if task is not None:
+                connection.execute(
+                    "UPDATE tasks SET status = 'leased', worker = ?, lease_until = ?, attempts = attempts + 1 WHERE id = ?",
+                    (worker, now + self.lease_seconds, task[0]))
+            connection.commit()
+        return task
+
+    def heartbeat(self, task_id: int, worker: str) -> bool:
+        with closing(self._connect()) as connection, connection:
+            cursor = connection.execute(
+                "UPDATE tasks SET lease_until = ? WHERE id = ? AND worker = ? AND status = 'leased'",
+                (time.time() + self.lease_seconds, task_id, worker))
+        return cursor.rowcount == 1
+
+    def complete(self, task_id: int, worker: str, row: dict) -> None:
+        with closing(self._connect()) as connection, connection:
+            connection.execute("UPDATE tasks SET status = 'done', row = ?, error = NULL WHERE id = ? AND worker = ?",
+                               (json.dumps(row, default=str), task_id, worker))
+
+    def fail(self, task_id: int, worker: str, error: str, row: dict = None) -> None:
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "UPDATE tasks SET status = CASE WHEN attempts < ? THEN 'pending' ELSE 'failed' END, "
+                "row = ?, error = ? WHERE id = ? AND worker = ?",
+                (self.max_attempts, json.dumps(row or {}, default=str), error, task_id, worker))
+
+    def progress(self, job: str) -> dict:
+        with closing(self._connect()) as connection:
+            counts = dict(connection.execute("SELECT status, COUNT(*) FROM tasks WHERE job = ? GROUP BY status", (job,)))
+        return {status: counts.get(status, 0) for status in ("pending", "leased", "done", "failed")}
+
+    def results(self, job: str) -> tuple:
+        """
+        Returns ({url: row}, {url: error}) of a finished job.
+        """
+        with closing(self._connect()) as connection:
+            tasks = connection.execute("SELECT url, status, row, error FROM tasks WHERE job = ?", (job,)).fetchall()
+        dict_rows, failed_urls = {}, {}
+        for url, status, row, error in tasks:
+            dict_rows[url] = json.loads(row) if row else {}
+            if status != "done":
+                failed_urls[url] = error or status
+        return dict_rows, failed_urls
+
+    def consume(self, scraper, worker: str = None, until_empty: bool = True, job: str = None) -> int:
+        """
+        Lease and extract urls of scraper's maker (of job only, when given) with scraper._extract_row(url, row).
+        until_empty=False keeps polling for new urls (worker process).
+        """
+        worker = worker or f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+        maker = type(scraper).__name__
+        done = 0
+        while True:
+            task = self.lease(maker, worker, job)
+            if task is None:
+                if until_empty:
+                    return done
+                time.sleep(self.poll)
+                continue
+            task_id, url = task
+            stop = threading.Event()
+            beat = threading.Thread(target=self._beat, args=(task_id, worker, stop), daemon=True)
+            beat.start()
+            row = {}
+            try:
+                scraper._extract_row(url, row)
+                self.complete(task_id, worker, row)
+                done += 1
+            except Exception as e:
+                logging.error(f"fail to collect: {url} ({e})")
+                self.fail(task_id, worker, f"{type(e).__name__}: {e}", row)
+            finally:
+                stop.set()
+
+    def _beat(self, task_id: int, worker: str, stop: threading.Event) -> None:
+        while not stop.wait(self.lease_seconds / 3):
+            self.heartbeat(task_id, worker)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+
+def main():
+    """
+    python -m market_research.scraper._work_queue --maker sony --queue /data/queue.db
+    Workers reach their browsers through SELENIUM_URL, e.g. the selenium_hub of docker-compose.yml, which routes
+    every command of a session to the node that started it; all of them share the per-site request rate kept in the queue file.
+    """
+    from market_research import scraper as makers
+    from market_research.scraper._rate_limiter import SharedRateLimiter
+    registry = {"sony": makers.Specscraper_s, "sony_g": makers.Specscraper_s_g,
+                "lg": makers.Specscraper_l, "lg_g": makers.Specscraper_l_g,
+                "samsung": makers.Specscraper_se, "samsung_g": makers.Specscraper_se_g,
+                "panasonic": makers.Specscraper_p, "tcl": makers.Specscraper_t}
+    parser = argparse.ArgumentParser(description="model url worker")
+    parser.add_argument("--maker", required=True, choices=sorted(registry))
+    parser.add_argument("--queue", default=os.getenv("MKRETV_QUEUE", "queue.db"))
+    parser.add_argument("--job", default=None, help="only urls of this job, e.g. Specscraper_s:sony:20241001_093000")
+    parser.add_argument("--exit-when-empty", action="store_true")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    scraper = registry[args.maker]()
+    queue = WorkQueue(args.queue)
+    scraper.rate_limiter = SharedRateLimiter.like(scraper.rate_limiter, queue.path)
+    try:
+        queue.consume(scraper, until_empty=args.exit_when_empty, job=args.job)
+    finally:
+        scraper.close_drivers()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,3 @@
-import time
 import pandas as pd
 from market_research.scraper._scraper_scheme import Scraper
 from tools.file.github import GitMgt
@@ -33,6 +32,8 @@ class Erpsearcher(Scraper):
             model_erp_dict['description'] = description
 
             model_erp_data.append(model_erp_dict)  
+        self.close_drivers()
+        self.report_waits()
         
         model_erp_df = pd.DataFrame(model_erp_data)
         model_erp_df = model_erp_df.set_index("query").reset_index()
@@ -88,11 +89,11 @@ class Erpsearcher(Scraper):
     def _search_data(self, model_input:str, brand_input:str, base_url="https://eprel.ec.europa.eu/screen/product/electronicdisplays") ->dict:
         
         result = {}
-        driver = self.web_driver.get_chrome()
+        driver = self.driver_pool.lease()
         if self.verbose:
             print(f"search_query: {model_input}, {brand_input}")
         try:
-            driver.get(base_url)
+            self.navigate(driver, base_url)
             for _ in range(5):
                 try:
                     input_model_element = driver.find_element(By.ID, "model-identifier")
@@ -103,7 +104,7 @@ class Erpsearcher(Scraper):
                     
                     search_button = driver.find_element(By.ID, "search")
                     driver.execute_script("arguments[0].click();", search_button)
-                    time.sleep(self.wait_time)
+                    self.wait(driver, until="element", locator=(By.TAG_NAME, "app-search-result-item"))
                     search_result_items = driver.find_elements(By.TAG_NAME, "app-search-result-item")
                     break
                 except:
@@ -135,7 +136,7 @@ class Erpsearcher(Scraper):
                     print(f"Model '{model_input}' not found in the search results.")
                 return None
             
-            time.sleep(self.wait_time)
+            self.wait(driver)
 
             try:
                 
@@ -175,5 +176,5 @@ class Erpsearcher(Scraper):
             pass
 
         finally:
-            driver.quit()
+            self.release_driver(driver)
         return result
@@ -1,12 +1,15 @@
-import time
 from tools.file import FileManager
 from bs4 import BeautifulSoup
-import requests
+from selenium.webdriver.common.by import By
 from tqdm import tqdm
 from collections import OrderedDict
 import pandas as pd
 from market_research.scraper._scraper_scheme import Scraper
+from market_research.scraper._resource_policy import ResourcePolicy
+from market_research.scraper._scroll_harvester import ScrollHarvester
 class ModelScraper_sjp(Scraper):
+    resource_policy = ResourcePolicy()
+    series_links = ScrollHarvester("div.GalleryListItem__ButtonContainer a")
 
     def __init__(self, enable_headless=True,
                  export_prefix="sony_model_info_web_jp", intput_folder_path="input", output_folder_path="results",
@@ -39,6 +42,9 @@ class ModelScraper_sjp(Scraper):
                         print(e)
                     pass
             break
+        self.close_drivers()
+        self.report_waits()
+        self.report_tiers()
         if show_visit:
             print("\n")
             for model, url in visit_url_dict.items():  print(f"{model}: {url}")
@@ -55,36 +61,23 @@ class ModelScraper_sjp(Scraper):
     ###=====================get info main page====================================##
     def _get_spec_series(self, url: str = "https://www.sony.jp/bravia/gallery/") -> dict:
         """
-        스크롤 다운이 되어야 전체 웹페이지가 로딩되어, 스크롤은 selenium, page parcing은 BS4로 진행
+        스크롤 다운이 되어야 전체 웹페이지가 로딩되어, 스크롤하는 동안 브라우저에서 링크를 모은다 (ScrollHarvester)
         """
-        step: int = 200
         series_dict = {}
         trytotal = 3
         for trycnt in range(trytotal):
-            driver = self.web_driver.get_chrome()
-            driver.get(url=url)
-            time.sleep(self.wait_time)
-            scroll_distance_total = self.web_driver.get_scroll_distance_total()
-            scroll_distance = 0
-            while scroll_distance < scroll_distance_total:
-                html = driver.page_source
-                soup = BeautifulSoup(html, 'html.parser')
-                try:
-                    button_containers = soup.find_all('div', class_='GalleryListItem__ButtonContainer')
-                    for container in button_containers:
-                        link = container.find('a')['href']
-                        model = link.split("products/")[-1].split(".")[0].replace('/',"")
-                        link = "https://www.sony.jp/bravia/products/" + model + "/spec.html"
-                        series_dict[model]=link
-                    # 한 step씩 스크롤 내리기
-                    driver.execute_script(f"window.scrollBy(0, {step});")
-                    time.sleep(self.wait_time)  # 스크롤이 내려가는 동안 대기
-                    scroll_distance += step
-                except:
-                    if self.tracking_log:
-                        print(f"get_spec_series error, re-try {trycnt}/{trytotal}")
-                    driver.quit()
-            driver.quit()
+            driver = self.open_page(url, required=[(By.CSS_SELECTOR, "div.GalleryListItem__ButtonContainer a")], stage="series")
+            try:
+                for link in self.series_links.harvest(driver, wait=self.wait):
+                    model = link.split("products/")[-1].split(".")[0].replace('/',"")
+                    link = "https://www.sony.jp/bravia/products/" + model + "/spec.html"
+                    series_dict[model]=link
+            except:
+                if self.tracking_log:
+                    print(f"get_spec_series error, re-try {trycnt}/{trytotal}")
+                continue
+            finally:
+                self.release_driver(driver)
             break
         # print(f"number of total Series: {len(series_dict)}")
         return series_dict
@@ -98,13 +91,11 @@ class ModelScraper_sjp(Scraper):
         #=============================
         for tryCnt in range(TotalCnt):
             step: int = 200
-            driver = self.web_driver.get_chrome()
-            driver.get(url=url)
-            time.sleep(self.wait_time)
+            driver = self.open_page(url, required=[(By.CSS_SELECTOR, "div.s5-specTable")], stage="specs")
             try:
                 if self.tracking_log:
                     print("Trying with Selenium...")
-                scroll_distance_total = self.web_driver.get_scroll_distance_total()
+                scroll_distance_total = self.scroll_distance_total(driver)
                 scroll_distance = 0  # 현재까지 스크롤한 거리
 
                 while scroll_distance < scroll_distance_total:
@@ -133,16 +124,16 @@ class ModelScraper_sjp(Scraper):
                     #     dictNote[bullet] = " @" + text
                     # 한 step씩 스크롤 내리기
                     driver.execute_script(f"window.scrollBy(0, {step});")
-                    time.sleep(self.wait_time)  # 스크롤이 내려가는 동안 대기
+                    self.wait(driver)  # 스크롤이 내려가는 동안 대기
                     scroll_distance += step
-                driver.quit()
+                self.release_driver(driver)
                 break  # 셀레니움으로 성공적으로 스크래핑했을 경우 반복문 탈출
             except Exception as e:
-                driver.quit()
+                self.release_driver(driver)
                 if self.tracking_log:
                     print(f"Failed to scrape using Selenium. Trying with BS4...")
 
-                response = requests.get(url)
+                response = self.http_get(url)
                 html = response.text
                 soup = BeautifulSoup(html, 'html.parser')
                 table = soup.find('tbody', class_='SpecificationsTableSingle__Tbody')
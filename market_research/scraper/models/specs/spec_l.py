@@ -1,6 +1,4 @@
 from bs4 import BeautifulSoup
-import requests
-import time
 import pandas as pd
 from tqdm import tqdm
 import re
@@ -8,10 +6,33 @@ import logging
 from selenium.webdriver.common.by import By
 from tools.file import FileManager
 from market_research.scraper._scraper_scheme import Scraper, Modeler
+from market_research.scraper._retry_policy import RetryExhausted
+from market_research.scraper._navigation_hook import NavigationHook, ONETRUST_SELECTORS, onetrust_cookie
+from market_research.scraper._resource_policy import ResourcePolicy
+from market_research.scraper._sitemap import SitemapSource
+from market_research.scraper._scroll_harvester import ScrollHarvester
+from market_research.scraper._site_profile import SiteProfile
 from selenium.webdriver.common.action_chains import ActionChains
 
 
 class ModelScraper_l(Scraper, Modeler):
+    navigation_hook = NavigationHook(
+        cookies=[onetrust_cookie(".lg.com")],
+        hide_selectors=ONETRUST_SELECTORS)
+    resource_policy = ResourcePolicy()
+    sitemap = SitemapSource(["https://www.lg.com/us/sitemap.xml"], include=r"lg\.com/us/tvs/lg-[0-9a-z-]+$",
+                            follow=r"product|tvs", min_urls=30)
+    spec_profile = SiteProfile(rows=['.MuiBox-root.css-1nnt9ji'],
+                               pairs=[('.MuiTypography-root.MuiTypography-body3.css-11mszpq', '.MuiTypography-root.MuiTypography-body2.css-1yx8hz4'),
+                                      ('.MuiTypography-root.MuiTypography-body3.css-byc8c0', '.MuiTypography-root.MuiTypography-body2.css-1yx8hz4')],
+                               json_pairs=[("specName", "specValue")])
+    fingerprint_locators = [(By.CSS_SELECTOR, "div.css-8wacqv"), (By.CSS_SELECTOR, "span.MuiTypography-overline")]
+    static_product = True  # _extract_row 가 한 번 받은 응답으로 지문과 스펙을 모두 읽는다
+    series_links = ScrollHarvester("a.css-11xg6yi")
+    snapshot_name = "l_scrape_model_data.json"
+    price_locators = [(By.CSS_SELECTOR, "div.css-8wacqv, div.css-1udb513")]
+    price_source = "soup"
+
     def __init__(self, enable_headless=True,
                  export_prefix="lge_model_info_web", intput_folder_path="input", output_folder_path="results",
                  wait_time=2, verbose=False):
@@ -19,37 +40,32 @@ class ModelScraper_l(Scraper, Modeler):
         Scraper.__init__(self, enable_headless, export_prefix, intput_folder_path, output_folder_path)
         self.wait_time = wait_time
         self.verbose = verbose
+        self.max_per_domain = 16  # 모델 페이지를 브라우저 없이 HTTP 로 읽으므로 동시 요청을 늘린다 (속도는 rate_limiter 가 제한)
         pass
 
-    def fetch_model_data(self) -> pd.DataFrame:
+    def fetch_model_data(self, workers: int = 1, resume: bool = False) -> pd.DataFrame:
 
         def find_urls() -> dict:
-            url_set = set()
-            url_series_set = self._get_series_urls()
-            for url in tqdm(url_series_set):
-                url_models_set = self._extract_models_from_series(url=url)
-                url_set.update(url_models_set)
-            url_dict = {idx: url for idx, url in enumerate(url_set)}
+            self.frontier.begin_run()
+            if not self.discover_from_sitemap():
+                url_series_set = self._get_series_urls()
+                for url in tqdm(self.frontier.dedupe(url_series_set)):
+                    try:
+                        url_models_set = self._extract_models_from_series(url=url)
+                    except RetryExhausted as e:
+                        print(f"skip series {url}: {e}")
+                        logging.error(f"skip series {url}: {e}")
+                        continue
+                    self.frontier.add_all(url_models_set)
+            url_dict = self.frontier.url_dict()
             print(f"Total model: {len(url_dict)}")
             return url_dict
         
         def extract_sepcs(url_dict):
-            dict_models = {}
-            for key, url in tqdm(url_dict.items()):
-                try:
-                    dict_info = self._extract_model_details(url)
-                    dict_models[key] = dict_info
-                    dict_spec = self._extract_global_specs(url=url)
-                    dict_spec['url'] = url
-                    dict_models[key].update(dict_spec)
-                except Exception as e:
-                    if self.verbose:
-                        print(f"fail to collect: {url}")
-                        print(e)
-            return dict_models
+            return self.extract_rows(url_dict, self._extract_row, workers=workers, resume=resume)
         
-        def transform_format(dict_models, json_file_name: str) -> pd.DataFrame:
-            df_models = pd.DataFrame.from_dict(dict_models).T
+        def transform_format(rows, json_file_name: str) -> pd.DataFrame:
+            df_models = pd.DataFrame(rows)
             try: 
                 df_models = df_models.drop(['Series', 'Size'], axis=1)
             except Exception as e:
@@ -60,14 +76,24 @@ class ModelScraper_l(Scraper, Modeler):
             
         print("start collecting data")
         url_dict = find_urls()
-        dict_models = extract_sepcs(url_dict)
+        extract_sepcs(url_dict)
+        self.close_drivers()
+        self.report_waits()
+        self.report_retries()
+        self.report_rates()
+        self.report_cache()
+        self.report_tiers()
+        self.report_fingerprints()
     
-        df_models = transform_format(dict_models, json_file_name="l_scrape_model_data.json")
-            
-        FileManager.df_to_excel(df_models.reset_index(), file_name=self.output_xlsx_name)
+        with self.telemetry.stage("transform"):
+            df_models = transform_format(self.checkpoint.rows(url_dict.values()), json_file_name=self.snapshot_name)
+        with self.telemetry.stage("export"):
+            FileManager.df_to_excel(df_models.reset_index(), file_name=self.output_xlsx_name)
+        self.report_run()
         return df_models
     
-    @Scraper.try_loop(2)
+    @Scraper.stage("series")
+    @Scraper.retry(2)
     def _get_series_urls(self) -> set:
         def extract_urls_from_segments():
             def find_series_urls(url, prefix) -> set:
@@ -75,30 +101,17 @@ class ModelScraper_l(Scraper, Modeler):
                 url_series = set()
                 url = url
                 prefix = prefix
-                step = 200
+                driver = None
                 try:
-                    driver = self.set_driver(url)
-                    
-                    # click_view_all(driver)
-                    scroll_distance_total = self.web_driver.get_scroll_distance_total()
-                    scroll_distance = 0
-
-                    while scroll_distance < scroll_distance_total:
-                        for _ in range(2):
-                            html = driver.page_source
-                            soup = BeautifulSoup(html, 'html.parser')
-                            elements = soup.find_all('a', class_="css-11xg6yi")
-                            
-                            for element in elements:
-                                url_series.add(prefix + element['href'].strip())
-                            driver.execute_script(f"window.scrollBy(0, {step});")
-                            time.sleep(self.wait_time)
-                            scroll_distance += step
+                    driver = self.open_page(url, required=[(By.CSS_SELECTOR, "a.css-11xg6yi")], stage="series")
+                    for href in self.series_links.harvest(driver, wait=self.wait):
+                        url_series.add(prefix + href.strip())
                     return url_series
                 except Exception as e:
                     pass
                 finally:
-                    driver.quit()
+                    if driver:
+                        self.release_driver(driver)
             
 
             seg_urls = {
@@ -121,7 +134,8 @@ class ModelScraper_l(Scraper, Modeler):
             print(f"Series: [{i}] {url.split('/')[-1]}")
         return url_series
 
-    @Scraper.try_loop(try_total=5)
+    @Scraper.stage("models")
+    @Scraper.retry(5)
     def _extract_models_from_series(self, url: str, prefix="https://www.lg.com/") -> set:
       
         def extract_model_url(elements)->set:
@@ -138,7 +152,9 @@ class ModelScraper_l(Scraper, Modeler):
             
         url_models_set = set()
         try:
-            soup = BeautifulSoup(requests.get(url).text, 'html.parser')
+            page = self.open_page(url, required=[(By.CSS_SELECTOR, 'a.css-1a0ki8h')], stage="models")
+            soup = BeautifulSoup(page.page_source, 'html.parser')
+            self.release_driver(page)
             elements = soup.find_all('a', class_='css-1a0ki8h')
             url_models_set = extract_model_url(elements)
         except Exception as e:
@@ -147,8 +163,9 @@ class ModelScraper_l(Scraper, Modeler):
             pass
         return url_models_set
     
-    @Scraper.try_loop(2)
-    def _extract_model_details(self, url: str) -> dict:
+    @Scraper.stage("details")
+    @Scraper.retry(2)
+    def _extract_model_details(self, url: str, soup=None) -> dict:
         
         def extract_model(soup)->dict:
             
@@ -157,43 +174,6 @@ class ModelScraper_l(Scraper, Modeler):
             
             return {"model": model}
         
-        def extract_prices(soup, model_size)->dict:
-            prices_dict = dict()
-            try:
-                price = soup.find('div', class_='MuiGrid-root MuiGrid-item css-8wacqv').text.strip()
-                split_price = price.split('$')
-                pattern = r'\d{1,3}(?:,\d{3})*(?:\.\d{2})?'
-                prices = [re.search(pattern, part).group() for part in split_price if re.search(pattern, part)]
-                if len(prices) == 3:
-                    price_now = float(prices[0].replace(',', ''))
-                    price_gap = round(float(prices[1].replace(',', '')), 1)
-                    price_original = float(prices[2].replace(',', ''))
-                    
-                    prices_dict["price"] = price_now
-                    prices_dict["price_gap"] = price_gap
-                    prices_dict["price_original"] = price_original
-                else:
-                    price_now = float(split_price[-1].replace(',', '')) 
-                    prices_dict["price"] = price_now
-                    prices_dict["price_original"] = price_now
-                    prices_dict["price_gap"] = 0.0
-            except:
-                try: 
-                    products = {}
-                    for item in soup.find_all('div', class_='MuiGrid-root MuiGrid-item MuiGrid-grid-xs-4 MuiGrid-grid-md-4 css-1udb513'):
-                        size = item.find('h6').text.replace('"', '')
-                        price = item.find('p').text  #
-                        products[size]= float(price.replace('$',"").replace(',', ''))
-                    price_now = products.get(model_size)
-                    prices_dict["price"] = price_now
-                    prices_dict["price_original"] = price_now
-                    prices_dict["price_gap"] = 0.0
-                except:
-                    prices_dict["price"] = float('nan')
-                    prices_dict["price_original"] = float('nan')
-                    prices_dict["price_gap"] = float('nan')
-            return prices_dict
-       
         def extract_description(soup)->dict:
             descriptions = [
                 ('h2', 'MuiTypography-root MuiTypography-subtitle2 css-8oa1vg'),
@@ -293,14 +273,15 @@ class ModelScraper_l(Scraper, Modeler):
             print(f"Connecting to {url.split('/')[-1]}: {url}")
         logging.info(f"Connecting to {url.split('/')[-1]}: {url}")
         try:
-            response = requests.get(url)
-            page_content = response.text
-            soup = BeautifulSoup(page_content, 'html.parser')
+            if soup is None:
+                page = self.open_page(url, required=[(By.CSS_SELECTOR, 'span.MuiTypography-overline')], stage="details")
+                soup = BeautifulSoup(page.page_source, 'html.parser')
+                self.release_driver(page)
             
             dict_info.update(extract_model(soup))
             dict_info.update(extract_description(soup))
             dict_info.update(extract_info_from_model(dict_info.get("model")))
-            dict_info.update(extract_prices(soup, dict_info.get('size')))
+            dict_info.update(self._extract_prices(soup, dict_info))
             if self.verbose: 
                 print(dict_info)
             logging.info(dict_info)            
@@ -315,8 +296,60 @@ class ModelScraper_l(Scraper, Modeler):
     
     
 
-    @Scraper.try_loop(try_total=20)
+    def _extract_prices(self, soup, row: dict = None) -> dict:
+        model_size = str((row or {}).get('size'))  # 스냅샷에서 읽으면 숫자일 수 있다
+        prices_dict = dict()
+        try:
+            price = soup.find('div', class_='MuiGrid-root MuiGrid-item css-8wacqv').text.strip()
+            split_price = price.split('$')
+            pattern = r'\d{1,3}(?:,\d{3})*(?:\.\d{2})?'
+            prices = [re.search(pattern, part).group() for part in split_price if re.search(pattern, part)]
+            if len(prices) == 3:
+                price_now = float(prices[0].replace(',', ''))
+                price_gap = round(float(prices[1].replace(',', '')), 1)
+                price_original = float(prices[2].replace(',', ''))
+
+                prices_dict["price"] = price_now
+                prices_dict["price_gap"] = price_gap
+                prices_dict["price_original"] = price_original
+            else:
+                price_now = float(split_price[-1].replace(',', '')) 
+                prices_dict["price"] = price_now
+                prices_dict["price_original"] = price_now
+                prices_dict["price_gap"] = 0.0
+        except:
+            try: 
+                products = {}
+                for item in soup.find_all('div', class_='MuiGrid-root MuiGrid-item MuiGrid-grid-xs-4 MuiGrid-grid-md-4 css-1udb513'):
+                    size = item.find('h6').text.replace('"', '')
+                    price = item.find('p').text  #
+                    products[size]= float(price.replace('$',"").replace(',', ''))
+                price_now = products.get(model_size)
+                prices_dict["price"] = price_now
+                prices_dict["price_original"] = price_now
+                prices_dict["price_gap"] = 0.0
+            except:
+                prices_dict["price"] = float('nan')
+                prices_dict["price_original"] = float('nan')
+                prices_dict["price_gap"] = float('nan')
+        return prices_dict
+
+    @Scraper.stage("specs")
     def _extract_global_specs(self, url: str) -> dict:
+        """
+        Spec table of the model page, {} when every attempt of _read_global_specs came back empty or failed:
+        the row keeps its details and price, and the miss is counted as spec_misses in telemetry.
+        """
+        try:
+            return self._read_global_specs(url)
+        except RetryExhausted as e:
+            self.telemetry.count("spec_misses")
+            print(f"error extract_specs_detail from {url}")
+            logging.error(f"no specs from {url}: {e}")
+            return {}
+
+    @Scraper.retry(3)
+    def _read_global_specs(self, url: str) -> dict:
       
         def find_spec_tab(driver):
             try: 
@@ -325,19 +358,19 @@ class ModelScraper_l(Scraper, Modeler):
                     if element_all_specs.text.lower() == "all specs":
                         break
                 self.web_driver.move_element_to_center(element_all_specs)
-                time.sleep(self.wait_time)
+                self.wait(driver)
                 element_all_specs.click()
-                time.sleep(self.wait_time)
+                self.wait(driver)
             except:
                 try: 
                     element_all_specs = driver.find_element(By.CLASS_NAME, "MuiTypography-root.MuiTypography-h6.MuiTypography-alignLeft.MuiLink-root.MuiLink-underlineAlways.css-kgbp8r")
                     self.web_driver.move_element_to_center(element_all_specs)
-                    time.sleep(self.wait_time)
+                    self.wait(driver)
                 except:
                     try:
                         element_all_specs = driver.find_element(By.CLASS_NAME, 'MuiTypography-root.MuiTypography-h5.css-14uiqdv')
                         self.web_driver.move_element_to_center(element_all_specs)
-                        time.sleep(self.wait_time)
+                        self.wait(driver)
                     except Exception as e:
                         if self.verbose:
                             print("error find_spec_tab")
@@ -346,55 +379,61 @@ class ModelScraper_l(Scraper, Modeler):
         
 
         def extract_spec_detail(driver) -> dict:
-            dict_spec = {}
-            spec_elements = driver.find_elements(By.CSS_SELECTOR, '.MuiBox-root.css-1nnt9ji')
-            for spec_element in spec_elements:
-                try: 
-                    label = spec_element.find_element(By.CLASS_NAME,
-                                                        'MuiTypography-root.MuiTypography-body3.css-11mszpq').text.strip()
-                    content = spec_element.find_element(By.CLASS_NAME,
-                                                        'MuiTypography-root.MuiTypography-body2.css-1yx8hz4').text.strip()
-                except:
- 
-                    label = spec_element.find_element(By.CLASS_NAME,
-                                                    'MuiTypography-root.MuiTypography-body3.css-byc8c0').text.strip()
-                    content = spec_element.find_element(By.CLASS_NAME,
-                                                    'MuiTypography-root.MuiTypography-body2.css-1yx8hz4').text.strip()
-                if label != '':
-                    
-                    original_label = label
-                    while label in dict_spec and dict_spec.get(label)!=content:
-                        asterisk_count = label.count('*')
-                        label = f"{original_label}{'*' * (asterisk_count + 1)}"
-                    dict_spec[label] = content
-                    if self.verbose: 
-                        if label == "" and content == "":
-                            print(f"[{label}] {content}")
-
-            dict_spec.pop("*", None)            
-            return dict_spec
+            return self._spec_dict(self.spec_profile.extract(driver)["pairs"])
        
         dict_spec = dict()
+        driver = None
         try:
-            driver = self.set_driver(url)           
+            driver = self.set_driver(url, stage="specs")           
             find_spec_tab(driver)   
             dict_spec = extract_spec_detail(driver)
-            if self.verbose:
-                print(f"Received information from {url}")
-            logging.info(f"Received information from {url}")
-        except Exception as e:
-            print(f"error extract_specs_detail from {url}")
-            pass
         finally:
             if driver:  
-                driver.quit()    
+                self.release_driver(driver)    
+        if not dict_spec:
+            raise ValueError(f"no specs found on {url}")  # 빈 결과는 재시도 대상
+        if self.verbose:
+            print(f"Received information from {url}")
+        logging.info(f"Received information from {url}")
         return dict_spec
-            
 
-            
-            
-    def set_driver(self, url):
-        driver = self.web_driver.get_chrome()
-        driver.get(url=url)
-        time.sleep(self.wait_time)
-        return driver
\ No newline at end of file
+    def _spec_dict(self, pairs) -> dict:
+        dict_spec = {}
+        for label, content in pairs:
+            label, content = label.strip(), content.strip()
+            if label != '':
+                original_label = label
+                while label in dict_spec and dict_spec.get(label)!=content:
+                    asterisk_count = label.count('*')
+                    label = f"{original_label}{'*' * (asterisk_count + 1)}"
+                dict_spec[label] = content
+
+        dict_spec.pop("*", None)
+        return dict_spec
+
+    @Scraper.stage("product")
+    @Scraper.retry(2)
+    def _extract_product(self, url: str, response=None) -> dict:
+        """
+        Details and specs from the one HTTP response of the model page, without a browser session:
+        the specs come from the server-rendered spec boxes, or from the page's embedded JSON (spec_profile.json_pairs).
+        response: the page already fetched by _extract_row for its fingerprint, downloaded here otherwise.
+        Only a page that carries neither falls back to the browser visits of Modeler._extract_product.
+        """
+        try:
+            response = response if response is not None else self.http_get(url)
+            if response.ok:
+                html = response.text
+                dict_info = self._extract_model_details(url, soup=BeautifulSoup(html, 'html.parser'))
+                dict_spec = self._spec_dict(self.spec_profile.parse(html)["pairs"])
+                if dict_info.get("model") and dict_spec:
+                    dict_spec['url'] = url
+                    dict_info.update(dict_spec)
+                    if self.verbose:
+                        print(f"Received information from {url}")
+                    logging.info(f"Received information from {url}")
+                    return dict_info
+        except Exception as e:
+            logging.debug(f"static extraction failed for {url}: {e}")
+        logging.info(f"no static specs, open a browser: {url}")
+        return Modeler._extract_product(self, url)
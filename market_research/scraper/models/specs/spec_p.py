@@ -1,13 +1,27 @@
-import time
-from tqdm import tqdm
 import pandas as pd
 from selenium.webdriver.common.by import By
 import logging
 from tools.file import FileManager
 from market_research.scraper._scraper_scheme import Scraper, Modeler
+from market_research.scraper._retry_policy import RetryExhausted
+from market_research.scraper._navigation_hook import NavigationHook, ONETRUST_SELECTORS, onetrust_cookie
+from market_research.scraper._resource_policy import ResourcePolicy
+from market_research.scraper._sitemap import SitemapSource
+from market_research.scraper._scroll_harvester import ScrollHarvester
 
 
 class ModelScraper_p(Scraper, Modeler):
+    navigation_hook = NavigationHook(
+        cookies=[onetrust_cookie(".panasonic.com")],
+        hide_selectors=ONETRUST_SELECTORS + ['div[aria-label="POPUP Form"]'])
+    resource_policy = ResourcePolicy()
+    sitemap = SitemapSource(["https://shop.panasonic.com/sitemap.xml"], include=r"shop\.panasonic\.com/products/tv-[^/]+$",
+                            follow=r"sitemap_products", min_urls=3)
+    fingerprint_locators = [(By.CSS_SELECTOR, "price-list .text-lg"), (By.CSS_SELECTOR, ".product-info__sku")]
+    series_links = ScrollHarvester(".product-card__figure a", absolute=True)
+    snapshot_name = "p_scrape_model_data.json"
+    price_locators = [(By.CSS_SELECTOR, "price-list .text-lg")]
+
     def __init__(self, enable_headless=True,
                  export_prefix="panasonic_model_info_web", intput_folder_path="input", output_folder_path="results",
                  wait_time=1 ,verbose=False):
@@ -16,33 +30,29 @@ class ModelScraper_p(Scraper, Modeler):
         self.verbose = verbose
         pass
     
-    def fetch_model_data(self) -> pd.DataFrame:
+    def fetch_model_data(self, workers: int = 1, resume: bool = False) -> pd.DataFrame:
         def find_urls() -> dict:
-            url_set = set()
-            url_series_set = self._get_series_urls()
-            for url in url_series_set:
-                url_models_set = self._extract_models_from_series(url=url)
-                url_set.update(url_models_set)
-            url_dict = {idx: url for idx, url in enumerate(url_set)}
+            self.frontier.begin_run()
+            if not self.discover_from_sitemap():
+                url_series_set = self._get_series_urls()
+                for url in self.frontier.dedupe(url_series_set):
+                    try:
+                        url_models_set = self._extract_models_from_series(url=url)
+                    except RetryExhausted as e:
+                        print(f"skip series {url}: {e}")
+                        logging.error(f"skip series {url}: {e}")
+                        continue
+                    self.frontier.add_all(url_models_set)
+            url_dict = self.frontier.url_dict()
             print(f"Total model: {len(url_dict)}")
             logging.info(f"Total model: {len(url_dict)}")
             return url_dict
         
         def extract_specs(url_dict):
-            dict_models = {}
-            for key, url in tqdm(url_dict.items()):
-                try:
-                    dict_info = self._extract_model_details(url)
-                    dict_models[key] = dict_info
-                    dict_spec = self._extract_global_specs(url=url)
-                    dict_spec['url'] = url
-                    dict_models[key].update(dict_spec)
-                except Exception as e:
-                    pass
-            return dict_models
+            return self.extract_rows(url_dict, self._extract_row, workers=workers, resume=resume)
         
-        def transform_format(dict_models, json_file_name: str) -> pd.DataFrame:
-            df_models = pd.DataFrame.from_dict(dict_models).T
+        def transform_format(rows, json_file_name: str) -> pd.DataFrame:
+            df_models = pd.DataFrame(rows)
             df_models = df_models.dropna(subset=['price'])
             df_models.to_json(self.output_folder / json_file_name, orient='records', lines=True)
             return df_models
@@ -51,13 +61,23 @@ class ModelScraper_p(Scraper, Modeler):
         print("start collecting data")
         logging.info("start collecting data")
         url_dict = find_urls()
-        dict_models = extract_specs(url_dict)
-        df_models = transform_format(dict_models, json_file_name="p_scrape_model_data.json")
-
-        FileManager.df_to_excel(df_models.reset_index(), file_name=self.output_xlsx_name)
+        extract_specs(url_dict)
+        self.close_drivers()
+        self.report_waits()
+        self.report_retries()
+        self.report_rates()
+        self.report_cache()
+        self.report_tiers()
+        self.report_fingerprints()
+        with self.telemetry.stage("transform"):
+            df_models = transform_format(self.checkpoint.rows(url_dict.values()), json_file_name=self.snapshot_name)
+        with self.telemetry.stage("export"):
+            FileManager.df_to_excel(df_models.reset_index(), file_name=self.output_xlsx_name)
+        self.report_run()
         return df_models
     
-    @Scraper.try_loop(2)
+    @Scraper.stage("series")
+    @Scraper.retry(2)
     def _get_series_urls(self) -> set:
         def find_series_urls(url:str, prefix:str) -> set:
             print(f"Starting to scrape series URLs from: {url}")
@@ -65,26 +85,10 @@ class ModelScraper_p(Scraper, Modeler):
             url_series = set()
             url = url
             prefix = prefix
-            step = 200
             try:
-                driver = self.set_driver(url)
-                scroll_distance_total = self.web_driver.get_scroll_distance_total()
-                scroll_distance = 0
-
-                while scroll_distance < scroll_distance_total:
-                    for _ in range(2):
-                        elements = driver.find_elements(By.CLASS_NAME, "product-card__figure")
-                        for element in elements:
-                            try:
-                                a_tag = element.find_element(By.TAG_NAME, 'a')  # `a` 태그를 찾음
-                                link = a_tag.get_attribute('href')  # href 속성 가져오기
-                                if link:  # 유효한 링크인지 확인
-                                    url_series.add(link.strip())
-                            except Exception as e:
-                                print(f"Error extracting href: {e}")
-                        driver.execute_script(f"window.scrollBy(0, {step});")
-                        time.sleep(self.wait_time)
-                        scroll_distance += step
+                driver = self.set_driver(url, stage="series")
+                for link in self.series_links.harvest(driver, wait=self.wait):
+                    url_series.add(link.strip())
                 return url_series
             except Exception as e:
                 if self.verbose:
@@ -93,7 +97,7 @@ class ModelScraper_p(Scraper, Modeler):
                 pass
             finally:
                 if driver:  
-                    driver.quit()                 
+                    self.release_driver(driver)                 
         url_series = find_series_urls(url = "https://shop.panasonic.com/collections/televisions", prefix = "https://shop.panasonic.com/")
         print(f"The website scan has been completed.\ntotal series: {len(url_series)}")
         logging.info(f"The website scan has been completed.\ntotal series: {len(url_series)}")
@@ -102,19 +106,20 @@ class ModelScraper_p(Scraper, Modeler):
             logging.info(f"Series: [{i}] {url.split('/')[-1]}")
         return url_series
     
-    @Scraper.try_loop(2)
+    @Scraper.stage("models")
+    @Scraper.retry(2)
     def _extract_models_from_series(self, url: str) -> set:
         url_models_set = set()
         print(f"Trying to extract models from series: {url}")
         logging.info(f"Trying to extract models from series: {url}")
         
-        driver = self.set_driver(url)        
+        driver = self.set_driver(url, stage="models")        
         try: 
             elements = driver.find_elements(By.CLASS_NAME, 'block-swatch')
             
             for element in elements:
                 element.click()  # 
-                time.sleep(2)  #
+                self.wait(driver, timeout=2)
                 current_url = driver.current_url
                 if current_url:  
                     url_models_set.add(current_url.strip())
@@ -126,13 +131,14 @@ class ModelScraper_p(Scraper, Modeler):
             logging.error(f"Error extracting models from series: {e}")
         finally:
             if driver:  
-                driver.quit()  
+                self.release_driver(driver)  
                 
         return url_models_set
         
     
             
-    @Scraper.try_loop(2)
+    @Scraper.stage("details")
+    @Scraper.retry(2)
     def _extract_model_details(self, url: str) -> dict:
         
         def extract_model(driver):
@@ -147,23 +153,6 @@ class ModelScraper_p(Scraper, Modeler):
                 description = ""
             return {"description": description}
         
-        def extract_prices(driver)->dict:
-            prices_dict = dict()
-
-            try:
-                price_now = driver.find_element(By.CSS_SELECTOR, "price-list .text-lg").text
-                price_now = price_now.split("$")[-1]
-                price_now = float(price_now.replace('$', '').replace(',', ''))
-                prices_dict['price'] = price_now
-                prices_dict['price_original'] = price_now
-                prices_dict['price_gap'] = 0.0
-            except Exception as e:
-                print(e)
-                prices_dict['price'] = float('nan')
-                prices_dict['price_original'] = float('nan')
-                prices_dict['price_gap'] = float('nan')
-            return prices_dict
-        
         def extract_info_from_model(model: str)->dict:
             dict_info = {}
             model = model.lower()
@@ -189,12 +178,12 @@ class ModelScraper_p(Scraper, Modeler):
             print(f"Connecting to {url.split('/')[-1]}: {url}")
         logging.info(f"Connecting to {url.split('/')[-1]}: {url}")
         try:
-            driver = self.set_driver(url)
+            driver = self.open_page(url, required=[(By.CSS_SELECTOR, ".product-info__sku"), *self.price_locators], stage="details")
             
             # Extract model
             dict_info.update(extract_model(driver))
             dict_info.update(extract_description(driver))
-            dict_info.update(extract_prices(driver))
+            dict_info.update(self._extract_prices(driver))
             dict_info.update(extract_info_from_model(dict_info.get("model")))
             if self.verbose: 
                 print(dict_info)
@@ -207,10 +196,28 @@ class ModelScraper_p(Scraper, Modeler):
             pass
         finally:
             if driver:  
-                driver.quit()  
+                self.release_driver(driver)  
         return dict_info
     
-    @Scraper.try_loop(5)
+    def _extract_prices(self, driver, row: dict = None) -> dict:
+        prices_dict = dict()
+
+        try:
+            price_now = driver.find_element(By.CSS_SELECTOR, "price-list .text-lg").text
+            price_now = price_now.split("$")[-1]
+            price_now = float(price_now.replace('$', '').replace(',', ''))
+            prices_dict['price'] = price_now
+            prices_dict['price_original'] = price_now
+            prices_dict['price_gap'] = 0.0
+        except Exception as e:
+            print(e)
+            prices_dict['price'] = float('nan')
+            prices_dict['price_original'] = float('nan')
+            prices_dict['price_gap'] = float('nan')
+        return prices_dict
+
+    @Scraper.stage("specs")
+    @Scraper.retry(5)
     def _extract_global_specs(self, url: str) -> dict:
         
         
@@ -222,12 +229,11 @@ class ModelScraper_p(Scraper, Modeler):
                     # self.web_driver.move_element_to_center(element_see_more)
                     element_see_more.click()
                     logging.debug("Clicked the 'see more' button from the first locator.")
-                    driver.save_screenshot("41act_click_see_more.png")                
                 except Exception as e:
                     if self.verbose:
                         print(f"Cannot find the 'see more' button from the second locator: {e}")
                         logging.error(f"Cannot find the 'see more' button from the second locator: {e}")
-                time.sleep(self.wait_time)
+                self.wait(driver)
                 return None
             
             act_click_see_more(driver)       
@@ -247,7 +253,7 @@ class ModelScraper_p(Scraper, Modeler):
         dict_specs = {}
             
         try:
-            driver = self.set_driver(url)
+            driver = self.set_driver(url, stage="specs")
             find_spec_tab(driver)   
             dict_specs.update(extract_specs_detail(driver))
             if self.verbose:
@@ -259,12 +265,5 @@ class ModelScraper_p(Scraper, Modeler):
             pass
         finally:
             if driver:  
-                driver.quit()  
+                self.release_driver(driver)  
         return dict_specs
-        
-        
-    def set_driver(self, url):
-        driver = self.web_driver.get_chrome()
-        driver.get(url=url)
-        time.sleep(self.wait_time)
-        return driver
@@ -1,13 +1,17 @@
-import time
 from tools.file import FileManager
 from bs4 import BeautifulSoup
-import requests
+from selenium.webdriver.common.by import By
 from tqdm import tqdm
 from collections import OrderedDict
 import pandas as pd
 from market_research.scraper._scraper_scheme import Scraper
+from market_research.scraper._resource_policy import ResourcePolicy
+from market_research.scraper._scroll_harvester import ScrollHarvester
 import pickle
 class ModelScraper_pjp(Scraper):
+    resource_policy = ResourcePolicy()
+    series_links = ScrollHarvester("div.image-content.imagespart.Intention_trial_click a", stride=1000)
+    spec_links = ScrollHarvester("div.button-area.Intention_trial_click a", stride=3000)
 
     def __init__(self, enable_headless=True,
                  export_prefix="pana_model_info_web_jp", intput_folder_path="input", output_folder_path="results",
@@ -23,10 +27,10 @@ class ModelScraper_pjp(Scraper):
     def fetch_model_data(self, format_df: bool = True, show_visit:bool=False):
         models_dict = {}
         specs_dict = {}
-        url_model_dict = self._get_series_urls(step=1000)
+        url_model_dict = self._get_series_urls()
         print("collecting models")
         for model, url in tqdm(url_model_dict.items()):
-            specs_dict.update(self._extract_models_from_series(url=url,step=3000))
+            specs_dict.update(self._extract_models_from_series(url=url))
         print("collecting spec")
         visit_url_dict = {}
         cnt_loop=2
@@ -42,6 +46,9 @@ class ModelScraper_pjp(Scraper):
                         print(e)
                     pass
             break
+        self.close_drivers()
+        self.report_waits()
+        self.report_tiers()
         if show_visit:
             print("\n")
             for model, url in visit_url_dict.items(): print(f"{model}: {url}")
@@ -53,77 +60,50 @@ class ModelScraper_pjp(Scraper):
         else:
             return models_dict
 
-    def _get_series_urls(self, url: str = "https://panasonic.jp/viera/products.html#4k_oled", step: int=200) -> dict:
+    def _get_series_urls(self, url: str = "https://panasonic.jp/viera/products.html#4k_oled") -> dict:
         """
-        스크롤 다운이 되어야 전체 웹페이지가 로딩되어, 스크롤은 selenium, page parcing은 BS4로 진행
+        스크롤 다운이 되어야 전체 웹페이지가 로딩되어, 스크롤하는 동안 브라우저에서 링크를 모은다 (ScrollHarvester)
         """
-        step = step
         model_dict = {}
         trytotal = 3
         for trycnt in range(trytotal):
-            driver = self.web_driver.get_chrome()
-            driver.get(url=url)
-            time.sleep(self.wait_time)
-            scroll_distance_total = self.web_driver.get_scroll_distance_total()
-            scroll_distance = 0
-            while scroll_distance < scroll_distance_total:
-                html = driver.page_source
-                soup = BeautifulSoup(html, 'html.parser')
-                try:
-                    button_containers = soup.find_all('div', class_='image-content imagespart Intention_trial_click')
-                    for container in button_containers:
-                        link = container.find('a')['href']
-                        if "products" in link:
-                            model = link.split("products/")[-1].split(".")[0].replace('/',"")
-                            link = "https://panasonic.jp/viera/products/" + model + ".html"
-                            # print(link)
-                            model_dict[model]=link
-                    # 한 step씩 스크롤 내리기
-                    driver.execute_script(f"window.scrollBy(0, {step});")
-                    time.sleep(self.wait_time)  # 스크롤이 내려가는 동안 대기
-                    scroll_distance += step
-                except:
-                    if self.tracking_log:
-                        print(f"get_model_series error, re-try {trycnt}/{trytotal}")
-                    driver.quit()
-            driver.quit()
+            driver = self.open_page(url, required=[(By.CSS_SELECTOR, "div.image-content.imagespart.Intention_trial_click a")], stage="series")
+            try:
+                for link in self.series_links.harvest(driver, wait=self.wait):
+                    if "products" in link:
+                        model = link.split("products/")[-1].split(".")[0].replace('/',"")
+                        link = "https://panasonic.jp/viera/products/" + model + ".html"
+                        model_dict[model]=link
+            except:
+                if self.tracking_log:
+                    print(f"get_model_series error, re-try {trycnt}/{trytotal}")
+                continue
+            finally:
+                self.release_driver(driver)
             break
         # print(f"number of total Modl: {len(model_dict)}")
         return model_dict
 
 
-    def _extract_models_from_series(self, url: str = "https://panasonic.jp/viera/products/mz2500.html", step: int=200) -> dict:
+    def _extract_models_from_series(self, url: str = "https://panasonic.jp/viera/products/mz2500.html") -> dict:
         """
-        스크롤 다운이 되어야 전체 웹페이지가 로딩되어, 스크롤은 selenium, page parcing은 BS4로 진행
+        스크롤 다운이 되어야 전체 웹페이지가 로딩되어, 스크롤하는 동안 브라우저에서 링크를 모은다 (ScrollHarvester)
         """
-        step = step
         series_dict = {}
         trytotal = 3
         for trycnt in range(trytotal):
-            driver = self.web_driver.get_chrome()
-            driver.get(url=url)
-            time.sleep(self.wait_time)
-            scroll_distance_total = self.web_driver.get_scroll_distance_total()
-            scroll_distance = 0
-            while scroll_distance < scroll_distance_total:
-                html = driver.page_source
-                soup = BeautifulSoup(html, 'html.parser')
-                try:
-                    button_containers = soup.find_all('div', class_='button-area Intention_trial_click')
-                    for container in button_containers:
-                        link = container.find('a')['href']
-                        if "spec" in link:
-                            model = link.split('/')[-1].split("_")[0]
-                            series_dict[model]=link
-                    # 한 step씩 스크롤 내리기
-                    driver.execute_script(f"window.scrollBy(0, {step});")
-                    time.sleep(self.wait_time)  # 스크롤이 내려가는 동안 대기
-                    scroll_distance += step
-                except:
-                    if self.tracking_log:
-                        print(f"get_spec_series error, re-try {trycnt}/{trytotal}")
-                    driver.quit()
-            driver.quit()
+            driver = self.open_page(url, required=[(By.CSS_SELECTOR, "div.button-area.Intention_trial_click a")], stage="models")
+            try:
+                for link in self.spec_links.harvest(driver, wait=self.wait):
+                    if "spec" in link:
+                        model = link.split('/')[-1].split("_")[0]
+                        series_dict[model]=link
+            except:
+                if self.tracking_log:
+                    print(f"get_spec_series error, re-try {trycnt}/{trytotal}")
+                continue
+            finally:
+                self.release_driver(driver)
             break
         # print(f"number of total Series: {len(series_dict)}")
         return series_dict
@@ -137,13 +117,11 @@ class ModelScraper_pjp(Scraper):
         #=============================
         for tryCnt in range(TotalCnt):
             step: int = 200
-            driver = self.web_driver.get_chrome()
-            driver.get(url=url)
-            time.sleep(self.wait_time)
+            driver = self.open_page(url, required=[(By.CSS_SELECTOR, "div.table-container tr")], stage="details")
             try:
                 if self.tracking_log:
                     print("Trying with Selenium...")
-                scroll_distance_total = self.web_driver.get_scroll_distance_total()
+                scroll_distance_total = self.scroll_distance_total(driver)
                 scroll_distance = 0  # 현재까지 스크롤한 거리
 
                 while scroll_distance < scroll_distance_total:
@@ -172,16 +150,16 @@ class ModelScraper_pjp(Scraper):
                     #     dictNote[bullet] = " @" + text
                     # 한 step씩 스크롤 내리기
                     driver.execute_script(f"window.scrollBy(0, {step});")
-                    time.sleep(self.wait_time)  # 스크롤이 내려가는 동안 대기
+                    self.wait(driver)  # 스크롤이 내려가는 동안 대기
                     scroll_distance += step
-                driver.quit()
+                self.release_driver(driver)
                 break  # 셀레니움으로 성공적으로 스크래핑했을 경우 반복문 탈출
             except Exception as e:
-                driver.quit()
+                self.release_driver(driver)
                 if self.tracking_log:
                     print(f"Failed to scrape using Selenium. Trying with BS4...")
 
-                response = requests.get(url)
+                response = self.http_get(url)
                 html = response.text
                 soup = BeautifulSoup(html, 'html.parser')
                 table = soup.find('tbody', class_='SpecificationsTableSingle__Tbody')
@@ -1,6 +1,3 @@
-from bs4 import BeautifulSoup
-import time
-from tqdm import tqdm
 import pandas as pd
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.by import By
@@ -9,10 +6,31 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from tools.file import FileManager
 from market_research.scraper._scraper_scheme import Scraper, Modeler
+from market_research.scraper._retry_policy import RetryExhausted
+from market_research.scraper._navigation_hook import NavigationHook, ONETRUST_SELECTORS, onetrust_cookie
+from market_research.scraper._resource_policy import ResourcePolicy
+from market_research.scraper._sitemap import SitemapSource
+from market_research.scraper._site_profile import SiteProfile
+from market_research.scraper._scroll_harvester import ScrollHarvester
 
 import logging
 
 class ModelScraper_s_g(Scraper, Modeler):
+    navigation_hook = NavigationHook(
+        cookies=[onetrust_cookie(".sony.com")],
+        hide_selectors=ONETRUST_SELECTORS + ["ngb-modal-window:has(#contentfulModalClose)", "ngb-modal-backdrop"],
+        css="body.modal-open { overflow: auto !important; }")
+    resource_policy = ResourcePolicy()
+    sitemap = SitemapSource(["https://electronics.sony.com/sitemap.xml"], include=r"electronics\.sony\.com/.*inzone-monitors/p/[^/]+$",
+                            follow=r"product", min_urls=2)
+    feature_profile = SiteProfile(texts="h2, p", texts_scope=".custom-product-features__components")
+    spec_profile = SiteProfile(rows=[".full-specifications__specifications-single-card__sub-list"],
+                               pairs=[("h4", "p"), ("h4", None)], text="content", unmatched=("Parser error", "Parser error"))
+    fingerprint_locators = [(By.TAG_NAME, "app-product-pricing"), (By.TAG_NAME, "app-custom-product-intro")]
+    series_links = ScrollHarvester("a.custom-product-grid-item__image-container")
+    snapshot_name = "s_g_scrape_model_data.json"
+    price_locators = [(By.TAG_NAME, "app-product-pricing")]
+
     def __init__(self, enable_headless=True,
                  export_prefix="sony_model_info_web", intput_folder_path="input", output_folder_path="results",
                  wait_time=1 ,verbose=False):
@@ -21,33 +39,29 @@ class ModelScraper_s_g(Scraper, Modeler):
         self.verbose = verbose
         pass
     
-    def fetch_model_data(self) -> pd.DataFrame:
+    def fetch_model_data(self, workers: int = 1, resume: bool = False) -> pd.DataFrame:
         def find_urls() -> dict:
-            url_set = set()
-            url_series_set = self._get_series_urls()
-            for url in url_series_set:
-                url_models_set = self._extract_models_from_series(url=url)
-                url_set.update(url_models_set)
-            url_dict = {idx: url for idx, url in enumerate(url_set)}
+            self.frontier.begin_run()
+            if not self.discover_from_sitemap():
+                url_series_set = self._get_series_urls()
+                for url in self.frontier.dedupe(url_series_set):
+                    try:
+                        url_models_set = self._extract_models_from_series(url=url)
+                    except RetryExhausted as e:
+                        print(f"skip series {url}: {e}")
+                        logging.error(f"skip series {url}: {e}")
+                        continue
+                    self.frontier.add_all(url_models_set)
+            url_dict = self.frontier.url_dict()
             print(f"Total model: {len(url_dict)}")
             logging.info(f"Total model: {len(url_dict)}")
             return url_dict
         
         def extract_specs(url_dict):
-            dict_models = {}
-            for key, url in tqdm(url_dict.items()):
-                try:
-                    dict_info = self._extract_model_details(url)
-                    dict_models[key] = dict_info
-                    dict_spec = self._extract_global_specs(url=url)
-                    dict_spec['url'] = url
-                    dict_models[key].update(dict_spec)
-                except Exception as e:
-                    pass
-            return dict_models
+            return self.extract_rows(url_dict, self._extract_row, workers=workers, resume=resume)
         
-        def transform_format(dict_models, json_file_name: str) -> pd.DataFrame:
-            df_models = pd.DataFrame.from_dict(dict_models).T
+        def transform_format(rows, json_file_name: str) -> pd.DataFrame:
+            df_models = pd.DataFrame(rows)
             df_models = df_models.dropna(subset=['price'])
             df_models.to_json(self.output_folder / json_file_name, orient='records', lines=True)
             return df_models
@@ -56,13 +70,23 @@ class ModelScraper_s_g(Scraper, Modeler):
         print("start collecting data")
         logging.info("start collecting data")
         url_dict = find_urls()
-        dict_models = extract_specs(url_dict)
-        df_models = transform_format(dict_models, json_file_name="s_g_scrape_model_data.json")
-            
-        FileManager.df_to_excel(df_models.reset_index(), file_name=self.output_xlsx_name)
+        extract_specs(url_dict)
+        self.close_drivers()
+        self.report_waits()
+        self.report_retries()
+        self.report_rates()
+        self.report_cache()
+        self.report_tiers()
+        self.report_fingerprints()
+        with self.telemetry.stage("transform"):
+            df_models = transform_format(self.checkpoint.rows(url_dict.values()), json_file_name=self.snapshot_name)
+        with self.telemetry.stage("export"):
+            FileManager.df_to_excel(df_models.reset_index(), file_name=self.output_xlsx_name)
+        self.report_run()
         return df_models
     
-    @Scraper.try_loop(2)
+    @Scraper.stage("series")
+    @Scraper.retry(2)
     def _get_series_urls(self) -> set:
         def find_series_urls(url:str, prefix:str) -> set:
             print(f"Starting to scrape series URLs from: {url}")
@@ -70,22 +94,10 @@ class ModelScraper_s_g(Scraper, Modeler):
             url_series = set()
             url = url
             prefix = prefix
-            step = 200
             try:
-                driver = self.set_driver(url)
-                scroll_distance_total = self.web_driver.get_scroll_distance_total()
-                scroll_distance = 0
-
-                while scroll_distance < scroll_distance_total:
-                    for _ in range(2):
-                        html = driver.page_source
-                        soup = BeautifulSoup(html, 'html.parser')
-                        elements = soup.find_all('a', class_="custom-product-grid-item__image-container")
-                        for element in elements:
-                            url_series.add(prefix + element['href'].strip())
-                        driver.execute_script(f"window.scrollBy(0, {step});")
-                        time.sleep(self.wait_time)
-                        scroll_distance += step
+                driver = self.set_driver(url, stage="series")
+                for href in self.series_links.harvest(driver, wait=self.wait):
+                    url_series.add(prefix + href.strip())
                 return url_series
             except Exception as e:
                 if self.verbose:
@@ -94,7 +106,7 @@ class ModelScraper_s_g(Scraper, Modeler):
                 pass
             finally:
                 if driver:  
-                    driver.quit()                 
+                    self.release_driver(driver)                 
         url_series = find_series_urls(url = "https://electronics.sony.com/c/inzone-monitors", prefix = "https://electronics.sony.com/")
         print(f"The website scan has been completed.\ntotal series: {len(url_series)}")
         logging.info(f"The website scan has been completed.\ntotal series: {len(url_series)}")
@@ -103,13 +115,14 @@ class ModelScraper_s_g(Scraper, Modeler):
             logging.info(f"Series: [{i}] {url.split('/')[-1]}")
         return url_series
     
-    @Scraper.try_loop(2)
+    @Scraper.stage("models")
+    @Scraper.retry(2)
     def _extract_models_from_series(self, url: str) -> set:
         url_models_set = set()
         print(f"Trying to extract models from series: {url}")
         logging.info(f"Trying to extract models from series: {url}")
         
-        driver = self.set_driver(url)        
+        driver = self.open_page(url, required=[(By.CLASS_NAME, 'custom-variant-selector__body')], stage="models")        
         try: 
             element = driver.find_element(By.CLASS_NAME, 'custom-variant-selector__body')
             url_elements = element.find_elements(By.TAG_NAME, 'a')
@@ -125,14 +138,15 @@ class ModelScraper_s_g(Scraper, Modeler):
             logging.error(f"Error extracting models from series: {e}")
         finally:
             if driver:  
-                driver.quit()  
+                self.release_driver(driver)  
                 
         return url_models_set
         
     
             
-    @Scraper.try_loop(2)
-    def _extract_model_details(self, url: str) -> dict:
+    @Scraper.stage("details")
+    @Scraper.retry(2)
+    def _extract_model_details(self, url: str, driver=None) -> dict:
         
         def extract_model(driver):
             model = driver.find_element(By.XPATH,
@@ -150,40 +164,6 @@ class ModelScraper_s_g(Scraper, Modeler):
                 description = ""
             return {"description": description}
         
-        def extract_prices(driver)->dict:
-            prices_dict = dict()
-            try:
-                price_now = driver.find_element(By.XPATH,
-                                                '//*[@id="PDPOveriewLink"]/div[1]/div/div/div[2]/div/app-custom-product-summary/app-product-pricing/div/div[1]/p[1]').text
-                price_original  = driver.find_element(By.XPATH,
-                                                        '//*[@id="PDPOveriewLink"]/div[1]/div/div/div[2]/div/app-custom-product-summary/app-product-pricing/div/div[1]/p[2]').text
-
-                price_now = float(price_now.replace('$', '').replace(',', ''))
-                price_original = float(price_original.replace('$', '').replace(',', ''))
-                price_gap = price_original - price_now
-                print(price_now)
-                print(price_original)
-                prices_dict['price'] = price_now
-                prices_dict['price_original'] = price_original
-                prices_dict['price_gap'] = round(price_gap, 1)
-
-            except:
-                try:
-                    price_now = driver.find_element(By.XPATH,
-                                                    '//*[@id="PDPOveriewLink"]/div[1]/div/div/div[2]/div/app-custom-product-summary/app-product-pricing/div/div[1]/p').text
-                    
-                    price_now = float(price_now.replace('$', '').replace(',', ''))
-                    print("1")
-                    print(price_now)
-                    prices_dict['price'] = price_now
-                    prices_dict['price_original'] = price_now
-                    prices_dict['price_gap'] = 0.0
-                except:
-                    prices_dict['price'] = float('nan')
-                    prices_dict['price_original'] = float('nan')
-                    prices_dict['price_gap'] = float('nan')
-            return prices_dict
-        
         def extract_info_from_model(model: str, description:str)->dict:
             dict_info = {}
             model = model.lower().strip()
@@ -207,13 +187,15 @@ class ModelScraper_s_g(Scraper, Modeler):
         if self.verbose:
             print(f"Connecting to {url.split('/')[-1]}: {url}")
         logging.info(f"Connecting to {url.split('/')[-1]}: {url}")
+        own_driver = driver is None
         try:
-            driver = self.set_driver(url)
+            if own_driver:
+                driver = self.open_page(url, required=[(By.XPATH, '//*[@id="cx-main"]/app-product-details-page/div/app-custom-product-intro/div/div/div[1]/div/span'), *self.price_locators], stage="details")
             
             # Extract model
             dict_info.update(extract_model(driver))
             dict_info.update(extract_description(driver))
-            dict_info.update(extract_prices(driver))
+            dict_info.update(self._extract_prices(driver))
             dict_info.update(extract_info_from_model(dict_info.get("model"), dict_info.get("description")))
             if self.verbose: 
                 print(dict_info)
@@ -224,15 +206,50 @@ class ModelScraper_s_g(Scraper, Modeler):
             logging.error(f"error_extract_model_details: {url}")
             pass
         finally:
-            if driver:  
-                driver.quit()  
+            if driver and own_driver:
+                self.release_driver(driver)  
         return dict_info
     
-    @Scraper.try_loop(5)
-    def _extract_global_specs(self, url: str) -> dict:
+    def _extract_prices(self, driver, row: dict = None) -> dict:
+        prices_dict = dict()
+        try:
+            price_now = driver.find_element(By.XPATH,
+                                            '//*[@id="PDPOveriewLink"]/div[1]/div/div/div[2]/div/app-custom-product-summary/app-product-pricing/div/div[1]/p[1]').text
+            price_original  = driver.find_element(By.XPATH,
+                                                    '//*[@id="PDPOveriewLink"]/div[1]/div/div/div[2]/div/app-custom-product-summary/app-product-pricing/div/div[1]/p[2]').text
+
+            price_now = float(price_now.replace('$', '').replace(',', ''))
+            price_original = float(price_original.replace('$', '').replace(',', ''))
+            price_gap = price_original - price_now
+            print(price_now)
+            print(price_original)
+            prices_dict['price'] = price_now
+            prices_dict['price_original'] = price_original
+            prices_dict['price_gap'] = round(price_gap, 1)
+
+        except:
+            try:
+                price_now = driver.find_element(By.XPATH,
+                                                '//*[@id="PDPOveriewLink"]/div[1]/div/div/div[2]/div/app-custom-product-summary/app-product-pricing/div/div[1]/p').text
+
+                price_now = float(price_now.replace('$', '').replace(',', ''))
+                print("1")
+                print(price_now)
+                prices_dict['price'] = price_now
+                prices_dict['price_original'] = price_now
+                prices_dict['price_gap'] = 0.0
+            except:
+                prices_dict['price'] = float('nan')
+                prices_dict['price_original'] = float('nan')
+                prices_dict['price_gap'] = float('nan')
+        return prices_dict
+
+    @Scraper.stage("specs")
+    @Scraper.retry(5)
+    def _extract_global_specs(self, url: str, driver=None) -> dict:
         
         def find_emphasize_text(driver) -> None:
-            time.sleep(self.wait_time)
+            self.wait(driver)
             see_more_features = False
             for i in range(10):
                 try:
@@ -248,7 +265,7 @@ class ModelScraper_s_g(Scraper, Modeler):
 
             self.web_driver.move_element_to_center(see_more_features)
             see_more_features.click()
-            time.sleep(self.wait_time)
+            self.wait(driver)
             
         def extract_emphasize_text(driver) -> dict:
             
@@ -264,15 +281,11 @@ class ModelScraper_s_g(Scraper, Modeler):
             text_list = []
             text_dict = {}
             
-            text_elements = driver.find_elements(By.CLASS_NAME, 'custom-product-features__components')
-            for text_element in text_elements:
-                elements = text_element.find_elements(By.XPATH, ".//h2 | .//p")
-                
-                for elem in elements:
-                    text = elem.text.strip().lower()
-                    if text == '':
-                        continue
-                    text_list.append(text)
+            for text in self.feature_profile.extract(driver)["texts"]:
+                text = text.strip().lower()
+                if text == '':
+                    continue
+                text_list.append(text)
             
             text_grs = [['sound', 'smart', 'gaming', 'design', 'eco'],
                         ["picture", "sound", "design", "smart", "gaming", "eco"]]
@@ -304,13 +317,13 @@ class ModelScraper_s_g(Scraper, Modeler):
             def find_element_spec(driver) -> None:
                 element_spec = driver.find_element(By.XPATH, '//*[@id="PDPSpecificationsLink"]')
                 self.web_driver.move_element_to_center(element_spec)
-                time.sleep(self.wait_time)
+                self.wait(driver)
                 return None
                 
             def find_click_spec(driver) -> None:
                 element_click_spec = driver.find_element(By.XPATH, '//*[@id="PDPSpecificationsLink"]/cx-icon')
                 element_click_spec.click()
-                time.sleep(self.wait_time)
+                self.wait(driver)
                 return None
             
             def act_click_see_more(driver):
@@ -333,7 +346,7 @@ class ModelScraper_s_g(Scraper, Modeler):
                         if self.verbose:
                             print(f"Cannot find the 'see more' button from the second locator: {e}")
                             logging.error(f"Cannot find the 'see more' button from the second locator: {e}")
-                time.sleep(self.wait_time)
+                self.wait(driver)
                 return None
             
             find_element_spec(driver)
@@ -342,48 +355,37 @@ class ModelScraper_s_g(Scraper, Modeler):
             return None
             
         def extract_specs_detail(driver) -> dict:
-            def convert_soup_to_dict(soup):
-                """
-                Convert BeautifulSoup soup to dictionary.
-                """
-                try:
-                    h4_tag = soup.find('h4').text.strip()
-                    p_tag = soup.find('p').text.strip()
-                except :
-                    try:
-                        h4_tag = soup.find('h4').text.strip()
-                        p_tag = ""
-                    except Exception as e:
-                        if self.verbose:
-                            print("Parser error", exc_info=e)
-                            logging.error("Parser error", exc_info=e)
-                        h4_tag = "Parser error"
-                        p_tag = "Parser error"
-                return h4_tag, p_tag
-            
             dict_spec = {}
-            driver.find_element(By.ID, "ngb-nav-0-panel").click()
-            for _ in range(15):
-                elements = driver.find_elements(By.CLASS_NAME,"full-specifications__specifications-single-card__sub-list")
-                for element in elements:
-                    soup = BeautifulSoup(element.get_attribute("innerHTML"), 'html.parser')
-                    label, content  = convert_soup_to_dict(soup)
+            
+            def add_pairs(pairs) -> None:
+                for label, content in pairs:
+                    label, content = label.strip(), content.strip()
                     original_label = label
                     while label in dict_spec and dict_spec.get(label)!=content:
                         asterisk_count = label.count('*')
                         label = f"{original_label}{'*' * (asterisk_count + 1)}"
                     dict_spec[label] = content
-                    if self.verbose: 
-                        if label == "" and content == "":
-                            print(f"[{label}] {content}")
+            
+            driver.find_element(By.ID, "ngb-nav-0-panel").click()
+            page_source = None
+            for _ in range(15):
+                # 스크롤에서 벗어난 카드는 DOM 에서 빠지므로 매 단계 읽는다 (스냅샷은 바뀌었을 때만 파싱)
+                if not self.snapshot_mode:
+                    add_pairs(self.spec_profile.extract(driver)["pairs"])
+                else:
+                    page_source, previous = driver.page_source, page_source
+                    if page_source != previous:
+                        add_pairs(self.spec_profile.parse(page_source)["pairs"])
                 ActionChains(driver).key_down(Keys.PAGE_DOWN).perform()
 
             return dict_spec
         
         dict_spec = {}
+        own_driver = driver is None
 
         try:
-            driver = self.set_driver(url)
+            if own_driver:
+                driver = self.set_driver(url, stage="features")
             find_emphasize_text(driver)   
             dict_spec.update(extract_emphasize_text(driver))
 
@@ -393,11 +395,16 @@ class ModelScraper_s_g(Scraper, Modeler):
             logging.error(f"Failed to get header text from {url}.")
             pass
         finally:
-            if driver:  
-                driver.quit()  
+            if driver and own_driver:
+                self.release_driver(driver)  
             
         try:
-            driver = self.set_driver(url)
+            if own_driver:
+                driver = self.set_driver(url, stage="specs")
+            else:
+                # 같은 세션이면 기능 설명 단계가 내린 스크롤을 되돌려 새로 연 페이지와 같은 상태에서 시작
+                driver.execute_script("window.scrollTo(0, 0);")
+                self.wait(driver)
             find_spec_tab(driver)   
             dict_spec.update(extract_specs_detail(driver))
             if self.verbose:
@@ -407,13 +414,32 @@ class ModelScraper_s_g(Scraper, Modeler):
             print(f"error extract_specs_detail from {url}")
             pass
         finally:
-            if driver:  
-                driver.quit()  
+            if driver and own_driver:
+                self.release_driver(driver)  
             
         return dict_spec
+    
+    @Scraper.stage("product")
+    def _extract_product(self, url: str) -> dict:
+        """
+        Details, feature text and spec table of one model from a single browser session,
+        instead of one visit for the details and two for the specs; the row is the same.
+        Not retried itself: _extract_model_details and _extract_global_specs retry on their own.
+        """
+        driver = self.set_driver(url, stage="product")
+        try:
+            dict_info = self._extract_model_details(url, driver=driver)
+            dict_spec = self._extract_global_specs(url=url, driver=driver)
+        finally:
+            self.release_driver(driver)
+        dict_spec['url'] = url
+        dict_info.update(dict_spec)
+        return dict_info
         
 
     def remove_popup(self, driver) -> None:
+        if self.navigation_hook.applied(driver):
+            return None  # 페이지 로드 전에 모달을 숨겼으므로 기다릴 필요 없음
         try:
             close_button = WebDriverWait(driver, 3).until(
                 EC.presence_of_element_located((By.XPATH, '//*[@id="contentfulModalClose"]')))
@@ -426,9 +452,7 @@ class ModelScraper_s_g(Scraper, Modeler):
         except Exception as e:
             pass
 
-    def set_driver(self, url):
-        driver = self.web_driver.get_chrome()
-        driver.get(url=url)
-        time.sleep(self.wait_time)
+    def set_driver(self, url, stage: str = "page"):
+        driver = Scraper.set_driver(self, url, stage=stage)
         self.remove_popup(driver)
         return driver
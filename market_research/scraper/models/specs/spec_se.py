@@ -1,5 +1,3 @@
-from bs4 import BeautifulSoup
-import time
 import pandas as pd
 from tqdm import tqdm
 import re
@@ -7,10 +5,34 @@ import logging
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
 from market_research.scraper._scraper_scheme import Scraper, Modeler
+from market_research.scraper._retry_policy import RetryExhausted
+from market_research.scraper._navigation_hook import NavigationHook, ONETRUST_SELECTORS, onetrust_cookie
+from market_research.scraper._resource_policy import ResourcePolicy
+from market_research.scraper._sitemap import SitemapSource
+from market_research.scraper._scroll_harvester import ScrollHarvester
+from market_research.scraper._variant_resolver import VariantResolver
+from market_research.scraper._site_profile import SiteProfile
 from tools.file import FileManager
 
 
 class ModelScraper_se(Scraper, Modeler):
+    navigation_hook = NavigationHook(
+        cookies=[onetrust_cookie(".samsung.com")],
+        hide_selectors=ONETRUST_SELECTORS + ["#truste-consent-track"])
+    resource_policy = ResourcePolicy()
+    sitemap = SitemapSource(["https://www.samsung.com/us/sitemap.xml"],
+                            include=r"samsung\.com/us/televisions-home-theater/tvs/[^/]+/[^/]+-(qn|un|tq)[0-9a-z]+/?$",
+                            follow=r"product|televisions", min_urls=50)
+    spec_profile = SiteProfile(rows=['.subSpecsItem.Specs_subSpecsItem__acKTN', '.Specs_specRow__e9Ife.Specs_specDetailList__StjuR',
+                                     '.spec-highlight__container'],
+                               pairs=[('.Specs_subSpecItemName__IUPV4', '.Specs_subSpecsItemValue__oWnMq'),
+                                      ('.spec-highlight__title', '.spec-highlight__value')])
+    fingerprint_locators = [(By.CLASS_NAME, "PriceInfoText_priceInfo__QEjy8"), (By.CLASS_NAME, "ModelInfo_modalInfo__nJdjB")]
+    variant_resolver = VariantResolver(sitemap.include.pattern)
+    series_links = ScrollHarvester("a.StarReview-review-1813701344.undefined")
+    snapshot_name = "se_scrape_model_data.json"
+    price_locators = [(By.CLASS_NAME, "PriceInfoText_priceInfo__QEjy8")]
+
     def __init__(self, enable_headless=True,
                  export_prefix="sse_model_info_web", intput_folder_path="input", output_folder_path="results",
                  wait_time=1, verbose=False):
@@ -19,40 +41,31 @@ class ModelScraper_se(Scraper, Modeler):
         self.verbose = verbose
         pass
     
-    def fetch_model_data(self) -> pd.DataFrame:
+    def fetch_model_data(self, workers: int = 1, resume: bool = False) -> pd.DataFrame:
     
         
         def find_urls() -> dict:
-            url_set = set()
-            url_series_set = self._get_series_urls()
-
-            
-            for url in tqdm(url_series_set):
-                url_models_set = self._extract_models_from_series(url=url)
-                url_set.update(url_models_set)
+            self.frontier.begin_run()
+            if not self.discover_from_sitemap():
+                url_series_set = self._get_series_urls()
 
-            url_dict = {idx: url for idx, url in enumerate(url_set)}
+                for url in tqdm(self.frontier.dedupe(url_series_set)):
+                    try:
+                        url_models_set = self._extract_models_from_series(url=url)
+                    except RetryExhausted as e:
+                        print(f"skip series {url}: {e}")
+                        logging.error(f"skip series {url}: {e}")
+                        continue
+                    self.frontier.add_all(url_models_set)
+            url_dict = self.frontier.url_dict()
             print(f"Total model: {len(url_dict)}")
             return url_dict
         
         def extract_sepcs(url_dict):
-            dict_models = {}
-            for key, url in tqdm(url_dict.items()):
-                try:
-                    dict_info = self._extract_model_details(url)
-                    dict_models[key] = dict_info
-                    dict_spec = self._extract_global_specs(url=url)
-                    dict_spec['url'] = url
-                    dict_models[key].update(dict_spec)
-                except Exception as e:
-                    if self.verbose:
-                        print(f"fail to collect: {url}")
-                        print(e)
-                    pass
-            return dict_models
+            return self.extract_rows(url_dict, self._extract_row, workers=workers, resume=resume)
         
-        def transform_format(dict_models, json_file_name: str) -> pd.DataFrame:
-            df_models = pd.DataFrame.from_dict(dict_models).T
+        def transform_format(rows, json_file_name: str) -> pd.DataFrame:
+            df_models = pd.DataFrame(rows)
             df_models = df_models.drop(['Series'], axis=1)
             df_models = df_models.rename(columns={'Type':'display type'})
             df_models = df_models.dropna(subset=['price'])
@@ -67,14 +80,24 @@ class ModelScraper_se(Scraper, Modeler):
         print("start collecting data")
         url_dict = find_urls()
         # url_dict= {"0":"https://www.samsung.com/us/televisions-home-theater/tvs/crystal-uhd-tvs/50-class-crystal-uhd-du8000-un50du8000fxza/#reviews"}
-        dict_models = extract_sepcs(url_dict)
+        extract_sepcs(url_dict)
+        self.close_drivers()
+        self.report_waits()
+        self.report_retries()
+        self.report_rates()
+        self.report_cache()
+        self.report_tiers()
+        self.report_fingerprints()
         
-        df_models = transform_format(dict_models, json_file_name="se_scrape_model_data.json")
-            
-        FileManager.df_to_excel(df_models.reset_index(), file_name=self.output_xlsx_name)
+        with self.telemetry.stage("transform"):
+            df_models = transform_format(self.checkpoint.rows(url_dict.values()), json_file_name=self.snapshot_name)
+        with self.telemetry.stage("export"):
+            FileManager.df_to_excel(df_models.reset_index(), file_name=self.output_xlsx_name)
+        self.report_run()
         return df_models
     
-    @Scraper.try_loop(2)
+    @Scraper.stage("series")
+    @Scraper.retry(2)
     def _get_series_urls(self) -> set:
 
         def extract_urls_from_segments():
@@ -99,31 +122,19 @@ class ModelScraper_se(Scraper, Modeler):
             url_series = set()
             url = url
             prefix = prefix
-            step = 200
 
             try:
-                driver = self.set_driver(url)
-                
-                scroll_distance_total = self.web_driver.get_scroll_distance_total()
-                scroll_distance = 0
+                driver = self.set_driver(url, stage="series")
                 
-                while scroll_distance < scroll_distance_total:
-                    for _ in range(2):
-                        html = driver.page_source
-                        soup = BeautifulSoup(html, 'html.parser')
-                        elements = soup.find_all('a', class_="StarReview-review-1813701344 undefined")
-                        for element in elements:
-                            url_series.add(prefix + element['href'].strip())
-                        driver.execute_script(f"window.scrollBy(0, {step});")
-                        time.sleep(self.wait_time)
-                        scroll_distance += step
+                for href in self.series_links.harvest(driver, wait=self.wait):
+                    url_series.add(prefix + href.strip())
                 return url_series
             except Exception as e:
                 if self.verbose:
                     print(f"error find_series_urls: {e}")
                 pass
             finally:
-                driver.quit()
+                self.release_driver(driver)
                
         url_series = extract_urls_from_segments()
         adding_ex_url='https://www.samsung.com/us/televisions-home-theater/tvs/samsung-neo-qled-4k/65-class-samsung-neo-qled-4k-qn95d-qn65qn95dafxza/'
@@ -133,7 +144,8 @@ class ModelScraper_se(Scraper, Modeler):
             print(f"Series: [{i}] {url.split('/')[-2]}")
         return url_series
     
-    @Scraper.try_loop(2)
+    @Scraper.stage("models")
+    @Scraper.retry(2)
     def _extract_models_from_series(self, url: str) -> set:
         
         def extract_model_url(driver)->set:
@@ -146,16 +158,35 @@ class ModelScraper_se(Scraper, Modeler):
                 url =  driver.current_url
                 url_models_set.add(url.strip())
             return url_models_set
-        url_models_set = set()
+        
+        def resolve_model_url() -> set:
+            try:
+                response = self.http_get(url)
+                if response.ok:
+                    return set(self.variant_resolver.resolve(response.text, url))
+            except Exception as e:
+                logging.debug(f"variant json failed for {url}: {e}")
+            return set()
+        
+        url_models_set = resolve_model_url()
+        if url_models_set:
+            return url_models_set
+        # 상태 JSON 이 없으면 사이즈 타일을 하나씩 클릭
+        driver = None
         try: 
-            driver = self.set_driver(url)
+            driver = self.set_driver(url, stage="models")
             url_models_set =  extract_model_url(driver)  
         except Exception as e:
             if self.verbose:
                 print(f"error_extract_models_from_series {url}")
+            logging.error(f"error_extract_models_from_series {url}: {e}")
+        finally:
+            if driver:
+                self.release_driver(driver)
         return url_models_set
             
-    @Scraper.try_loop(5)
+    @Scraper.stage("details")
+    @Scraper.retry(5)
     def _extract_model_details(self, url: str='') -> dict:
     
         def extract_model(driver):
@@ -172,34 +203,6 @@ class ModelScraper_se(Scraper, Modeler):
                 # print(f"description: {description}")    
             return {"description": description}
              
-        def extract_prices(driver)->dict:
-            prices_dict = dict()
-            try:
-                price = driver.find_element(By.CLASS_NAME, "PriceInfoText_priceInfo__QEjy8")      
-                # split_price = price.text.split('\n')
-                split_price = re.split(r'[\n\s]+', price.text)
-                prices = []
-                # print(split_price)
-                for price_text in split_price:
-                    try:
-                        cleaned_price = price_text.replace('$', '').replace(',', '')
-                        prices.append(float(cleaned_price))
-                    except ValueError:
-                        continue  
-                if len(prices) > 2:
-                    dict_info["price"] = prices[0]
-                    dict_info["price_original"] = prices[1]
-                    dict_info["price_gap"] = prices[2]
-                else:
-                    dict_info["price"] = prices[0]
-                    prices_dict['price_original'] = prices[0]
-                    prices_dict['price_gap'] = 0.0
-            except:
-                prices_dict['price'] = float('nan')
-                prices_dict['price_original'] = float('nan')
-                prices_dict['price_gap'] = float('nan')
-            return prices_dict
-            
 
         def extract_info_from_model(model: str)->dict:
 
@@ -276,12 +279,12 @@ class ModelScraper_se(Scraper, Modeler):
             print(f"Connecting to {url.split('/')[-2]}: {url}")
         logging.info(f"Connecting to {url.split('/')[-2]}: {url}")
         try: 
-            driver = self.set_driver(url)
+            driver = self.open_page(url, required=[(By.CLASS_NAME, "ModelInfo_modalInfo__nJdjB"), *self.price_locators], stage="details")
             
             # Extract model
             dict_info.update(extract_model(driver))
             dict_info.update(extract_description(driver))
-            dict_info.update(extract_prices(driver))
+            dict_info.update(self._extract_prices(driver))
             dict_info.update(extract_info_from_model(dict_info.get("model")))
             if self.verbose: 
                 print(dict_info)
@@ -295,11 +298,40 @@ class ModelScraper_se(Scraper, Modeler):
             pass
         finally:
             if driver:  
-                driver.quit()    
+                self.release_driver(driver)    
         return dict_info
 
 
-    @Scraper.try_loop(3)
+    def _extract_prices(self, driver, row: dict = None) -> dict:
+        prices_dict = dict()
+        try:
+            price = driver.find_element(By.CLASS_NAME, "PriceInfoText_priceInfo__QEjy8")      
+            # split_price = price.text.split('\n')
+            split_price = re.split(r'[\n\s]+', price.text)
+            prices = []
+            # print(split_price)
+            for price_text in split_price:
+                try:
+                    cleaned_price = price_text.replace('$', '').replace(',', '')
+                    prices.append(float(cleaned_price))
+                except ValueError:
+                    continue  
+            if len(prices) > 2:
+                prices_dict["price"] = prices[0]
+                prices_dict["price_original"] = prices[1]
+                prices_dict["price_gap"] = prices[2]
+            else:
+                prices_dict["price"] = prices[0]
+                prices_dict['price_original'] = prices[0]
+                prices_dict['price_gap'] = 0.0
+        except:
+            prices_dict['price'] = float('nan')
+            prices_dict['price_original'] = float('nan')
+            prices_dict['price_gap'] = float('nan')
+        return prices_dict
+
+    @Scraper.stage("specs")
+    @Scraper.retry(3)
     def _extract_global_specs(self, url: str) -> dict:
         def find_spec_tab(driver) -> None:
             try: 
@@ -309,41 +341,17 @@ class ModelScraper_se(Scraper, Modeler):
                 # 'See All Specs' 버튼 클릭
                 driver.execute_script("arguments[0].click();", driver.find_element(By.CSS_SELECTOR, ".keyboard_navigateable.tl-btn-expand.Specs_expandBtn__0BNA_"))
                 
-                time.sleep(self.wait_time)
+                self.wait(driver)
             except Exception as e :
                 if self.verbose:
                     print(f"error find_spec_tab {e}")
                 pass
-                time.sleep(self.wait_time)
+                self.wait(driver)
             return None 
 
         def extract_spec_detail(driver) -> dict:  
             dict_spec = {}
-            try:
-                table_elements = driver.find_elements(By.CLASS_NAME, "subSpecsItem.Specs_subSpecsItem__acKTN")
-            except:
-                try:
-                    table_elements = driver.find_elements(By.CLASS_NAME, "Specs_specRow__e9Ife.Specs_specDetailList__StjuR")
-                except:
-                    try:
-                        table_elements = driver.find_elements(By.CLASS_NAME, "spec-highlight__container")
-                    except Exception as e:
-                        print(f"error extract_spec_detail_click {e}")
-            for element in table_elements:
-                try:
-                    item_name = element.find_element(By.CLASS_NAME, 'Specs_subSpecItemName__IUPV4').text
-                    item_value = element.find_element(By.CLASS_NAME, 'Specs_subSpecsItemValue__oWnMq').text
-                except:
-                    try:
-                        item_name = element.find_element(By.CLASS_NAME, 'Specs_subSpecItemName__IUPV4.Specs_type-p2__s07Sd').text
-                        item_value = element.find_element(By.CLASS_NAME, 'Specs_type-p2__s07Sd.Specs_subSpecsItemValue__oWnMq').text 
-                    except:
-                        try:
-                            item_name = element.find_element(By.CLASS_NAME, "spec-highlight__title").text
-                            item_value = element.find_element(By.CLASS_NAME, "spec-highlight__value").text 
-                        except Exception as e:
-                            print(f"error extract_spec_detail_table {e}")  
-
+            for item_name, item_value in self.spec_profile.extract(driver)["pairs"]:
                 label = re.sub(r'[\n?]', '', item_name)
                 content = re.sub(r'[\n?]', '', item_value)
                 original_label = label
@@ -351,14 +359,11 @@ class ModelScraper_se(Scraper, Modeler):
                     asterisk_count = label.count('*')
                     label = f"{original_label}{'*' * (asterisk_count + 1)}"
                 dict_spec[label] = content
-                if self.verbose: 
-                    if label == "" and content == "":
-                        print(f"[{label}] {content}")
             return dict_spec
     
         dict_spec = {}
         try:
-            driver = self.set_driver(url)
+            driver = self.set_driver(url, stage="specs")
             find_spec_tab(driver)
             dict_spec = extract_spec_detail(driver)
             
@@ -369,11 +374,5 @@ class ModelScraper_se(Scraper, Modeler):
             print(f"error extract_specs_detail from {url}")
             pass
         finally:
-            driver.quit()  
+            self.release_driver(driver)  
         return dict_spec
-
-    def set_driver(self, url):
-        driver = self.web_driver.get_chrome()
-        driver.get(url=url)
-        time.sleep(self.wait_time)
-        return driver
\ No newline at end of file
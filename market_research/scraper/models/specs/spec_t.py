@@ -1,14 +1,29 @@
 from bs4 import BeautifulSoup
-import time
-from tqdm import tqdm
 import pandas as pd
 import re 
 from selenium.webdriver.common.by import By
 from tools.file import FileManager
 from market_research.scraper._scraper_scheme import Scraper, Modeler
+from market_research.scraper._retry_policy import RetryExhausted
+from market_research.scraper._navigation_hook import NavigationHook, ONETRUST_SELECTORS, onetrust_cookie
+from market_research.scraper._resource_policy import ResourcePolicy
+from market_research.scraper._sitemap import SitemapSource
+from market_research.scraper._scroll_harvester import ScrollHarvester
 import logging
 
 class ModelScraper_t(Scraper, Modeler):
+    navigation_hook = NavigationHook(
+        cookies=[onetrust_cookie(".tcl.com")],
+        hide_selectors=ONETRUST_SELECTORS)
+    resource_policy = ResourcePolicy()
+    sitemap = SitemapSource(["https://www.tcl.com/us/en/sitemap.xml"], include=r"tcl\.com/us/en/products/home-theater/[^/]+/[^/]+$",
+                            min_urls=10)
+    fingerprint_locators = [(By.XPATH, '//*[@id="product-details"]/header')]
+    series_links = ScrollHarvester("a.button.primary", text="learn more")
+    snapshot_name = "t_scrape_model_data.json"
+    price_locators = [(By.XPATH, '//*[@id="product-details"]/header/div/div[2]/h4/span')]
+    async_backend = True  # playwright 가 설치되어 있으면 한 번의 방문으로 상세+스펙을 수집
+
     def __init__(self, enable_headless=True,
                  export_prefix="tcl_model_info_web", intput_folder_path="input", output_folder_path="results",
                  wait_time=1 ,verbose=False):
@@ -17,34 +32,30 @@ class ModelScraper_t(Scraper, Modeler):
         self.verbose = verbose
         pass
     
-    def fetch_model_data(self) -> pd.DataFrame:
+    def fetch_model_data(self, workers: int = 1, resume: bool = False) -> pd.DataFrame:
         def find_urls() -> dict:
-            url_set = set()
-            url_series_set = self._get_series_urls()
+            self.frontier.begin_run()
+            if not self.discover_from_sitemap():
+                url_series_set = self._get_series_urls()
 
-            for url in url_series_set:
-                url_models_set = self._extract_models_from_series(url=url)
-                url_set.update(url_models_set)
-            url_dict = {idx: url for idx, url in enumerate(url_set)}
+                for url in self.frontier.dedupe(url_series_set):
+                    try:
+                        url_models_set = self._extract_models_from_series(url=url)
+                    except RetryExhausted as e:
+                        print(f"skip series {url}: {e}")
+                        logging.error(f"skip series {url}: {e}")
+                        continue
+                    self.frontier.add_all(url_models_set)
+            url_dict = self.frontier.url_dict()
             print(f"Total model: {len(url_dict)}")
             logging.info(f"Total model: {len(url_dict)}")
             return url_dict
         
         def extract_specs(url_dict):
-            dict_models = {}
-            for key, url in tqdm(url_dict.items()):
-                try:
-                    dict_info = self._extract_model_details(url)
-                    dict_models[key] = dict_info
-                    dict_spec = self._extract_global_specs(url=url)
-                    dict_spec['url'] = url
-                    dict_models[key].update(dict_spec)
-                except Exception as e:
-                    pass
-            return dict_models
+            return self.extract_rows(url_dict, self._extract_row, workers=workers, resume=resume)
         
-        def transform_format(dict_models, json_file_name: str) -> pd.DataFrame:
-            df_models = pd.DataFrame.from_dict(dict_models).T
+        def transform_format(rows, json_file_name: str) -> pd.DataFrame:
+            df_models = pd.DataFrame(rows)
             df_models = df_models.dropna(subset=['price'])
             df_models.to_json(self.output_folder / json_file_name, orient='records', lines=True)
             return df_models
@@ -53,14 +64,24 @@ class ModelScraper_t(Scraper, Modeler):
         print("start collecting data")
         logging.info("start collecting data")
         url_dict = find_urls()
-        dict_models = extract_specs(url_dict)
-        df_models = transform_format(dict_models, json_file_name="t_scrape_model_data.json")
-            
-        FileManager.df_to_excel(df_models.reset_index(), file_name=self.output_xlsx_name)
+        extract_specs(url_dict)
+        self.close_drivers()
+        self.report_waits()
+        self.report_retries()
+        self.report_rates()
+        self.report_cache()
+        self.report_tiers()
+        self.report_fingerprints()
+        with self.telemetry.stage("transform"):
+            df_models = transform_format(self.checkpoint.rows(url_dict.values()), json_file_name=self.snapshot_name)
+        with self.telemetry.stage("export"):
+            FileManager.df_to_excel(df_models.reset_index(), file_name=self.output_xlsx_name)
+        self.report_run()
         return df_models
     
 
-    @Scraper.try_loop(2)
+    @Scraper.stage("series")
+    @Scraper.retry(2)
     def _get_series_urls(self) -> set:
         def find_series_urls(url:str, prefix:str) -> set:
             print(f"Starting to scrape series URLs from: {url}")
@@ -68,23 +89,10 @@ class ModelScraper_t(Scraper, Modeler):
             url_series = set()
             url = url
             prefix = prefix
-            step = 200
             try:
-                driver = self.set_driver(url)
-                scroll_distance_total = self.web_driver.get_scroll_distance_total()
-                scroll_distance = 0
-
-                while scroll_distance < scroll_distance_total:
-                    for _ in range(2):
-                        html = driver.page_source
-                        soup = BeautifulSoup(html, 'html.parser')
-                        elements = soup.find_all('a', class_="button primary")
-                        for element in elements:
-                            if element.text.lower() == 'learn more':
-                                url_series.add(prefix + element['href'].strip())
-                        driver.execute_script(f"window.scrollBy(0, {step});")
-                        time.sleep(self.wait_time)
-                        scroll_distance += step
+                driver = self.set_driver(url, stage="series")
+                for href in self.series_links.harvest(driver, wait=self.wait):
+                    url_series.add(prefix + href.strip())
                 return url_series
             except Exception as e:
                 if self.verbose:
@@ -93,7 +101,7 @@ class ModelScraper_t(Scraper, Modeler):
                 pass
             finally:
                 if driver:  
-                    driver.quit()                 
+                    self.release_driver(driver)                 
         url_series = find_series_urls(url = "https://www.tcl.com/us/en/products/home-theater", prefix = "")
         print(f"The website scan has been completed.\ntotal series: {len(url_series)}")
         logging.info(f"The website scan has been completed.\ntotal series: {len(url_series)}")
@@ -102,13 +110,14 @@ class ModelScraper_t(Scraper, Modeler):
             logging.info(f"Series: [{i}] {url.split('/')[-1]}")
         return url_series
     
-    @Scraper.try_loop(2)
+    @Scraper.stage("models")
+    @Scraper.retry(2)
     def _extract_models_from_series(self, url: str) -> set:
         url_models_set = set()
         print(f"Trying to extract models from series: {url}")
         logging.info(f"Trying to extract models from series: {url}")
         
-        driver = self.set_driver(url)        
+        driver = self.open_page(url, required=[(By.CLASS_NAME, 'product-variants')], stage="models")        
         try: 
             element = driver.find_element(By.CLASS_NAME, 'product-variants')
             url_elements = element.find_elements(By.TAG_NAME, 'a')
@@ -124,13 +133,14 @@ class ModelScraper_t(Scraper, Modeler):
             logging.error(f"Error extracting models from series: {e}")
         finally:
             if driver:  
-                driver.quit()  
+                self.release_driver(driver)  
                 
         return url_models_set
         
     
             
-    @Scraper.try_loop(2)
+    @Scraper.stage("details")
+    @Scraper.retry(2)
     def _extract_model_details(self, url: str) -> dict:
         
         def extract_model(driver):
@@ -148,52 +158,20 @@ class ModelScraper_t(Scraper, Modeler):
             description = description.replace('"',"")
             return {"description": description}
         
-        def extract_prices(driver)->dict:
-            prices_dict = dict()
-            try:
-                price_now = driver.find_element(By.XPATH,
-                                                '//*[@id="product-details"]/header/div/div[2]/h4/span').text
-                price_now = float(price_now.replace('$', '').replace(',', ''))
-                prices_dict['price'] = price_now
-                prices_dict['price_original'] = price_now
-                prices_dict['price_gap'] = 0.0
-            except:
-                prices_dict['price'] = float('nan')
-                prices_dict['price_original'] = float('nan')
-                prices_dict['price_gap'] = float('nan')
-            return prices_dict
-        
-
 
-        def extract_info_from_model(model: str)->dict:
-            model = model.lower()  # 대소문자 구분 제거
-            dict_info = {}
 
-            # 연도 매핑
-            year_mapping =  {'0': "2023",
-                            '1': "2024",
-                            '2': "2025",
-                            }
-
-            match = re.match(r"^(\d+)([A-Za-z].*)$", model)      
-            dict_info["size"] = match.group(1)
-            dict_info["series"] = match.group(2)
-            dict_info["year"] = match.group(2)[-2]
-            dict_info["year"] = year_mapping.get(dict_info.get("year"), None)
-            return dict_info
-        
         dict_info = {}
         if self.verbose:
             print(f"Connecting to {url.split('/')[-1]}: {url}")
         logging.info(f"Connecting to {url.split('/')[-1]}: {url}")
         try:
-            driver = self.set_driver(url)
+            driver = self.open_page(url, required=[(By.XPATH, '//*[@id="product-details"]/header/div/div[1]/p'), *self.price_locators], stage="details")
             
             # Extract model
             dict_info.update(extract_model(driver))
             dict_info.update(extract_description(driver))
-            dict_info.update(extract_prices(driver))
-            dict_info.update(extract_info_from_model(dict_info.get("model")))
+            dict_info.update(self._extract_prices(driver))
+            dict_info.update(self._extract_info_from_model(dict_info.get("model")))
             if self.verbose: 
                 print(dict_info)
             logging.info(dict_info)
@@ -204,52 +182,52 @@ class ModelScraper_t(Scraper, Modeler):
             pass
         finally:
             if driver:  
-                driver.quit()  
+                self.release_driver(driver)  
         return dict_info
     
-    @Scraper.try_loop(5)
+    def _extract_prices(self, driver, row: dict = None) -> dict:
+        prices_dict = dict()
+        try:
+            price_now = driver.find_element(By.XPATH,
+                                            '//*[@id="product-details"]/header/div/div[2]/h4/span').text
+            price_now = float(price_now.replace('$', '').replace(',', ''))
+            prices_dict['price'] = price_now
+            prices_dict['price_original'] = price_now
+            prices_dict['price_gap'] = 0.0
+        except:
+            prices_dict['price'] = float('nan')
+            prices_dict['price_original'] = float('nan')
+            prices_dict['price_gap'] = float('nan')
+        return prices_dict
+
+    @Scraper.stage("specs")
+    @Scraper.retry(5)
     def _extract_global_specs(self, url: str) -> dict:
         
         def find_spec_tab(driver) -> None:
             try: 
-                time.sleep(self.wait_time)
+                self.wait(driver)
                 driver.execute_script("arguments[0].click();", driver.find_element(By.XPATH, '//*[@id="cmp-tabs"]/div[1]/div/ol/li[2]'))
-                time.sleep(self.wait_time)
+                self.wait(driver)
             except Exception as e :
                 if self.verbose:
                     print(f"error find_spec_tab {e}")
                 pass
-                time.sleep(self.wait_time)
+                self.wait(driver)
                 
             return None 
             
         def extract_specs_detail(driver) -> dict:         
-            dict_spec = {}
             try:
                 elements = driver.find_elements(By.CLASS_NAME,"table.aem-GridColumn.aem-GridColumn--default--12")
-                for element in elements:
-                  
-                    soup = BeautifulSoup(element.get_attribute("innerHTML"), 'html.parser')
-                    table = soup.find('table')
-                    rows = table.find_all('tr')
-                    
-                    for row in rows:
-                        columns = row.find_all('td')
-                        if len(columns) == 2:
-                            label = columns[0].find('p').get_text(strip=True)
-                            value = columns[1].get_text(strip=True)
-                            if label.lower() in ['model', 'description']:
-                                continue
-                            dict_spec[label] = value
-                return dict_spec
+                return self._parse_spec_tables([element.get_attribute("innerHTML") for element in elements])
             except Exception as e:
                 print(e)
                 
         dict_specs = {}
         try:
-            driver = self.set_driver(url)
+            driver = self.set_driver(url, stage="specs")
             find_spec_tab(driver)   
-            driver.save_screenshot(f'{url}.png')
             dict_specs.update(extract_specs_detail(driver))
             if self.verbose:
                 print(f"Received information from {url}")
@@ -259,13 +237,73 @@ class ModelScraper_t(Scraper, Modeler):
             pass
         finally:
             if driver:  
-                driver.quit()  
+                self.release_driver(driver)  
             
         return dict_specs
-        
 
-    def set_driver(self, url):
-        driver = self.web_driver.get_chrome()
-        driver.get(url=url)
-        time.sleep(self.wait_time)
-        return driver
\ No newline at end of file
+    def _extract_info_from_model(self, model: str)->dict:
+        model = model.lower()  # 대소문자 구분 제거
+        dict_info = {}
+
+        # 연도 매핑
+        year_mapping =  {'0': "2023",
+                        '1': "2024",
+                        '2': "2025",
+                        }
+
+        match = re.match(r"^(\d+)([A-Za-z].*)$", model)      
+        dict_info["size"] = match.group(1)
+        dict_info["series"] = match.group(2)
+        dict_info["year"] = match.group(2)[-2]
+        dict_info["year"] = year_mapping.get(dict_info.get("year"), None)
+        return dict_info
+
+    def _parse_spec_tables(self, tables_html: list) -> dict:
+        dict_spec = {}
+        for table_html in tables_html:
+            soup = BeautifulSoup(table_html, 'html.parser')
+            table = soup.find('table')
+            rows = table.find_all('tr')
+            
+            for row in rows:
+                columns = row.find_all('td')
+                if len(columns) == 2:
+                    label = columns[0].find('p').get_text(strip=True)
+                    value = columns[1].get_text(strip=True)
+                    if label.lower() in ['model', 'description']:
+                        continue
+                    dict_spec[label] = value
+        return dict_spec
+
+    async def _extract_row_async(self, page, url: str) -> dict:
+        """
+        Model details and specs from a single visit on the async backend.
+        """
+        header = page.locator('#product-details header')
+        model = await header.locator('xpath=div/div[1]/p').inner_text(timeout=10000)
+        dict_info = {"model": model.lower().replace("model","").strip()}
+        try:
+            description = await header.locator('xpath=div/div[1]/h1').inner_text(timeout=2000)
+        except Exception:
+            description = ""
+        dict_info["description"] = description.replace('"',"")
+        try:
+            price_now = await header.locator('xpath=div/div[2]/h4/span').inner_text(timeout=2000)
+            price_now = float(price_now.replace('$', '').replace(',', ''))
+            dict_info.update({'price': price_now, 'price_original': price_now, 'price_gap': 0.0})
+        except Exception:
+            dict_info.update({'price': float('nan'), 'price_original': float('nan'), 'price_gap': float('nan')})
+        dict_info.update(self._extract_info_from_model(dict_info.get("model")))
+
+        try:
+            await page.locator('xpath=//*[@id="cmp-tabs"]/div[1]/div/ol/li[2]').dispatch_event("click", timeout=5000)
+        except Exception as e:
+            if self.verbose:
+                print(f"error find_spec_tab {e}")
+        tables = page.locator('.table.aem-GridColumn.aem-GridColumn--default--12')
+        await tables.first.wait_for(state="attached", timeout=5000)
+        dict_spec = self._parse_spec_tables(await tables.evaluate_all("elements => elements.map(element => element.innerHTML)"))
+        dict_spec['url'] = url
+        dict_info.update(dict_spec)
+        logging.info(f"Received information from {url}")
+        return dict_info
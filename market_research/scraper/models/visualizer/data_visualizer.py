@@ -4,7 +4,7 @@ from tools.file import FileManager
 import plotly.graph_objs as go
 from market_research.scraper.models.visualizer.data_cleaner import DataCleaner
 from market_research.scraper._visualization_scheme import BaseVisualizer
-import requests
+from market_research._http import HTTP
 import plotly.io as pio
 import plotly.express as px
 
@@ -256,7 +256,7 @@ class DataVisualizer(BaseVisualizer):
         if col_selected is None:
             try:
                 file_path = "https://raw.githubusercontent.com/xikest/research_market_tv/main/json/col_heatmap.json"              
-                response = requests.get(file_path)
+                response = HTTP.get(file_path)
                 data = response.json()
                 col_selected = data.get(self.maker)
             except Exception as e:
@@ -1,4 +1,3 @@
-import time
 from selenium.webdriver.common.by import By
 from bs4 import BeautifulSoup
 import pandas as pd
@@ -67,6 +66,8 @@ class Rtings(Scraper, Rvisualizer):
                     print(f"fail {url}")
                     print(e)
                 continue
+        self.close_drivers()
+        self.report_waits()
             
         scores_df = scores_df.reset_index(drop=True)
         measurement_df = measurement_df.reset_index(drop=True)
@@ -93,9 +94,9 @@ class Rtings(Scraper, Rvisualizer):
     def _get_score(self, url:str="https://www.rtings.com/tv/reviews/sony/a95l-oled") :
 
         url = url.lower()
-        driver = self.web_driver.get_chrome()
-        driver.get(url)
-        time.sleep(self.wait_time)     
+        driver = self.driver_pool.lease()
+        self.navigate(driver, url)
+        self.wait(driver, until="network")     
 
 
         # scorecard-row-content 클래스를 가진 요소들을 선택
@@ -117,7 +118,7 @@ class Rtings(Scraper, Rvisualizer):
             if self.verbose:
                 print(f"get specification error: {e}")
         finally:
-            driver.quit()
+            self.release_driver(driver)
             
 
     def _get_comments(self, url:str="https://www.rtings.com/tv/reviews/sony/a95l-oled", min_sentence_length = 0):
@@ -127,13 +128,13 @@ class Rtings(Scraper, Rvisualizer):
         """
 
         # Selenium을 사용하여 웹 드라이버 시작
-        driver = self.web_driver.get_chrome()
+        driver = self.driver_pool.lease()
         maker = url.split("/")[-2]
         product = url.split("/")[-1]
         url = url.lower()
         # url = url +"#page-comments"
-        driver.get(url)
-        time.sleep(self.wait_time)
+        self.navigate(driver, url)
+        self.wait(driver, until="network")
         ## Load More 버튼 열기
         try:
             while True:
@@ -141,7 +142,7 @@ class Rtings(Scraper, Rvisualizer):
                     button_div = driver.find_element(By.CLASS_NAME, "comment_list-footer")
                     button = button_div.find_element(By.CLASS_NAME, "e-button")
                     button.click()
-                    time.sleep(1)
+                    self.wait(driver, timeout=1)
                 except:
                     break
             try:
@@ -166,7 +167,7 @@ class Rtings(Scraper, Rvisualizer):
                             {'idx': idx, 'maker': maker, 'product': product, 'sentences': comment_text})
                 comments_df = pd.DataFrame(comments_list).set_index("idx")
             finally:
-                driver.quit()
+                self.release_driver(driver)
         except:
             if self.verbose:
                 print("no comment")
@@ -179,11 +180,11 @@ class Rtings(Scraper, Rvisualizer):
         
 
         url = url.lower()
-        driver = self.web_driver.get_chrome()
-        driver.get(url)
-        time.sleep(self.wait_time)
+        driver = self.driver_pool.lease()
+        self.navigate(driver, url)
+        self.wait(driver, until="network")
         page_source = driver.page_source
-        driver.quit()
+        self.release_driver(driver)
         soup = BeautifulSoup(page_source, 'html.parser')
 
         results_list = []
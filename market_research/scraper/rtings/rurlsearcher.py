@@ -1,4 +1,3 @@
-import time
 from selenium.webdriver.common.keys import Keys
 from bs4 import BeautifulSoup
 import pandas as pd
@@ -78,8 +77,8 @@ class Rurlsearcher(Scraper):
 
 
     def _check_url_with_keywords(self, url: str, keywords: list):
-        driver = self.web_driver.get_chrome()
-        driver.get(url)
+        driver = self.driver_pool.lease()
+        self.navigate(driver, url)
 
        
 
@@ -97,7 +96,7 @@ class Rurlsearcher(Scraper):
         except:
           return None
         finally:
-          driver.quit()
+          self.release_driver(driver)
 
     
     def get_urls_from_web(self, keywords: set = None) -> list:
@@ -112,16 +111,16 @@ class Rurlsearcher(Scraper):
 
 
     def _search_and_extract_url(self, search_query: str, url_check:str=None, base_url="https://www.rtings.com"):
-        driver = self.web_driver.get_chrome()
+        driver = self.driver_pool.lease()
         if self.verbose:
                 print(f"search_query: {search_query}")
                 print(f"checking [{url_check}/review] in url") 
         try:
-            driver.get(base_url)
+            self.navigate(driver, base_url)
             search_input = driver.find_element("class name", "searchbar-input")
             search_input.send_keys(search_query)
             search_input.send_keys(Keys.RETURN)
-            time.sleep(self.wait_time)
+            self.wait(driver, until="element", locator=("class name", "searchbar_results-main"))
             page_source = driver.page_source
             soup = BeautifulSoup(page_source, 'html.parser')
             search_results = soup.find_all('div', class_='searchbar_results-main')
@@ -146,5 +145,5 @@ class Rurlsearcher(Scraper):
 
         finally:
             # 브라우저 종료
-            driver.quit()
+            self.release_driver(driver)
         return None
\ No newline at end of file
@@ -15,6 +15,11 @@ setup(
         'scikit-learn', 'openai',
         'matplotlib', 'seaborn', 'plotly'
     ],
+    extras_require={
+        'async': ['playwright'],
+        'brotli': ['brotli'],
+        'fast-parser': ['selectolax', 'cssselect'],
+    },
 
     entry_points={
         'console_scripts': [
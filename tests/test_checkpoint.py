@@ -0,0 +1,64 @@
+import pytest
+from market_research.scraper._checkpoint import Checkpoint
+
+
+@pytest.fixture(params=["file", "memory"])
+def checkpoint(request, tmp_path):
+    return Checkpoint(tmp_path / "sony_checkpoint.jsonl" if request.param == "file" else None)
+
+
+def test_resume_skips_completed_urls(checkpoint):
+    checkpoint.append("https://www.sony.com/tv/A/", {"model": "A"})
+    checkpoint.append("https://www.sony.com/tv/B", {"model": "B"}, ok=False)
+    checkpoint.append("https://www.sony.com/tv/C?utm_source=x", {"model": "C"})
+    assert checkpoint.done() == {"https://www.sony.com/tv/A", "https://www.sony.com/tv/C"}
+
+
+def test_last_line_of_a_url_wins(checkpoint):
+    checkpoint.append("https://www.sony.com/tv/A", {"model": "A", "price": None}, ok=False)
+    checkpoint.append("https://www.sony.com/tv/A/", {"model": "A", "price": 999.0})
+    assert checkpoint.done() == {"https://www.sony.com/tv/A"}
+    assert list(checkpoint.rows()) == [{"model": "A", "price": 999.0}]
+
+
+def test_rows_follow_given_order(checkpoint):
+    for model in ("C", "A", "B"):
+        checkpoint.append(f"https://www.sony.com/tv/{model}", {"model": model})
+    assert [row["model"] for row in checkpoint.rows()] == ["C", "A", "B"]
+    order = ["https://www.sony.com/tv/A", "https://www.sony.com/tv/B/", "https://www.sony.com/tv/X", "https://www.sony.com/tv/C"]
+    assert [row["model"] for row in checkpoint.rows(order)] == ["A", "B", "C"]
+
+
+def test_ordered_rows_are_read_back_from_their_lines(checkpoint):
+    '''순서대로 읽을 때도 각 url 의 마지막 줄을 다시 읽어 온다 (멀티바이트 문자가 있어도 위치가 맞다)'''
+    checkpoint.append("https://www.sony.com/tv/A", {"model": "A", "text0": "화면 크기 65\""}, ok=False)
+    checkpoint.append("https://www.sony.com/tv/B", {"model": "B", "text0": "리프레시 120Hz"})
+    checkpoint.append("https://www.sony.com/tv/A", {"model": "A", "text0": "65\" 화면"})
+    order = ["https://www.sony.com/tv/B", "https://www.sony.com/tv/A"]
+    assert list(checkpoint.rows(order)) == [{"model": "B", "text0": "리프레시 120Hz"}, {"model": "A", "text0": "65\" 화면"}]
+
+
+def test_reset(checkpoint):
+    checkpoint.append("https://www.sony.com/tv/A", {"model": "A"})
+    checkpoint.reset()
+    assert checkpoint.done() == set()
+    assert list(checkpoint.rows()) == []
+
+
+def test_resume_after_crash_mid_line(tmp_path):
+    '''중단되어 반쯤 쓰인 마지막 줄은 건너뛰고, 다음 줄은 새 줄에서 시작한다'''
+    path = tmp_path / "sony_checkpoint.jsonl"
+    Checkpoint(path).append("https://www.sony.com/tv/A", {"model": "A"})
+    with open(path, "a", encoding="utf-8") as file:
+        file.write('{"url": "https://www.sony.com/tv/B", "ok": tr')
+    resumed = Checkpoint(path)
+    assert resumed.done() == {"https://www.sony.com/tv/A"}
+    resumed.append("https://www.sony.com/tv/B", {"model": "B"})
+    assert resumed.done() == {"https://www.sony.com/tv/A", "https://www.sony.com/tv/B"}
+    assert [row["model"] for row in resumed.rows()] == ["A", "B"]
+
+
+def test_missing_file_is_empty(tmp_path):
+    checkpoint = Checkpoint(tmp_path / "none.jsonl")
+    assert checkpoint.done() == set()
+    assert list(checkpoint.rows()) == []
@@ -0,0 +1,119 @@
+import threading
+from types import SimpleNamespace
+import pytest
+from market_research.scraper._driver_pool import DriverPool, LocalWebDriver
+
+
+class Session:
+    """
+    Chrome session stand-in recording what the pool does to it between leases.
+    """
+
+    count = 0
+
+    def __init__(self, broken: bool = False):
+        Session.count += 1
+        self.session_id = f"session-{Session.count}"
+        self.broken = broken
+        self.window_handles = ["main", "popup"]
+        self.closed_windows = 0
+        self.scripts = []
+        self.cookies_cleared = 0
+        self.urls = []
+        self.quit_called = False
+        self.switch_to = SimpleNamespace(window=lambda handle: None)
+
+    def close(self):
+        self.closed_windows += 1
+
+    def execute_script(self, script, *args):
+        if self.broken:
+            raise RuntimeError("chrome not reachable")
+        self.scripts.append(script)
+
+    def delete_all_cookies(self):
+        self.cookies_cleared += 1
+
+    def get(self, url):
+        self.urls.append(url)
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture
+def web_driver(monkeypatch):
+    web_driver = LocalWebDriver(headless=True)
+    web_driver.launched = []
+    monkeypatch.setattr(web_driver, "get_chrome", lambda: web_driver.launched.append(Session()) or web_driver.launched[-1])
+    return web_driver
+
+
+def test_released_session_is_reset_and_reused(web_driver):
+    pool = DriverPool(web_driver)
+    first = pool.lease()
+    pool.release(first)
+    assert first.closed_windows == 1 and first.cookies_cleared == 1 and first.urls == ["about:blank"]
+    assert "localStorage.clear()" in first.scripts[0]
+    assert pool.lease() is first
+    assert pool.launches == 1
+
+
+def test_session_is_replaced_after_max_uses(web_driver):
+    pool = DriverPool(web_driver, max_uses=2)
+    first = pool.lease()
+    pool.release(first)
+    assert pool.lease() is first
+    pool.release(first)
+    assert first.quit_called
+    assert pool.lease() is not first and pool.launches == 2
+
+
+def test_only_max_idle_sessions_are_kept(web_driver):
+    pool = DriverPool(web_driver, max_idle=1)
+    sessions = [pool.lease() for _ in range(3)]
+    for session in sessions:
+        pool.release(session)
+    assert pool.sessions() == [sessions[0]]
+    assert [session.quit_called for session in sessions] == [False, True, True]
+
+
+def test_session_that_fails_to_reset_is_quit(web_driver):
+    pool = DriverPool(web_driver)
+    session = pool.lease()
+    session.broken = True
+    pool.release(session)
+    assert session.quit_called and pool.sessions() == []
+    pool.release(session)  # 두 번 반납해도 무시
+
+
+def test_on_launch_prepares_new_sessions_only(web_driver):
+    prepared = []
+    pool = DriverPool(web_driver, on_launch=prepared.append)
+    session = pool.lease()
+    pool.release(session)
+    pool.lease()
+    assert prepared == [session]
+
+
+def test_each_worker_thread_sees_its_own_session(web_driver):
+    '''동시에 도는 작업자마다 web_driver.driver 가 자기 세션을 가리킨다'''
+    pool = DriverPool(web_driver, max_idle=4)
+    barrier = threading.Barrier(4)
+    seen = {}
+
+    def work(name):
+        session = pool.lease()
+        barrier.wait()  # 모두 빌린 뒤에 확인
+        seen[name] = (session, web_driver.driver)
+        barrier.wait()
+        pool.release(session)
+
+    threads = [threading.Thread(target=work, args=(name,)) for name in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(session is current for session, current in seen.values())
+    assert len({id(session) for session, current in seen.values()}) == 4
+    assert web_driver.driver is None  # 메인 스레드는 빌린 적이 없다
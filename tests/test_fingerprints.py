@@ -0,0 +1,71 @@
+import pytest
+import requests
+from market_research.scraper._fingerprints import FingerprintStore
+from market_research.scraper.models.specs.spec_l import ModelScraper_l
+from market_research.scraper.models.specs.spec_s import ModelScraper_s
+
+URL = "https://www.lg.com/us/tvs/lg-oled65c4pua-oled-4k-tv"
+ROW = {"model": "OLED65C4PUA", "price": 2299.99, "url": URL, "Screen Size": '65"'}
+PAGE = """<html><body>
+<span class="MuiTypography-overline">OLED65C4PUA</span>
+<div class="css-8wacqv"><span>$2,299.99</span></div>
+</body></html>"""
+
+
+def test_unchanged_fingerprint_reuses_the_row_up_to_max_reuse(tmp_path):
+    store = FingerprintStore(tmp_path / "fingerprints.json", max_reuse=2)
+    store.update(URL + "/", "a", ROW)
+    assert store.previous(URL, "b") is None
+    assert store.previous(URL, "a") == ROW
+    assert store.previous(URL, "a") == ROW
+    assert store.previous(URL, "a") is None  # max_reuse 회 뒤에는 다시 수집
+    assert store.report() == {"reused": 2, "changed": 2}
+    store.save()
+    assert FingerprintStore(tmp_path / "fingerprints.json").entries == store.entries
+
+
+def test_digest_ignores_whitespace():
+    assert FingerprintStore.digest(["<p>$2,299.99\n </p>"]) == FingerprintStore.digest(["<p>$2,299.99 </p>"])
+    assert FingerprintStore.digest(["<p>$2,299.99</p>"]) != FingerprintStore.digest(["<p>$2,199.99</p>"])
+
+
+def response_of(html: str) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.encoding = "utf-8"
+    response._content = html.encode("utf-8")
+    return response
+
+
+@pytest.fixture
+def scrapers(tmp_path):
+    def make(maker):
+        scraper = maker(intput_folder_path=str(tmp_path / "input"), output_folder_path=None)
+        scraper.gets = []
+        scraper.extracted = []
+        scraper.http_get = lambda url, **kwargs: scraper.gets.append(url) or response_of(PAGE)
+        return scraper
+    return make
+
+
+def test_static_maker_fingerprints_the_response_it_extracts_from(scrapers):
+    lg = scrapers(ModelScraper_l)
+    lg._extract_product = lambda url, response=None: lg.extracted.append(response) or dict(ROW)
+    for _ in range(2):
+        row = {}
+        lg._extract_row(URL, row)
+        assert row == ROW
+    assert len(lg.gets) == 2 and len(lg.extracted) == 1
+    assert lg.extracted[0].text == PAGE
+
+
+def test_browser_maker_sends_no_request_for_the_fingerprint(scrapers):
+    '''응답을 재사용하지 않는 제조사는 지문 때문에 페이지를 한 번 더 받지 않는다'''
+    sony = scrapers(ModelScraper_s)
+    sony._extract_product = lambda url: sony.extracted.append(url) or dict(ROW)
+    for _ in range(2):
+        sony._extract_row(URL, {})
+    assert sony.gets == [] and len(sony.extracted) == 2
+    sony.fingerprint_prefetch = True
+    sony._extract_row(URL, {})
+    assert sony.gets == [URL]
@@ -0,0 +1,72 @@
+import pytest
+from market_research.scraper import _html_parser
+from market_research.scraper._html_parser import HtmlSnapshot, Selector, _css_to_xpath
+
+HTML = """
+<html><body>
+  <div id="specs" class="full-specifications card">
+    <div class="card__sub-list"><h4>Screen Size</h4><p>65"</p></div>
+    <div class="card__sub-list extra"><h4>Refresh Rate</h4><p>120Hz</p></div>
+    <section><div class="card__sub-list"><h4>HDR</h4><p>Dolby Vision</p></div></section>
+  </div>
+  <ul class="variants">
+    <li data-size="55"><a href="/tv/oled55" rel="next prefetch">55"</a></li>
+    <li data-size="65" class="selected"><a href="/tv/oled65">65"</a></li>
+    <li><a href="https://www.lg.com/us/tvs/oled77.html">77"</a></li>
+  </ul>
+  <span class="MuiTypography-overline">OLED65C4PUA</span>
+  <h6 class="css-12myda0">$1,999.99</h6>
+</body></html>
+"""
+
+
+@pytest.fixture(autouse=True)
+def without_cssselect(monkeypatch):
+    # cssselect 가 없을 때 쓰는 _compile_group 을 검사
+    monkeypatch.setattr(_html_parser, "HTMLTranslator", None)
+
+
+@pytest.mark.parametrize("css", [
+    "h4",
+    "#specs",
+    ".card__sub-list",
+    "div.card__sub-list.extra",
+    "#specs > .card__sub-list > p",
+    "#specs .card__sub-list p",
+    "#specs>div h4",
+    "li[data-size]",
+    'li[data-size="65"] a',
+    "li[data-size='55'] > a",
+    'a[rel~="prefetch"]',
+    'a[href^="/tv/"]',
+    'a[href$=".html"]',
+    'a[href*="oled7"]',
+    "span.MuiTypography-overline, h6.css-12myda0",
+    "ul li > *",
+])
+def test_lxml_matches_soupsieve(css):
+    lxml_page = HtmlSnapshot(HTML, backend="lxml")
+    bs4_page = HtmlSnapshot(HTML, backend="bs4")
+    selector = Selector(css)
+    # 파서마다 들여쓰기 공백이 달라 공백은 정규화해서 비교
+    assert ([" ".join(lxml_page.text(node).split()) for node in lxml_page.select(selector)]
+            == [" ".join(bs4_page.text(node).split()) for node in bs4_page.select(selector)])
+
+
+def test_scoped_select_searches_below_the_node():
+    page = HtmlSnapshot(HTML, backend="lxml")
+    section = page.select_one("section")
+    assert [page.text(node) for node in page.select("h4", node=section)] == ["HDR"]
+    assert page.select(".card__sub-list", node=page.select_one(".card__sub-list")) == []
+
+
+def test_css_to_xpath():
+    assert _css_to_xpath("div.card > p", "descendant-or-self::") == (
+        "descendant-or-self::div[contains(concat(' ', normalize-space(@class), ' '), ' card ')]/child::p")
+    assert _css_to_xpath("#a, b[c='d']", "descendant::") == "descendant::*[@id='a'] | descendant::b[@c='d']"
+
+
+@pytest.mark.parametrize("css", ["a:hover", "li + li", "div::before"])
+def test_unsupported_selector_raises(css):
+    with pytest.raises(ValueError, match="unsupported css selector"):
+        _css_to_xpath(css, "descendant-or-self::")
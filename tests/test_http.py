@@ -0,0 +1,51 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from market_research._http import HttpClient
+
+
+class Handler(BaseHTTPRequestHandler):
+    """
+    /login sets a session cookie, /redirect sets one and redirects to /echo, /echo returns the Cookie header it got.
+    """
+
+    def do_GET(self):
+        if self.path == "/redirect":
+            self.send_response(302)
+            self.send_header("Set-Cookie", "step=1; Path=/")
+            self.send_header("Location", "/echo")
+            self.end_headers()
+            return None
+        body = (self.headers.get("Cookie") or "").encode()
+        self.send_response(200)
+        if self.path == "/login":
+            self.send_header("Set-Cookie", "JSESSIONID=krx; Path=/")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+def test_cookies_do_not_leak_between_calls(server):
+    '''같은 세션을 쓰는 다른 호출에 쿠키가 넘어가지 않는다'''
+    client = HttpClient()
+    client.get(f"{server}/login")
+    assert client.get(f"{server}/echo").text == ""
+    assert client.get(f"{server}/echo", cookies={"JSESSIONID": "mine"}).text == "JSESSIONID=mine"
+    assert client.get(f"{server}/echo").text == ""
+
+
+def test_cookies_follow_the_redirects_of_one_call(server):
+    client = HttpClient()
+    assert client.get(f"{server}/redirect").text == "step=1"
+    assert client.get(f"{server}/echo").text == ""
@@ -0,0 +1,93 @@
+import logging
+import pytest
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.client_config import ClientConfig
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+from market_research.scraper._driver_pool import execute_cdp
+from market_research.scraper._navigation_hook import NavigationHook, ONETRUST_SELECTORS, onetrust_cookie
+from market_research.scraper._tiered_fetcher import StaticElement, StaticPage
+from market_research.scraper.models.specs.spec_s import ModelScraper_s
+
+URL = "https://electronics.sony.com/tv-video/televisions/all-tvs/p/xr65a95l"
+MODAL = '<html><body><div id="contentfulModal"><button id="contentfulModalClose">x</button></div></body></html>'
+
+
+class RemoteSession(StaticPage):
+    """
+    Remote driver of a selenium_hub node: its command executor only knows chromedriver's CDP endpoint once registered.
+    cdp=False: a node that refuses CDP altogether.
+    """
+
+    def __init__(self, session_id: str, cdp: bool = True):
+        StaticPage.__init__(self, MODAL, URL)
+        self.session_id = session_id
+        self.command_executor = RemoteConnection(client_config=ClientConfig("http://selenium_hub:4444/wd/hub"))
+        self.cdp = cdp
+        self.cdp_calls = []
+        self.scripts = []
+        self.cookies = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        if self.command_executor.get_command("executeCdpCommand") is None:
+            raise AssertionError("Unrecognised command executeCdpCommand")
+        if not self.cdp:
+            raise WebDriverException("unknown command: session/goog/cdp/execute")
+        self.cdp_calls.append(cmd)
+        return {}
+
+    def execute_script(self, script, *args):
+        self.scripts.append(script)
+
+    def add_cookie(self, cookie):
+        self.cookies.append(cookie)
+
+
+@pytest.fixture
+def hook():
+    return NavigationHook(cookies=[onetrust_cookie(".sony.com")], hide_selectors=ONETRUST_SELECTORS)
+
+
+def test_cdp_goes_through_the_remote_endpoint(hook):
+    driver = RemoteSession("a")
+    assert hook.apply(driver)
+    assert driver.command_executor.get_command("executeCdpCommand") == ("POST", "/session/$sessionId/goog/cdp/execute")
+    assert driver.cdp_calls == ["Page.addScriptToEvaluateOnNewDocument", "Network.setCookie"]
+    assert hook.applied(driver)
+    # 같은 세션에는 스크립트를 다시 등록하지 않고 쿠키만 심는다
+    hook.apply(driver)
+    assert driver.cdp_calls[2:] == ["Network.setCookie"]
+    assert execute_cdp(driver, "Network.clearBrowserCookies", {}) == {}
+
+
+def test_without_cdp_the_script_runs_after_load_and_warns_once(hook, caplog):
+    with caplog.at_level(logging.WARNING):
+        first, second = RemoteSession("a", cdp=False), RemoteSession("b", cdp=False)
+        assert not hook.apply(first) and not hook.apply(second)
+    assert len([record for record in caplog.records if "navigation hook" in record.message]) == 1
+    assert not hook.applied(first)
+    hook.inject(first)
+    assert first.scripts == [hook.script]
+    assert first.cookies == [dict({"path": "/"}, **onetrust_cookie(".sony.com"))]
+
+
+@pytest.fixture
+def sony(tmp_path, monkeypatch):
+    clicks = []
+    monkeypatch.setattr(StaticElement, "click", lambda element: clicks.append(element.get_attribute("id")), raising=False)
+    scraper = ModelScraper_s(intput_folder_path=str(tmp_path / "input"), output_folder_path=None)
+    scraper.clicks = clicks
+    return scraper
+
+
+def test_remove_popup_skips_hooked_sessions(sony):
+    driver = RemoteSession("sony-hooked")
+    assert sony.navigation_hook.apply(driver)
+    sony.remove_popup(driver)
+    assert sony.clicks == []
+
+
+def test_remove_popup_closes_the_modal_without_cdp(sony):
+    driver = RemoteSession("sony-without-cdp", cdp=False)
+    assert not sony.navigation_hook.apply(driver)
+    sony.remove_popup(driver)
+    assert sony.clicks == ["contentfulModalClose"]
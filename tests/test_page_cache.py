@@ -0,0 +1,93 @@
+import pytest
+import requests
+from market_research.scraper import _scraper_scheme
+from market_research.scraper._page_cache import PageCache, canonical_url
+from market_research.scraper.models.specs.spec_l import ModelScraper_l
+
+URL = "https://www.lg.com/us/tvs/lg-oled65c4pua-oled-4k-tv"
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("HTTPS://www.LG.com/us/tvs/?utm_source=x&b=2&a=1#specs", "https://www.lg.com/us/tvs?a=1&b=2"),
+    ("https://www.sony.com:443/tv/", "https://www.sony.com/tv"),
+    ("http://www.sony.com:443/tv", "http://www.sony.com:443/tv"),
+    ("https://www.samsung.com/", "https://www.samsung.com/"),
+    ("https://www.samsung.com", "https://www.samsung.com/"),
+    ("https://www.tcl.com/us/en/Products/TV", "https://www.tcl.com/us/en/Products/TV"),
+    ("  https://www.lg.com/us/tvs?gclid=1&fbclid=2&sku=OLED65  ", "https://www.lg.com/us/tvs?sku=OLED65"),
+    ("https://www.lg.com/us/tvs?empty=&a=1", "https://www.lg.com/us/tvs?a=1&empty="),
+])
+def test_canonical_url(url, expected):
+    assert canonical_url(url) == expected
+
+
+def test_canonical_url_is_idempotent():
+    '''한 번 정규화한 url 은 다시 정규화해도 같다'''
+    url = canonical_url("HTTPS://www.LG.com/us/tvs/?utm_medium=y&b=2&a=1")
+    assert canonical_url(url) == url
+
+
+class Session:
+
+    def __init__(self, html: str):
+        self.page_source = html
+
+    def get(self, url):
+        pass
+
+    def execute_script(self, script, *args):
+        if args:
+            self.page_source = args[0]  # replay: document.write
+
+
+class Server:
+    """
+    Answers 304 to every conditional request, like a CDN that ignores what the client actually stored.
+    """
+
+    def __init__(self):
+        self.requests = []
+
+    def get(self, url, headers=None, **kwargs):
+        self.requests.append(dict(headers or {}))
+        response = requests.Response()
+        response.url = url
+        conditional = any(key.lower() in ("if-none-match", "if-modified-since") for key in headers or {})
+        response.status_code = 304 if conditional else 200
+        response._content = b"" if conditional else b"<html><span class='MuiTypography-overline'>OLED65C4PUA</span></html>"
+        response.headers["ETag"] = '"c4"'
+        response.encoding = "utf-8"
+        return response
+
+
+@pytest.fixture
+def lg(tmp_path, monkeypatch):
+    scraper = ModelScraper_l(intput_folder_path=str(tmp_path / "input"), output_folder_path=None)
+    scraper.page_cache = PageCache(tmp_path / "cache")
+    scraper.navigation_hook = None
+    scraper.navigate = lambda driver, url: None
+    scraper.wait = lambda driver, *args, **kwargs: True
+    scraper.server = Server()
+    monkeypatch.setattr(_scraper_scheme, "HTTP", scraper.server)
+    return scraper
+
+
+def test_every_stage_keeps_its_own_snapshot(lg, tmp_path):
+    '''같은 url 이라도 단계마다 스냅샷을 따로 남기고, 오프라인에서 그 단계의 스냅샷을 재생한다'''
+    for stage in ("details", "specs"):
+        lg.driver_pool.lease = lambda stage=stage: Session(f"<p>{stage}</p>")
+        lg.release_driver(lg.set_driver(URL, stage=stage))
+    lg.page_cache = PageCache(tmp_path / "cache", offline=True)
+    lg.driver_pool.lease = lambda: Session("")
+    assert lg.open_page(URL, stage="specs").page_source == "<p>specs</p>"
+    assert lg.set_driver(URL, stage="details").page_source == "<p>details</p>"
+
+
+def test_304_without_a_cached_copy_is_fetched_again(lg):
+    response = lg.http_get(URL, headers={"If-None-Match": '"c3"'})
+    assert response.status_code == 200 and "OLED65C4PUA" in response.text
+    assert [list(headers) for headers in lg.server.requests] == [["If-None-Match"], []]
+    assert lg.page_cache.response(URL).text == response.text
+    # 저장본이 생긴 뒤의 304 는 저장본으로 응답한다
+    assert lg.http_get(URL).text == response.text
+    assert lg.server.requests[-1]["If-None-Match"] == '"c4"'
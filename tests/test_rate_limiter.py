@@ -0,0 +1,97 @@
+import pytest
+from market_research.scraper import _rate_limiter
+from market_research.scraper._rate_limiter import DomainRateLimiter, SharedRateLimiter
+
+URL = "https://www.lg.com/us/tvs/oled65"
+
+
+class Clock:
+    """
+    time.time/time.sleep of _rate_limiter: sleeping only moves the clock.
+    """
+
+    def __init__(self):
+        self.now = 1_000_000.0
+        self.slept = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(_rate_limiter, "time", clock)
+    return clock
+
+
+@pytest.mark.parametrize("url, domain", [
+    ("https://electronics.sony.com/tv", "sony.com"),
+    ("https://www.lg.com/us/tvs", "lg.com"),
+    ("https://www.samsung.co.kr/tv", "samsung.co.kr"),
+    ("https://eprel.ec.europa.eu:443/screen", "europa.eu"),
+])
+def test_domain(url, domain):
+    assert DomainRateLimiter.domain(url) == domain
+
+
+def test_burst_then_rate(clock):
+    limiter = DomainRateLimiter(rate=2.0, burst=3)
+    assert [limiter.acquire(URL) for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter.acquire(URL) == pytest.approx(0.5)
+    assert limiter.acquire(URL) == pytest.approx(0.5)
+
+
+def test_sites_have_their_own_bucket(clock):
+    limiter = DomainRateLimiter(rate=1.0, burst=1, rates={"europa.eu": 0.5})
+    assert limiter.acquire(URL) == 0.0
+    assert limiter.acquire("https://www.sony.com/tv") == 0.0
+    assert limiter.acquire("https://eprel.ec.europa.eu/x") == 0.0
+    assert limiter.acquire("https://eprel.ec.europa.eu/y") == pytest.approx(2.0)
+
+
+def test_additive_increase_up_to_max_rate(clock):
+    limiter = DomainRateLimiter(rate=1.0, increase=0.5, max_rate=2.0)
+    for _ in range(5):
+        limiter.feedback(URL, latency=0.1)
+    assert limiter.report() == {"lg.com": 2.0}
+
+
+@pytest.mark.parametrize("feedback", [
+    {"latency": 0.1, "status": 429},
+    {"latency": 0.1, "status": 503},
+    {"latency": 0.1, "ok": False},
+    {"latency": 30.0},
+])
+def test_multiplicative_decrease(clock, feedback):
+    limiter = DomainRateLimiter(rate=4.0, decrease=0.5, target_latency=10.0)
+    limiter.feedback(URL, **feedback)
+    assert limiter.report() == {"lg.com": 2.0}
+
+
+def test_decrease_once_per_second_down_to_min_rate(clock):
+    '''동시에 실패한 요청들은 한 번만 속도를 줄인다'''
+    limiter = DomainRateLimiter(rate=4.0, decrease=0.5, min_rate=0.5)
+    for _ in range(3):
+        limiter.feedback(URL, latency=0.1, status=429)
+    assert limiter.report() == {"lg.com": 2.0}
+    for _ in range(5):
+        clock.now += 1
+        limiter.feedback(URL, latency=0.1, status=429)
+    assert limiter.report() == {"lg.com": 0.5}
+
+
+def test_shared_limiter_splits_one_budget(clock, tmp_path):
+    '''같은 큐 파일을 쓰는 워커들은 사이트별 토큰을 나눠 쓴다'''
+    path = tmp_path / "queue.db"
+    first = SharedRateLimiter(path, rate=1.0, burst=2)
+    second = SharedRateLimiter.like(first, path)
+    assert first.acquire(URL) == 0.0
+    assert second.acquire(URL) == 0.0
+    assert second.acquire(URL) == pytest.approx(1.0)
+    first.feedback(URL, latency=0.1, status=429)
+    assert second.report() == {"lg.com": 0.5}
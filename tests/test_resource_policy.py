@@ -0,0 +1,45 @@
+import logging
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.client_config import ClientConfig
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+from market_research.scraper._resource_policy import ResourcePolicy
+
+
+class RemoteSession:
+    """
+    Remote driver of a selenium_hub node; cdp=False: a node that refuses CDP altogether.
+    """
+
+    def __init__(self, cdp: bool = True):
+        self.command_executor = RemoteConnection(client_config=ClientConfig("http://selenium_hub:4444/wd/hub"))
+        self.cdp = cdp
+        self.cdp_calls = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        if self.command_executor.get_command("executeCdpCommand") is None or not self.cdp:
+            raise WebDriverException("unknown command: session/goog/cdp/execute")
+        self.cdp_calls.append((cmd, params))
+        return {}
+
+
+def test_allowed_assets_keep_their_patterns_off_the_block_list():
+    policy = ResourcePolicy(block_types=["image", "font"], block_patterns=["*youtube.com/embed*"],
+                            allow_patterns=["https://www.lg.com/content/dam/channel/wcms/us/images/logo.svg"])
+    urls = policy.blocked_urls()
+    assert "*.svg*" not in urls
+    assert "*.png*" in urls and "*.woff2*" in urls and urls[-1] == "*youtube.com/embed*"
+
+
+def test_block_list_is_installed_through_the_remote_endpoint():
+    policy = ResourcePolicy(block_types=["analytics"])
+    driver = RemoteSession()
+    assert policy.apply(driver)
+    assert driver.cdp_calls == [("Network.enable", {}), ("Network.setBlockedURLs", {"urls": policy.blocked_urls()})]
+
+
+def test_without_cdp_the_policy_warns_once(caplog):
+    policy = ResourcePolicy()
+    with caplog.at_level(logging.WARNING):
+        assert not policy.apply(RemoteSession(cdp=False))
+        assert not policy.apply(RemoteSession(cdp=False))
+    assert len([record for record in caplog.records if "resource policy" in record.message]) == 1
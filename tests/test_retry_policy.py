@@ -0,0 +1,108 @@
+import asyncio
+import pytest
+from market_research.scraper._retry_policy import RetryPolicy, RetryExhausted, CircuitOpen
+
+URL = "https://www.sony.com/tv/model"
+
+
+class Flaky:
+    """
+    Fails the first `failures` calls with error, then returns "ok".
+    """
+
+    def __init__(self, failures: int, error=TimeoutError):
+        self.failures = failures
+        self.error = error
+        self.calls = 0
+
+    def __call__(self, url):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error(f"call {self.calls}")
+        return "ok"
+
+
+def policy(**kwargs) -> RetryPolicy:
+    kwargs.setdefault("base_delay", 0)  # 백오프 없이 바로 재시도
+    return RetryPolicy(**kwargs)
+
+
+def test_retries_until_success():
+    func = Flaky(2)
+    retry_policy = policy(attempts=3)
+    assert retry_policy.call(func, URL) == "ok"
+    assert func.calls == 3
+    assert retry_policy.report()["failed_attempts"] == 2
+    assert retry_policy.report()["budget_left"] == 198
+
+
+def test_exhausted_chains_last_error():
+    func = Flaky(5)
+    with pytest.raises(RetryExhausted) as info:
+        policy(attempts=3).call(func, URL)
+    assert func.calls == 3
+    assert isinstance(info.value.__cause__, TimeoutError)
+
+
+def test_fatal_is_not_retried():
+    func = Flaky(5, error=ValueError)
+    with pytest.raises(ValueError):
+        policy(attempts=3, fatal=(ValueError,)).call(func, URL)
+    assert func.calls == 1
+
+
+def test_budget_is_shared_by_calls():
+    retry_policy = policy(attempts=3, budget=1)
+    assert retry_policy.call(Flaky(1), URL) == "ok"
+    with pytest.raises(RetryExhausted, match="budget"):
+        retry_policy.call(Flaky(1), URL)
+
+
+def test_circuit_opens_per_domain():
+    retry_policy = policy(attempts=2, breaker_threshold=4, breaker_cooldown=300)
+    for _ in range(2):
+        with pytest.raises(RetryExhausted):
+            retry_policy.call(Flaky(5), URL)
+    func = Flaky(0)
+    with pytest.raises(CircuitOpen):
+        retry_policy.call(func, URL)
+    assert func.calls == 0
+    assert retry_policy.report()["open_circuits"] == ["www.sony.com"]
+    # 다른 도메인은 영향 없음
+    assert retry_policy.call(Flaky(0), "https://www.lg.com/us/tvs") == "ok"
+
+
+def test_success_resets_failures_in_a_row():
+    retry_policy = policy(attempts=2, breaker_threshold=3)
+    for _ in range(4):
+        assert retry_policy.call(Flaky(1), URL) == "ok"
+    assert retry_policy.report()["open_circuits"] == []
+
+
+def test_half_open_circuit_reopens_on_one_failure():
+    retry_policy = policy(attempts=1, breaker_threshold=3, breaker_cooldown=0)
+    for _ in range(2):
+        with pytest.raises(RetryExhausted):
+            retry_policy.call(Flaky(5), URL)
+    with pytest.raises(CircuitOpen):
+        retry_policy.call(Flaky(5), URL)  # 세 번째 연속 실패에서 열림
+    # 쿨다운이 끝나면 한 번은 호출해 보고 (half-open), 그 한 번이 실패하면 다시 열린다
+    retry_policy.breaker_cooldown = 300
+    func = Flaky(5)
+    with pytest.raises(CircuitOpen):
+        retry_policy.call(func, URL)
+    assert func.calls == 1
+    assert retry_policy.report()["open_circuits"] == ["www.sony.com"]
+
+
+def test_call_async():
+    calls = []
+
+    async def visit(url):
+        calls.append(url)
+        if len(calls) < 2:
+            raise TimeoutError("slow")
+        return {"url": url}
+
+    assert asyncio.run(policy().call_async(visit, URL)) == {"url": URL}
+    assert len(calls) == 2
@@ -0,0 +1,91 @@
+import pytest
+from market_research.scraper._scroll_harvester import ScrollHarvester, _COLLECT, _INSTALL, _STRIDE
+from market_research.scraper._tiered_fetcher import StaticPage
+
+URL = "https://electronics.sony.com/tv-video/televisions/all-tvs"
+
+
+class VirtualGrid:
+    """
+    Browser stand-in for a lazy-loading, virtualized product grid:
+    every `batch` px scrolled loads `per_batch` more cards, and only the last `window` cards stay in the DOM.
+    Plays the harvester scripts: the observer sees every card that was ever added.
+    """
+
+    def __init__(self, total: int, per_batch: int = 4, batch: int = 1500, window: int = 8):
+        self.total = total
+        self.per_batch = per_batch
+        self.batch = batch
+        self.window = window
+        self.y = 0
+        self.loaded = per_batch
+        self.observed = None
+        self.calls = []
+
+    def cards(self) -> list:
+        return [f"/tv-video/televisions/all-tvs/p/model-{i}" for i in range(self.loaded)][-self.window:]
+
+    def _load(self):
+        self.loaded = min(self.total, max(self.loaded, (self.y // self.batch + 1) * self.per_batch))
+        for card in self.cards():
+            if card not in self.observed:
+                self.observed.append(card)
+
+    def execute_script(self, script, *args):
+        self.calls.append(script)
+        if script == _INSTALL:
+            self.observed = self.observed if self.observed is not None else []
+            self._load()
+            return len(self.observed)
+        if script == _STRIDE:
+            self.y = min(self.y + args[4], self.total // self.per_batch * self.batch)
+            self._load()
+            return {"count": len(self.observed), "bottom": self.loaded == self.total}
+        if script == _COLLECT:
+            values, self.observed = self.observed, None
+            return values
+        raise AssertionError(script)
+
+
+def test_virtualized_cards_are_kept_in_order():
+    '''가상 스크롤로 DOM 에서 사라진 카드도 처음 본 순서대로 남는다'''
+    grid = VirtualGrid(total=30)
+    values = ScrollHarvester("a.card").harvest(grid)
+    assert values == [f"/tv-video/televisions/all-tvs/p/model-{i}" for i in range(30)]
+    assert len(grid.cards()) == 8 and grid.observed is None
+
+
+def test_harvest_stops_after_idle_strides():
+    grid = VirtualGrid(total=8)
+    ScrollHarvester("a.card", idle=3).harvest(grid)
+    strides = grid.calls.count(_STRIDE)
+    assert strides == 4  # 마지막 카드가 보인 한 번 + 변화 없는 3 번
+
+
+def test_harvest_is_capped_by_max_strides():
+    grid = VirtualGrid(total=1000)
+    assert len(ScrollHarvester("a.card", max_strides=5).harvest(grid)) == 24
+    assert grid.calls.count(_STRIDE) == 5
+
+
+def test_wait_runs_after_every_stride_and_is_recounted():
+    grid = VirtualGrid(total=12)
+    waits = []
+    ScrollHarvester("a.card").harvest(grid, wait=waits.append)
+    assert len(waits) == grid.calls.count(_STRIDE) // 2
+
+
+@pytest.fixture
+def page():
+    return StaticPage("""<html><body>
+    <a class="button primary" href="/p/43s450k">Learn More</a>
+    <a class="button primary" href="/p/43s450k"> learn more </a>
+    <a class="button primary" href="/p/55c755">Buy</a>
+    <a class="button primary" href="https://www.tcl.com/us/en/p/65qm851g">learn more</a>
+    </body></html>""", "https://www.tcl.com/us/en/products/tv")
+
+
+def test_static_page_is_parsed_once(page):
+    harvester = ScrollHarvester("a.button.primary", text="learn more", absolute=True)
+    assert harvester.harvest(page) == ["https://www.tcl.com/p/43s450k", "https://www.tcl.com/us/en/p/65qm851g"]
+    assert ScrollHarvester("a.button.primary").harvest(page) == ["/p/43s450k", "/p/55c755", "https://www.tcl.com/us/en/p/65qm851g"]
@@ -0,0 +1,107 @@
+import gzip
+import io
+import pytest
+import requests
+from market_research.scraper._sitemap import SitemapSource
+from market_research.scraper.models.specs.spec_s import ModelScraper_s
+
+NS = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+INDEX = f"""<?xml version="1.0" encoding="UTF-8"?><sitemapindex {NS}>
+<sitemap><loc>https://electronics.sony.com/sitemap_product_1.xml.gz</loc></sitemap>
+<sitemap><loc> https://electronics.sony.com/sitemap_product_2.xml </loc></sitemap>
+<sitemap><loc>https://electronics.sony.com/sitemap_content.xml</loc></sitemap>
+</sitemapindex>"""
+
+
+def urlset(*paths) -> str:
+    entries = "".join(f"<url><loc>https://electronics.sony.com{path}</loc><lastmod>2024-10-01</lastmod></url>" for path in paths)
+    return f'<?xml version="1.0" encoding="UTF-8"?><urlset {NS}>{entries}</urlset>'
+
+
+TVS = [f"/tv-video/televisions/all-tvs/p/{model}" for model in ("xr65a95l", "xr77a80l", "kd55x85k")]
+DOCUMENTS = {
+    "https://electronics.sony.com/sitemap.xml": INDEX.encode(),
+    "https://electronics.sony.com/sitemap_product_1.xml.gz": gzip.compress(urlset(TVS[0], "/audio/headphones/p/wh1000xm5").encode()),
+    "https://electronics.sony.com/sitemap_product_2.xml": urlset(*TVS[1:]).encode(),
+    "https://electronics.sony.com/sitemap_content.xml": urlset("/tv-video/televisions/all-tvs/p/never-read").encode(),
+}
+
+
+class Stream(io.BytesIO):
+    decode_content = False
+
+
+def fetch(url, stream=False, **kwargs):
+    response = requests.Response()
+    response.url = url
+    if url not in DOCUMENTS:
+        response.status_code = 404
+        response._content = b""
+        return response
+    response.status_code = 200
+    if stream:
+        response.raw = Stream(DOCUMENTS[url])
+        response._content = False
+    else:
+        response._content = DOCUMENTS[url]
+    return response
+
+
+@pytest.fixture
+def source():
+    return SitemapSource(["https://electronics.sony.com/sitemap.xml"],
+                         include=r"electronics\.sony\.com/tv-video/televisions/.*/p/[^/]+$", follow=r"product")
+
+
+def test_index_is_followed_into_matching_children(source):
+    assert source.discover(fetch) == {"https://electronics.sony.com" + path for path in TVS}
+
+
+def test_cached_responses_are_parsed_from_their_content(source):
+    '''캐시에서 온 응답(이미 읽은 본문)도 같은 url 을 준다'''
+    assert source.discover(lambda url, **kwargs: fetch(url)) == source.discover(fetch)
+
+
+def test_missing_sitemap_is_reported_and_skipped(source, capsys):
+    source.sitemaps.append("https://electronics.sony.com/sitemap_missing.xml")
+    assert len(source.discover(fetch)) == 3
+    assert "fail to read sitemap https://electronics.sony.com/sitemap_missing.xml" in capsys.readouterr().out
+
+
+def test_max_depth_stops_nested_indexes(source):
+    source.max_depth = 0
+    assert source.discover(fetch) == set()
+
+
+@pytest.fixture
+def sony(tmp_path):
+    scraper = ModelScraper_s(intput_folder_path=str(tmp_path / "input"), output_folder_path=None)
+    scraper.http_get = fetch
+    scraper.sitemap = SitemapSource(["https://electronics.sony.com/sitemap.xml"],
+                                    include=r"electronics\.sony\.com/tv-video/televisions/.*/p/[^/]+$", follow=r"product", min_urls=3)
+    scraper.discovery = "sitemap"
+    scraper.frontier.begin_run()
+    return scraper
+
+
+def test_sitemap_fills_the_frontier(sony):
+    assert sony.discover_from_sitemap()
+    assert len(sony.frontier.url_dict()) == 3
+
+
+def test_short_sitemap_falls_back_to_crawling(sony):
+    sony.sitemap.min_urls = 4
+    assert not sony.discover_from_sitemap()
+    assert sony.frontier.url_dict() == {}
+
+
+def test_sitemap_missing_previous_models_falls_back_to_crawling(sony):
+    '''지난 실행에서 방문한 모델이 사이트맵에 충분히 없으면 시리즈 페이지를 스크롤한다'''
+    previous = ["https://electronics.sony.com" + path for path in TVS] + \
+        [f"https://electronics.sony.com/tv-video/televisions/all-tvs/p/old{i}" for i in range(3)]
+    sony.frontier.add_all(previous)
+    sony.frontier.mark_visited(previous)
+    sony.frontier.begin_run()
+    assert not sony.discover_from_sitemap()
+    sony.sitemap_coverage = 0.5
+    assert sony.discover_from_sitemap()
@@ -0,0 +1,80 @@
+import json
+import pytest
+import requests
+from market_research.scraper._tiered_fetcher import StaticPage
+from market_research.scraper.models.specs.spec_l import ModelScraper_l
+from market_research.scraper.models.specs.spec_l_g import ModelScraper_l_g
+
+URL = "https://www.lg.com/us/tvs/lg-oled65c4pua-oled-4k-tv"
+SPEC_TAB = '<html><body><h5 class="MuiTypography-root MuiTypography-h5 css-14uiqdv">All Specs</h5></body></html>'
+
+# 스펙 탭은 클릭해야 그려지고, 서버가 준 html 에는 __NEXT_DATA__ 에만 스펙이 있는 모델 페이지
+NEXT_DATA = {"props": {"pageProps": {"pdpData": {
+    "modelId": "MD09985112", "modelName": "OLED65C4PUA",
+    "specInfo": {"specGroups": [
+        {"groupName": "DISPLAY", "specs": [
+            {"specCode": "SP001", "specName": "Screen Size", "specValue": "65\""},
+            {"specCode": "SP002", "specName": "Refresh Rate", "specValue": "Native 120Hz (up to 144Hz)"},
+            {"specCode": "SP003", "specName": "Panel Type", "specValue": "OLED evo"}]},
+        {"groupName": "AUDIO", "specs": [
+            {"specCode": "SP101", "specName": "Audio Output", "specValue": "40W"},
+            {"specCode": "SP102", "specName": "Dolby Atmos", "specValue": "Yes"},
+            {"specCode": "SP103", "specName": "Speaker System", "specValue": 2.2}]},
+        {"groupName": "DIMENSIONS", "specs": [
+            {"specCode": "SP201", "specName": "Weight", "specValue": "41.4 lbs"},
+            {"specCode": "SP202", "specName": "Weight", "specValue": "18.8 kg"},
+            {"specCode": "SP203", "specName": "Stand Footprint", "specValue": {"width": "17.3", "depth": "9.8"}}]}]}}},
+    "locale": "en_US"}, "page": "/[...slug]", "buildId": "build-20241015"}
+PDP = """<html><head><title>LG 65 inch Class OLED evo C4 Series TV</title></head><body>
+<div id="__next">
+  <span class="MuiTypography-root MuiTypography-overline css-rrulv7">Model OLED65C4PUA</span>
+  <h1 class="MuiTypography-root MuiTypography-h5 css-vnteo9">LG 65 inch Class OLED evo C4 Series TV - webOS 24</h1>
+  <div class="MuiGrid-root MuiGrid-item css-8wacqv">$1,796.99 Save $903 $2,699.99</div>
+  <h5 class="MuiTypography-root MuiTypography-h5 css-14uiqdv">All Specs</h5>
+</div>
+<script type="application/json" id="analytics-config">{"trackPageView": true,</script>
+<script id="__NEXT_DATA__" type="application/json">%s</script>
+</body></html>""" % json.dumps(NEXT_DATA)
+
+
+@pytest.fixture(params=[ModelScraper_l, ModelScraper_l_g])
+def lg(request, tmp_path):
+    scraper = request.param(intput_folder_path=str(tmp_path / "input"), output_folder_path=None)
+    scraper.retry_policy.base_delay = 0
+    scraper.visits = []
+    scraper.set_driver = lambda url, stage=None: scraper.visits.append(url) or StaticPage(SPEC_TAB, url)
+    scraper.release_driver = lambda driver: None
+    scraper.wait = lambda driver, *args, **kwargs: True
+    scraper.web_driver.move_element_to_center = lambda element: None
+    return scraper
+
+
+def test_empty_spec_table_is_retried_then_left_empty(lg, monkeypatch):
+    '''스펙이 끝내 비어 있으면 행을 버리지 않고 {} 를 돌려주고 telemetry 에 남긴다'''
+    monkeypatch.setattr(lg.spec_profile, "extract", lambda driver: {"pairs": []})
+    assert lg._extract_global_specs(url=URL) == {}
+    assert len(lg.visits) == 3
+    assert lg.telemetry.counters["spec_misses"] == 1
+
+
+def test_spec_table_found_on_a_later_attempt(lg, monkeypatch):
+    results = iter([[], [("Screen Size", '65"')]])
+    monkeypatch.setattr(lg.spec_profile, "extract", lambda driver: {"pairs": next(results)})
+    assert lg._extract_global_specs(url=URL) == {"Screen Size": '65"'}
+    assert "spec_misses" not in lg.telemetry.counters
+
+
+def test_specs_come_from_the_embedded_json_without_a_browser(lg):
+    '''스펙 박스가 없는 응답은 __NEXT_DATA__ 의 specName/specValue 로 읽고 브라우저를 열지 않는다'''
+    response = requests.Response()
+    response.status_code = 200
+    response.encoding = "utf-8"
+    response._content = PDP.encode("utf-8")
+    row = lg._extract_product(URL, response=response)
+    assert lg.visits == []
+    assert row["model"] == "OLED65C4PUA" and row["url"] == URL
+    specs = {key: value for key, value in row.items() if key[0].isupper()}
+    assert specs == {"Screen Size": '65"', "Refresh Rate": "Native 120Hz (up to 144Hz)", "Panel Type": "OLED evo",
+                     "Audio Output": "40W", "Dolby Atmos": "Yes", "Speaker System": "2.2",
+                     "Weight": "41.4 lbs", "Weight*": "18.8 kg"}
+    assert list(specs)[:3] == ["Screen Size", "Refresh Rate", "Panel Type"]  # 문서 순서
@@ -0,0 +1,144 @@
+from types import SimpleNamespace
+import pytest
+from market_research.scraper._tiered_fetcher import StaticElement, StaticPage
+from market_research.scraper.models.specs.spec_s import ModelScraper_s
+from market_research.scraper.models.specs.spec_s_g import ModelScraper_s_g
+
+URL = "https://electronics.sony.com/tv-video/televisions/all-tvs/p/xr65a95l"
+
+# 모델 페이지의 필요한 부분만 남긴 고정 html
+HTML = """
+<html><body><div id="cx-main"><app-product-details-page><div>
+  <app-custom-product-intro><div><div>
+    <div><div><span>Model: XR-65A95L</span></div><h1><p>65" A95L BRAVIA XR OLED 4K</p></h1></div>
+  </div></div></app-custom-product-intro>
+  <div id="PDPOveriewLink"><div><div><div><div></div><div><div><app-custom-product-summary><app-product-pricing>
+    <div><div><p>$2,799.99</p><p>$3,299.99</p></div></div>
+  </app-product-pricing></app-custom-product-summary></div></div></div></div></div></div>
+  <div class="custom-product-features__components">
+    <h2>Picture</h2><p>XR OLED Contrast Pro</p><p>Cognitive Processor XR</p><h2>All features</h2>
+  </div>
+  <div class="see_more_features_button container">See more features</div>
+  <div id="PDPSpecificationsLink"><cx-icon>+</cx-icon></div>
+  <app-product-specification><div><div></div><div><div></div><div></div><button>See more</button></div></div></app-product-specification>
+  <div id="ngb-nav-0-panel">
+    <div class="full-specifications__specifications-single-card__sub-list"><h4>Screen Size</h4><p>64.5"</p></div>
+    <div class="full-specifications__specifications-single-card__sub-list"><h4>Refresh Rate</h4><p>120Hz</p></div>
+    <div class="full-specifications__specifications-single-card__sub-list"><h4>HDMI 2.1</h4></div>
+    <div class="full-specifications__specifications-single-card__sub-list"><span>4K 120</span></div>
+  </div>
+</div></app-product-details-page></div></body></html>
+"""
+
+
+class FakeBrowser(StaticPage):
+    """
+    StaticPage that also scrolls and clicks: profiles run as parse(page_source), scrollTo(0, 0) resets the scroll,
+    PAGE_DOWN and move_element_to_center move it. spec_scrolls: scroll position whenever the spec tab is looked up.
+    """
+
+    def __init__(self, profiles, spec_scrolls):
+        StaticPage.__init__(self, HTML, URL)
+        self.profiles = profiles
+        self.spec_scrolls = spec_scrolls
+        self.scroll = 0
+        self.session_id = None
+
+    def find_element(self, by, value):
+        if value == '//*[@id="PDPSpecificationsLink"]':
+            self.spec_scrolls.append(self.scroll)
+        return StaticPage.find_element(self, by, value)
+
+    def execute_script(self, script, *args):
+        if "scrollTo(0, 0)" in script:
+            self.scroll = 0
+        for profile in self.profiles:
+            if script == profile.script:
+                return profile.parse(self.page_source)
+        return None
+
+    def execute(self, command, params=None):  # ActionChains: PAGE_DOWN
+        self.scroll += 800
+        return {"value": None}
+
+
+class VirtualBrowser(FakeBrowser):
+    """
+    Spec list rendered like a virtualized list: only the card at the current PAGE_DOWN count is in the DOM.
+    """
+
+    CARDS = ['<div class="full-specifications__specifications-single-card__sub-list"><h4>%s</h4><p>%s</p></div>' % pair
+             for pair in [("Screen Size", '64.5"'), ("Refresh Rate", "120Hz"), ("HDR", "Dolby Vision"), ("Weight", "39.5 lb")]]
+
+    def __init__(self, profiles, spec_scrolls):
+        self.pages = 0
+        FakeBrowser.__init__(self, profiles, spec_scrolls)
+        self.panel = HTML[HTML.index('<div id="ngb-nav-0-panel">'):HTML.index("</div></app-product-details-page>")]
+
+    @property
+    def page_source(self):
+        card = self.CARDS[min(self.pages, len(self.CARDS) - 1)]
+        return self._html.replace(self.panel, f'<div id="ngb-nav-0-panel">{card}</div>\n')
+
+    @page_source.setter
+    def page_source(self, html):
+        self._html = html
+
+    def execute(self, command, params=None):
+        self.pages += 1
+        return FakeBrowser.execute(self, command, params)
+
+
+@pytest.fixture(params=[ModelScraper_s, ModelScraper_s_g])
+def sony(request, tmp_path, monkeypatch):
+    monkeypatch.setattr(StaticElement, "click", lambda element: None, raising=False)
+    scraper = request.param(intput_folder_path=str(tmp_path / "input"), output_folder_path=None)
+    scraper.visits = []
+    scraper.spec_scrolls = []
+
+    def open_browser(url, *args, **kwargs):
+        driver = FakeBrowser([scraper.feature_profile, scraper.spec_profile], scraper.spec_scrolls)
+        scraper.visits.append(driver)
+        return driver
+
+    def move_element_to_center(element):
+        element._page.scroll += 1500
+
+    scraper.set_driver = open_browser
+    scraper.open_page = open_browser
+    scraper.release_driver = lambda driver: None
+    scraper.wait = lambda driver, *args, **kwargs: True
+    scraper.remove_popup = lambda driver: None
+    scraper.web_driver = SimpleNamespace(move_element_to_center=move_element_to_center, headless=True)
+    return scraper
+
+
+def test_single_visit_row_equals_two_visit_row(sony):
+    '''한 번 방문해 만든 행이 예전처럼 상세/스펙을 따로 방문해 만든 행과 같다'''
+    two_visits = sony._extract_model_details(URL)
+    two_visits.update(sony._extract_global_specs(url=URL))
+    two_visits["url"] = URL
+    assert len(sony.visits) == 3
+    single_visit = sony._extract_product(URL)
+    assert len(sony.visits) == 4
+    assert single_visit == two_visits
+    assert single_visit["Refresh Rate"] == "120Hz" and single_visit["HDMI 2.1"] == ""
+    assert single_visit["text0"] == "xr oled contrast pro"
+    assert single_visit["Parser error"] == "Parser error"  # h4 가 없는 카드도 예전처럼 행을 남긴다
+
+
+def test_spec_tab_pass_starts_from_the_top(sony):
+    '''같은 세션에서도 스펙 탭은 새로 연 페이지처럼 맨 위에서 찾는다'''
+    sony._extract_product(URL)
+    driver, = sony.visits
+    assert driver.scroll > 0
+    assert sony.spec_scrolls == [0]
+
+
+@pytest.mark.parametrize("snapshot_mode", [True, False])
+def test_every_card_of_a_virtualized_spec_list_is_kept(sony, snapshot_mode):
+    '''스크롤하면 앞의 카드가 DOM 에서 빠지는 목록도 단계마다 읽어 모든 카드를 남긴다'''
+    sony.snapshot_mode = snapshot_mode
+    sony.set_driver = lambda url, *args, **kwargs: VirtualBrowser([sony.feature_profile, sony.spec_profile], sony.spec_scrolls)
+    specs = sony._extract_global_specs(url=URL)
+    assert [specs[label] for label in ("Screen Size", "Refresh Rate", "HDR", "Weight")] == ['64.5"', "120Hz", "Dolby Vision", "39.5 lb"]
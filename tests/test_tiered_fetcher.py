@@ -0,0 +1,100 @@
+import pytest
+import requests
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+from market_research.scraper._tiered_fetcher import StaticPage, TierMemory
+from market_research.scraper.models.specs.spec_s import ModelScraper_s
+
+URL = "https://electronics.sony.com/tv-video/televisions/all-tvs/p/xr65a95l"
+PDP = """<html><head><title> BRAVIA XR A95L </title></head><body>
+<div class="product-info" id="pdp">
+  <h1 name="model">XR65A95L</h1>
+  <a href="/tv-video/televisions/all-tvs/p/xr77a95l">77"</a>
+  <ul class="specs"><li>Screen Size <b>65"</b></li><li>Refresh Rate <b>120Hz</b></li></ul>
+</div></body></html>"""
+
+
+@pytest.fixture
+def page():
+    return StaticPage(PDP, URL)
+
+
+def test_css_locators(page):
+    assert page.title == "BRAVIA XR A95L"
+    assert page.find_element(By.CLASS_NAME, "product-info").get_attribute("id") == "pdp"
+    assert page.find_element(By.ID, "pdp").find_element(By.TAG_NAME, "h1").text == "XR65A95L"
+    assert page.find_element(By.NAME, "model").text == "XR65A95L"
+    assert [li.text for li in page.find_elements(By.CSS_SELECTOR, "ul.specs li")] == ['Screen Size 65"', "Refresh Rate 120Hz"]
+    assert page.find_element(By.TAG_NAME, "a").get_attribute("href") == "https://electronics.sony.com/tv-video/televisions/all-tvs/p/xr77a95l"
+    assert page.execute_script("window.scrollTo(0, 1000)") is None
+    with pytest.raises(NoSuchElementException):
+        page.find_element(By.CLASS_NAME, "spec-table")
+
+
+def test_xpath_locators_and_mixing(page):
+    items = page.find_elements(By.XPATH, '//ul[@class="specs"]/li')
+    assert [item.find_element(By.TAG_NAME, "b").text for item in items] == ['65"', "120Hz"]
+    box = page.find_element(By.CLASS_NAME, "specs")
+    assert box.find_element(By.XPATH, ".//li[2]/b").get_attribute("innerHTML") == "120Hz"
+    assert items[0].get_attribute("outerHTML").startswith("<li>")
+
+
+def test_has_checks_every_locator(page):
+    assert page.has([(By.CLASS_NAME, "product-info"), (By.XPATH, "//h1")])
+    assert not page.has([(By.CLASS_NAME, "product-info"), (By.CLASS_NAME, "spec-table")])
+    assert not page.has([(By.LINK_TEXT, "77\"")])  # 지원하지 않는 로케이터는 검증 실패로 본다
+    assert page.has([])
+
+
+def test_pattern_groups_model_pages():
+    assert TierMemory.pattern(URL) == "electronics.sony.com/tv-video/televisions/all-tvs/p/*"
+    assert TierMemory.pattern("https://www.LG.com/us/tvs/2024/lg-oled65c4pua") == "www.lg.com/us/tvs/*/*"
+
+
+def test_failed_pattern_goes_to_the_browser_and_is_reprobed(tmp_path):
+    '''http 로 실패한 패턴은 브라우저로 바로 가고 reprobe 번째 방문에만 다시 http 를 시도한다'''
+    memory = TierMemory(tmp_path / "tiers.json", reprobe=3)
+    assert memory.tier(URL) == "http"
+    memory.record(URL, http_ok=False)
+    assert [memory.tier(URL) for _ in range(4)] == ["browser", "http", "browser", "browser"]
+    memory.record(URL, http_ok=True)
+    assert memory.tier(URL + "-2") == "http"
+    memory.save()
+    assert TierMemory(tmp_path / "tiers.json").report() == {"electronics.sony.com/tv-video/televisions/all-tvs/p/*": "http"}
+
+
+def test_broken_memory_file_is_ignored(tmp_path):
+    (tmp_path / "tiers.json").write_text("{", encoding="utf-8")
+    assert TierMemory(tmp_path / "tiers.json").patterns == {}
+
+
+@pytest.fixture
+def sony(tmp_path):
+    scraper = ModelScraper_s(intput_folder_path=str(tmp_path / "input"), output_folder_path=None)
+    scraper.gets, scraper.visits = [], []
+    scraper.html = PDP
+
+    def http_get(url, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response.encoding = "utf-8"
+        response._content = scraper.html.encode("utf-8")
+        scraper.gets.append(url)
+        return response
+
+    scraper.http_get = http_get
+    scraper.set_driver = lambda url, stage=None: scraper.visits.append(url) or "browser"
+    return scraper
+
+
+def test_open_page_prefers_a_valid_static_page(sony):
+    page = sony.open_page(URL, required=[(By.CLASS_NAME, "product-info")])
+    assert isinstance(page, StaticPage) and sony.visits == []
+
+
+def test_open_page_escalates_and_remembers(sony):
+    required = [(By.CLASS_NAME, "spec-table")]  # 스크립트로 그려지는 블록
+    assert sony.open_page(URL, required=required) == "browser"
+    assert sony.open_page(URL, required=required) == "browser"
+    assert sony.gets == [URL] and sony.visits == [URL, URL]
+    assert sony.tier_memory.report() == {TierMemory.pattern(URL): "browser"}
@@ -0,0 +1,51 @@
+from market_research.scraper._url_frontier import UrlFrontier
+
+SERIES = ["https://www.sony.com/tv/xr65a95l#specs", "https://www.sony.com/tv/xr65a95l?utm_source=grid",
+          "HTTPS://WWW.SONY.COM/tv/xr77a80l/", "https://www.sony.com/tv/kd55x85k"]
+
+
+def test_first_spelling_of_each_page_is_visited(tmp_path):
+    frontier = UrlFrontier(tmp_path / "frontier.json")
+    frontier.begin_run()
+    assert frontier.add_all(SERIES) == 3
+    assert not frontier.add("https://www.sony.com/tv/kd55x85k/?gclid=1")
+    assert not frontier.add("")
+    assert sorted(frontier.url_dict().values()) == ["HTTPS://WWW.SONY.COM/tv/xr77a80l/",
+                                                    "https://www.sony.com/tv/kd55x85k", "https://www.sony.com/tv/xr65a95l"]
+
+
+def test_dedupe_keeps_the_first_spelling():
+    assert UrlFrontier.dedupe(SERIES) == [SERIES[0], SERIES[2], SERIES[3]]
+
+
+def test_new_urls_come_first_in_the_next_run(tmp_path):
+    '''저장된 상태로 다음 실행을 시작하면 처음 보는 url 부터, 그다음 오래전에 방문한 url 순서'''
+    path = tmp_path / "frontier.json"
+    frontier = UrlFrontier(path)
+    frontier.begin_run()
+    frontier.add_all(["https://www.sony.com/tv/a", "https://www.sony.com/tv/b"])
+    frontier.mark_visited(["https://www.sony.com/tv/a/"])
+    frontier.save()
+
+    resumed = UrlFrontier(path)
+    resumed.begin_run()
+    resumed.add_all(["https://www.sony.com/tv/a", "https://www.sony.com/tv/c", "https://www.sony.com/tv/b"])
+    assert list(resumed.url_dict().values()) == ["https://www.sony.com/tv/b", "https://www.sony.com/tv/c",
+                                                 "https://www.sony.com/tv/a"]
+    assert resumed.last_run() == {"https://www.sony.com/tv/a"}
+
+
+def test_last_run_is_the_latest_visit_day():
+    frontier = UrlFrontier()
+    assert frontier.last_run() == set()
+    frontier.seen = {"https://www.lg.com/us/tvs/a": {"url": "", "first_seen": "", "last_visited": "2024-10-01T09:00:00"},
+                     "https://www.lg.com/us/tvs/b": {"url": "", "first_seen": "", "last_visited": "2024-10-08T09:00:00"},
+                     "https://www.lg.com/us/tvs/c": {"url": "", "first_seen": "", "last_visited": "2024-10-08T23:10:00"},
+                     "https://www.lg.com/us/tvs/d": {"url": "", "first_seen": "", "last_visited": None}}
+    assert frontier.last_run() == {"https://www.lg.com/us/tvs/b", "https://www.lg.com/us/tvs/c"}
+
+
+def test_broken_state_file_is_ignored(tmp_path):
+    path = tmp_path / "frontier.json"
+    path.write_text('{"https://www.lg.com/us/tvs/a": {', encoding="utf-8")
+    assert UrlFrontier(path).seen == {}
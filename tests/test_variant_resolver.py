@@ -0,0 +1,73 @@
+import json
+import pytest
+import requests
+from market_research.scraper._variant_resolver import VariantResolver
+from market_research.scraper.models.specs.spec_se import ModelScraper_se
+
+BASE = "https://www.samsung.com/us/televisions-home-theater/tvs/oled-tvs/"
+URL = BASE + "65-class-oled-s90d-qn65s90dafxza/"
+SIZES = [{"size": f'{size}"', "link": {"href": f"/us/televisions-home-theater/tvs/oled-tvs/{size}-class-oled-s90d-qn{size}s90dafxza/"}}
+         for size in (55, 65, 77)]
+RELATED = [{"name": "Neo QLED QN90D", "url": BASE.replace("oled-tvs", "qled-4k-tvs") + "65-class-qn90d-qn65qn90dafxza/"}]
+NEXT_DATA = {"props": {"pageProps": {"recommended": RELATED, "product": {"sizes": SIZES, "reviews": [{"rating": 5}]}}}}
+
+
+def pdp(*scripts: str) -> str:
+    return "<html><body>" + "".join(scripts) + "</body></html>"
+
+
+@pytest.fixture
+def resolver():
+    return VariantResolver(ModelScraper_se.sitemap.include.pattern)
+
+
+def test_variants_come_from_the_list_containing_the_page(resolver):
+    '''추천 상품 목록은 건너뛰고 자기 자신이 들어 있는 사이즈 목록만 쓴다'''
+    html = pdp('<script type="application/json">{"broken": </script>',
+               f'<script id="__NEXT_DATA__" type="application/json">{json.dumps(NEXT_DATA)}</script>')
+    assert resolver.resolve(html, URL) == [f"{BASE}{size}-class-oled-s90d-qn{size}s90dafxza/" for size in (55, 65, 77)]
+
+
+def test_schema_org_product_group(resolver):
+    group = {"@type": "ProductGroup", "hasVariant": [{"@type": "Product", "url": URL + "?size=65"},
+                                                     {"@type": "Product", "url": BASE + "77-class-oled-s90d-qn77s90dafxza/"},
+                                                     {"@type": "Product", "url": URL}]}
+    html = pdp(f'<script type="application/ld+json">{json.dumps(group)}</script>')
+    assert resolver.resolve(html, URL.rstrip("/").upper()) == [URL + "?size=65", BASE + "77-class-oled-s90d-qn77s90dafxza/", URL]
+
+
+def test_page_without_its_own_variant_list(resolver):
+    html = pdp(f'<script type="application/json">{json.dumps({"recommended": RELATED})}</script>')
+    assert resolver.resolve(html, URL) == []
+    assert resolver.resolve("<html></html>", URL) == []
+
+
+@pytest.fixture
+def samsung(tmp_path):
+    scraper = ModelScraper_se(intput_folder_path=str(tmp_path / "input"), output_folder_path=None)
+    scraper.retry_policy.base_delay = 0
+    scraper.visits = []
+    scraper.html = pdp(f'<script id="__NEXT_DATA__" type="application/json">{json.dumps(NEXT_DATA)}</script>')
+
+    def http_get(url, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response.encoding = "utf-8"
+        response._content = scraper.html.encode("utf-8")
+        return response
+
+    scraper.http_get = http_get
+    scraper.set_driver = lambda url, stage=None: scraper.visits.append(url) or None
+    scraper.release_driver = lambda driver: None
+    return scraper
+
+
+def test_series_models_resolved_without_clicking_size_tiles(samsung):
+    assert len(samsung._extract_models_from_series(URL)) == 3
+    assert samsung.visits == []
+
+
+def test_series_without_state_json_falls_back_to_the_browser(samsung):
+    samsung.html = pdp()
+    samsung._extract_models_from_series(URL)
+    assert samsung.visits == [URL]
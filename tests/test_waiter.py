@@ -0,0 +1,106 @@
+import pytest
+from selenium.webdriver.common.by import By
+from market_research.scraper import _waiter
+from market_research.scraper._tiered_fetcher import StaticPage
+from market_research.scraper._waiter import Waiter
+
+
+class Clock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(_waiter, "time", clock)
+    return clock
+
+
+class Page:
+    """
+    Answers the waiter's scripts from a timeline: DOM mutations, resource entries and the time the load event fires.
+    """
+
+    def __init__(self, clock, mutations=(), resources=(), complete_at=0.0):
+        self.clock = clock
+        self.mutations = list(mutations)
+        self.resources = list(resources)
+        self.complete_at = complete_at
+        self.armed_at = None
+
+    def execute_script(self, script, *args):
+        now = self.clock.now
+        if script == Waiter._DOM_QUIET_JS:
+            if args[0]:
+                self.armed_at = now
+            last = max([self.armed_at] + [t for t in self.mutations if t <= now])
+            return (now - last) * 1000
+        if script == Waiter._NETWORK_JS:
+            return ["complete" if now >= self.complete_at else "interactive", len([t for t in self.resources if t <= now])]
+        raise AssertionError(script)
+
+
+@pytest.fixture
+def waiter():
+    return Waiter(poll=0.125, quiet=0.25)  # 2 진수로 정확한 값이라 가짜 시계가 딱 맞아떨어진다
+
+
+def test_dom_quiet_after_the_last_mutation(waiter, clock):
+    page = Page(clock, mutations=[0.25, 0.5])
+    assert waiter.for_dom_quiet(page, timeout=5)
+    assert clock.now == 0.75
+    assert (waiter.waits, waiter.timeouts, waiter.fixed, waiter.saved) == (1, 0, 5, 4.25)
+
+
+def test_dom_that_keeps_mutating_times_out(waiter, clock):
+    '''MutationObserver 가 계속 변경을 보는 페이지(캐러셀 등)는 상한에서 멈춘다'''
+    page = Page(clock, mutations=[i / 8 for i in range(100)])
+    assert not waiter.for_dom_quiet(page, timeout=2)
+    assert clock.now == 2
+    assert waiter.report()["timeouts"] == 1 and waiter.saved == pytest.approx(0)
+
+
+def test_network_idle_waits_for_load_and_a_quiet_resource_count(waiter, clock):
+    page = Page(clock, resources=[0, 0.125, 0.25, 0.375, 0.5], complete_at=0.25)
+    assert waiter.for_network_idle(page, timeout=5)
+    # load 이후에도 0.5 초의 마지막 요청 뒤로 quiet 만큼 요청 수가 그대로여야 한다
+    assert clock.now == 0.75
+
+
+def test_network_idle_needs_the_load_event(waiter, clock):
+    page = Page(clock, resources=[0.0], complete_at=10)
+    assert not waiter.for_network_idle(page, timeout=1, fixed=3)
+    assert clock.now == 1
+    assert waiter.report()["fixed_sleep_sec"] == 3.0
+
+
+def test_network_that_keeps_requesting_times_out(waiter, clock):
+    page = Page(clock, resources=[i / 8 for i in range(100)])
+    assert not waiter.for_network_idle(page, timeout=1.5)
+    assert waiter.timeouts == 1
+
+
+def test_script_errors_end_the_wait(waiter, clock):
+    class Navigating:
+        def execute_script(self, script, *args):
+            raise RuntimeError("javascript error: document unloaded while waiting for result")
+
+    assert not waiter.for_dom_quiet(Navigating(), timeout=5)
+    assert not waiter.for_network_idle(Navigating(), timeout=5)
+    assert clock.now == 0
+
+
+def test_for_element():
+    waiter = Waiter(poll=0.01)
+    page = StaticPage('<html><body><div class="product-info">OLED65C4PUA</div></body></html>', "https://www.lg.com/us")
+    assert waiter.for_element(page, (By.CLASS_NAME, "product-info"), timeout=1)
+    assert not waiter.for_element(page, (By.CLASS_NAME, "spec-table"), timeout=0.05)
+    assert waiter.waits == 2 and waiter.timeouts == 1
@@ -0,0 +1,95 @@
+import os
+import threading
+from types import SimpleNamespace
+import pytest
+from market_research.scraper._driver_pool import DriverPool
+from market_research.scraper._watchdog import DriverWatchdog
+
+
+class Session:
+    """
+    Remote-like session (no chromedriver process); hang=True: execute_script blocks until released.
+    """
+
+    def __init__(self, hang: bool = False):
+        self.session_id = f"session-{id(self)}"
+        self.hang = hang
+        self.released = threading.Event()
+        self.scripts = 0
+        self.quit_called = False
+        self.window_handles = ["main"]
+        self.switch_to = SimpleNamespace(window=lambda handle: None)
+
+    def get(self, url):
+        pass
+
+    def delete_all_cookies(self):
+        pass
+
+    def execute_script(self, script, *args):
+        self.scripts += 1
+        if self.hang:
+            self.released.wait(5)
+        return 1 if script == "return 1;" else 0
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture
+def pool():
+    sessions = []
+    web_driver = SimpleNamespace(driver=None, get_chrome=lambda: sessions.pop(0))
+    pool = DriverPool(web_driver)
+    pool.sessions_to_launch = sessions
+    yield pool
+    for session in pool.sessions():
+        session.released.set()
+
+
+def test_leased_session_in_a_slow_command_is_not_pinged(pool):
+    '''페이지를 읽는 중인 세션은 핑 때문에 죽이지 않는다'''
+    busy = Session(hang=True)
+    pool.sessions_to_launch.append(busy)
+    driver = pool.lease()
+    watchdog = DriverWatchdog(pool, max_latency=0.05)
+    assert watchdog.check(driver, busy=pool.leased(driver)) == ""
+    assert busy.scripts == 0
+
+
+def test_idle_session_that_does_not_answer_is_reported(pool):
+    hung = Session(hang=True)
+    watchdog = DriverWatchdog(pool, max_latency=0.05)
+    assert watchdog.check(hung) == "no response within 0.05s"
+    hung.released.set()
+
+
+def test_session_leased_while_pinged_is_left_alone(pool):
+    hung = Session()
+    pool.sessions_to_launch.append(hung)
+    pool.release(pool.lease())  # 반납되어 idle
+    hung.hang = True
+    watchdog = DriverWatchdog(pool, max_latency=0.05)
+    timer = threading.Timer(0.01, pool.lease)
+    timer.start()
+    assert watchdog.check(hung) == ""
+    timer.join()
+
+
+def test_busy_local_session_is_still_checked_for_memory(pool, monkeypatch):
+    watchdog = DriverWatchdog(pool, max_rss_mb=0.001)
+    monkeypatch.setattr(DriverWatchdog, "_session_pids", staticmethod(lambda driver: [os.getpid()]))
+    session = Session(hang=True)
+    assert watchdog.check(session, busy=True).endswith("exceeds 0.001 MB")
+    assert session.scripts == 0
+    assert watchdog.samples[session.session_id]["latency"] is None
+
+
+def test_kill_evicts_the_session_and_marks_the_worker(pool):
+    session = Session()
+    pool.sessions_to_launch.append(session)
+    driver = pool.lease()
+    watchdog = DriverWatchdog(pool)
+    watchdog._kill(driver, "test")
+    assert pool.sessions() == [] and watchdog.kills == 1
+    assert pool.take_recycled() and not pool.take_recycled()
@@ -0,0 +1,119 @@
+import pytest
+from market_research.scraper import _work_queue
+from market_research.scraper._work_queue import WorkQueue
+from market_research.scraper.models.specs.spec_l import ModelScraper_l
+
+URLS = {"OLED55": "https://www.lg.com/us/tvs/oled55", "OLED65": "https://www.lg.com/us/tvs/oled65"}
+
+
+class Clock:
+
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(_work_queue, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def queue(tmp_path, clock):
+    queue = WorkQueue(tmp_path / "queue.db", lease_seconds=60, max_attempts=2)
+    queue.publish("lg:run1", "Specscraper_l", URLS)
+    return queue
+
+
+def test_publish_is_idempotent(queue):
+    assert queue.publish("lg:run1", "Specscraper_l", URLS) == 0
+    assert queue.progress("lg:run1") == {"pending": 2, "leased": 0, "done": 0, "failed": 0}
+
+
+def test_republished_job_is_scraped_again(queue):
+    '''같은 job 을 다시 올리면 끝난 url 은 다시 대기열로, 진행 중인 url 은 그대로'''
+    task_id, url = queue.lease("Specscraper_l", "worker-a")
+    queue.complete(task_id, "worker-a", {"model": "OLED55"})
+    queue.lease("Specscraper_l", "worker-b")
+    assert queue.publish("lg:run1", "Specscraper_l", URLS) == 1
+    assert queue.progress("lg:run1") == {"pending": 1, "leased": 1, "done": 0, "failed": 0}
+    assert queue.lease("Specscraper_l", "worker-c") == (task_id, url)
+    rows, failed = queue.results("lg:run1")
+    assert rows[url] == {}
+
+
+def test_leased_task_is_not_handed_out_twice(queue):
+    first = queue.lease("Specscraper_l", "worker-a")
+    second = queue.lease("Specscraper_l", "worker-b")
+    assert first[1] == URLS["OLED55"] and second[1] == URLS["OLED65"]
+    assert queue.lease("Specscraper_l", "worker-c") is None
+
+
+def test_expired_lease_goes_to_the_next_worker(queue, clock):
+    task_id, url = queue.lease("Specscraper_l", "worker-a")
+    queue.lease("Specscraper_l", "worker-a")
+    clock.now += 61  # worker-a 가 하트비트 없이 죽음
+    assert queue.lease("Specscraper_l", "worker-b") == (task_id, url)
+    # 만료된 리스의 결과는 더 이상 받지 않는다
+    queue.complete(task_id, "worker-a", {"model": "stale"})
+    queue.complete(task_id, "worker-b", {"model": "OLED55"})
+    rows, failed = queue.results("lg:run1")
+    assert rows[url] == {"model": "OLED55"}
+
+
+def test_heartbeat_keeps_the_lease(queue, clock):
+    task_id, url = queue.lease("Specscraper_l", "worker-a")
+    queue.lease("Specscraper_l", "worker-a")
+    clock.now += 50
+    assert queue.heartbeat(task_id, "worker-a")
+    clock.now += 50
+    assert queue.lease("Specscraper_l", "worker-b") != (task_id, url)
+    assert not queue.heartbeat(task_id, "worker-b")
+
+
+def test_lease_expires_into_failure_after_max_attempts(queue, clock):
+    for worker in ("worker-a", "worker-b"):
+        assert queue.lease("Specscraper_l", worker) is not None
+        assert queue.lease("Specscraper_l", worker) is not None
+        clock.now += 61
+    assert queue.lease("Specscraper_l", "worker-c") is None
+    assert queue.progress("lg:run1") == {"pending": 0, "leased": 0, "done": 0, "failed": 2}
+    rows, failed = queue.results("lg:run1")
+    assert failed == {url: "lease expired" for url in URLS.values()}
+
+
+def test_failed_task_is_retried_until_max_attempts(queue):
+    task_id, url = queue.lease("Specscraper_l", "worker-a")
+    queue.fail(task_id, "worker-a", "TimeoutError: slow")
+    assert queue.progress("lg:run1")["pending"] == 2
+    assert queue.lease("Specscraper_l", "worker-b") == (task_id, url)
+    queue.fail(task_id, "worker-b", "TimeoutError: slow")
+    assert queue.progress("lg:run1")["failed"] == 1
+
+
+def test_lease_filters_by_job(queue):
+    queue.publish("lg:run2", "Specscraper_l", {"OLED77": "https://www.lg.com/us/tvs/oled77"})
+    assert queue.lease("Specscraper_l", "worker-a", job="lg:run2")[1] == "https://www.lg.com/us/tvs/oled77"
+    assert queue.lease("Specscraper_l", "worker-a", job="lg:run2") is None
+    assert queue.lease("Specscraper_l", "worker-a", job="lg:run1")[1] == URLS["OLED55"]
+    assert queue.lease("Sony", "worker-a") is None
+
+
+def test_coordinator_runs_without_an_output_folder(tmp_path, clock):
+    '''output_folder_path=None 이어도 분산 실행과 실행 보고가 끝까지 돈다'''
+    scraper = ModelScraper_l(intput_folder_path=str(tmp_path / "input"), output_folder_path=None)
+    scraper.work_queue = WorkQueue(tmp_path / "queue.db")
+    scraper._extract_row = lambda url, row: row.update(model=url.rsplit("/", 1)[-1].upper(), price=1499.99)
+    rows = scraper.extract_rows(URLS, scraper._extract_row)
+    assert rows == {"OLED55": {"model": "OLED55", "price": 1499.99}, "OLED65": {"model": "OLED65", "price": 1499.99}}
+    assert [row["model"] for row in scraper.checkpoint.rows(URLS.values())] == ["OLED55", "OLED65"]
+    report = scraper.report_run()
+    assert report["counters"]["failures"] == 0
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["input", "queue.db"]